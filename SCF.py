@@ -1,15 +1,16 @@
 from docplex.mp.model import Model as Model_cpx
 from gurobipy import Model as Model_grb, GRB, quicksum
-from testParser import parse_file
-import time
+from arcos import pares, vecindad
 
 
-def modelo_scf_cplex(parsed_data):
+def modelo_scf_cplex(parsed_data, arcos=None):
     """
     Implementación del modelo SCF (Single Commodity Flow) usando CPLEX.
 
     Parámetros:
         parsed_data (dict): Diccionario con los datos parseados.
+        arcos (ndarray): Conjunto de arcos de arcos.arcos_knn; si es None se usan todos los pares
+            de nodos, como en la formulación original.
 
     Retorna:
         Model: Modelo de CPLEX con el problema SCF formulado.
@@ -28,18 +29,19 @@ def modelo_scf_cplex(parsed_data):
     # Crear el modelo
     mdl = Model_cpx(name="SCF")
 
-    # Nodos totales (depósitos + clientes)
-    nodos = list(range(m + n))
+    # Arcos del modelo y vecindad de cada nodo
+    A = pares(arcos, m + n, diagonal=arcos is None)
+    sucesores, predecesores = vecindad(A, m + n)
 
     # Variables
-    x = mdl.binary_var_matrix(nodos, nodos, name="x")  # Ruta entre nodos
-    f = mdl.continuous_var_matrix(nodos, nodos, name="f")  # Flujo de producto
+    x = mdl.binary_var_dict(A, name="x")  # Ruta entre nodos
+    f = mdl.continuous_var_dict(A, name="f")  # Flujo de producto
     fd = mdl.continuous_var_matrix(range(m), range(n), name="fd")  # Flujo de depósitos
     y = mdl.binary_var_list(m, name="y")  # Uso de depósitos
 
     # Función objetivo: minimizar costos de transporte, apertura y uso de rutas
     mdl.minimize(
-        mdl.sum(costs[i][j] * x[i, j] for i in nodos for j in nodos if i != j) +  # Costos de transporte
+        mdl.sum(costs[i][j] * x[i, j] for i, j in A if i != j) +  # Costos de transporte
         mdl.sum(opening_costs_depots[d] * y[d] for d in range(m)) +  # Costos de apertura de depósitos
         opening_cost_route * mdl.sum(y[d] for d in range(m))  # Costos de rutas
     )
@@ -47,40 +49,40 @@ def modelo_scf_cplex(parsed_data):
     # Restricciones
     # 1. Cada cliente es atendido exactamente una vez
     for i in range(m, m + n):
-        mdl.add_constraint(mdl.sum(x[i, j] for j in nodos if j != i) == 1)  # Salen
-        mdl.add_constraint(mdl.sum(x[j, i] for j in nodos if j != i) == 1)  # Entran
+        mdl.add_constraint(mdl.sum(x[i, j] for j in sucesores[i]) == 1)  # Salen
+        mdl.add_constraint(mdl.sum(x[j, i] for j in predecesores[i]) == 1)  # Entran
 
     # 2. Las rutas deben comenzar y terminar en depósitos abiertos
     for d in range(m):
-        mdl.add_constraint(mdl.sum(x[d, j] for j in range(m, m + n)) <= y[d])
-        mdl.add_constraint(mdl.sum(x[j, d] for j in range(m, m + n)) <= y[d])
+        mdl.add_constraint(mdl.sum(x[d, j] for j in sucesores[d] if j >= m) <= y[d])
+        mdl.add_constraint(mdl.sum(x[j, d] for j in predecesores[d] if j >= m) <= y[d])
 
     # 3. Restricciones de flujo para garantizar balance
     for i in range(m, m + n):  # Para cada cliente
         mdl.add_constraint(
-            mdl.sum(f[i, j] for j in nodos if j != i) -
-            mdl.sum(f[j, i] for j in nodos if j != i) == customer_demands[i - m]
+            mdl.sum(f[i, j] for j in sucesores[i]) -
+            mdl.sum(f[j, i] for j in predecesores[i]) == customer_demands[i - m]
         )
-    for i, j in [(i, j) for i in nodos for j in nodos if i != j]:
+    for i, j in [(i, j) for i, j in A if i != j]:
         mdl.add_constraint(f[i, j] <= vehicle_capacity * x[i, j])  # Flujo limitado por capacidad del vehículo
 
     # 4. Capacidad máxima de los depósitos
     for d in range(m):
         mdl.add_constraint(
-            mdl.sum(f[d, j] for j in range(m, m + n)) <= depot_capacities[d]
+            mdl.sum(f[d, j] for j in sucesores[d] if j >= m) <= depot_capacities[d]
         )
 
-    for i, j in [(i, j) for i in range(m, m + n) for j in range(m, m + n) if i != j]:
+    for i, j in [(i, j) for i, j in A if i >= m and j >= m and i != j]:
         mdl.add_constraint(x[i, j] == 0, f"no_subtour_clientes_{i}_{j}")
 
     for d in range(m):
         mdl.add_constraint(
-            mdl.sum(x[d, j] for j in range(m, m + n)) >= y[d], f"depot_serve_customer_{d}"
+            mdl.sum(x[d, j] for j in sucesores[d] if j >= m) >= y[d], f"depot_serve_customer_{d}"
         )
 
     for d in range(m):
         mdl.add_constraint(
-            mdl.sum(f[d, j] for j in range(m, m + n)) <= depot_capacities[d], f"capacidad_deposito_{d}"
+            mdl.sum(f[d, j] for j in sucesores[d] if j >= m) <= depot_capacities[d], f"capacidad_deposito_{d}"
         )
 
     for d in range(m):
@@ -92,6 +94,105 @@ def modelo_scf_cplex(parsed_data):
     return mdl
 
 
+def modelo_scf_gurobi(parsed_data, arcos=None):
+    """
+    Implementación del modelo SCF (Single Commodity Flow) usando Gurobi.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        arcos (ndarray): Conjunto de arcos de arcos.arcos_knn; si es None se usan todos los pares
+            de nodos, como en la formulación original.
+
+    Retorna:
+        Model: Modelo de Gurobi con el problema SCF formulado.
+    """
+    n = parsed_data["num_customers"]
+    m = parsed_data["num_depots"]
+    depots = parsed_data["depots"]
+    customers = parsed_data["customers"]
+    vehicle_capacity = parsed_data["vehicle_capacity"]
+    depot_capacities = parsed_data["depot_capacities"]
+    customer_demands = parsed_data["customer_demands"]
+    opening_costs_depots = parsed_data["depot_opening_costs"]
+    opening_cost_route = parsed_data["route_opening_cost"]
+    costs = parsed_data["distance_matrix"]
+
+    # Crear el modelo
+    mdl = Model_grb("SCF")
+
+    # Arcos del modelo y vecindad de cada nodo
+    A = pares(arcos, m + n, diagonal=arcos is None)
+    sucesores, predecesores = vecindad(A, m + n)
+
+    # Variables
+    x = mdl.addVars(A, vtype=GRB.BINARY, name="x")  # Ruta entre nodos
+    f = mdl.addVars(A, vtype=GRB.CONTINUOUS, name="f")  # Flujo de producto
+    y = mdl.addVars(m, vtype=GRB.BINARY, name="y")  # Uso de depósitos
+
+    # Función objetivo: minimizar costos de transporte, apertura y uso de rutas
+    mdl.setObjective(
+        quicksum(costs[i][j] * x[i, j] for i, j in A if i != j) +  # Costos de transporte
+        quicksum(opening_costs_depots[d] * y[d] for d in range(m)) +  # Costos de apertura de depósitos
+        opening_cost_route * quicksum(y[d] for d in range(m)),  # Costos de rutas
+        GRB.MINIMIZE
+    )
+
+    # Restricciones
+    # 1. Cada cliente es atendido exactamente una vez
+    for i in range(m, m + n):
+        mdl.addConstr(quicksum(x[i, j] for j in sucesores[i]) == 1)  # Salen
+        mdl.addConstr(quicksum(x[j, i] for j in predecesores[i]) == 1)  # Entran
+
+    # 2. Las rutas deben comenzar y terminar en depósitos abiertos
+    for d in range(m):
+        mdl.addConstr(quicksum(x[d, j] for j in sucesores[d] if j >= m) <= y[d])
+        mdl.addConstr(quicksum(x[j, d] for j in predecesores[d] if j >= m) <= y[d])
+
+    # 3. Restricciones de flujo para garantizar balance
+    for i in range(m, m + n):  # Para cada cliente
+        mdl.addConstr(
+            quicksum(f[i, j] for j in sucesores[i]) -
+            quicksum(f[j, i] for j in predecesores[i]) == customer_demands[i - m]
+        )
+    for i, j in [(i, j) for i, j in A if i != j]:
+        mdl.addConstr(f[i, j] <= vehicle_capacity * x[i, j])  # Flujo limitado por capacidad del vehículo
+
+    # 4. Capacidad máxima de los depósitos
+    for d in range(m):
+        mdl.addConstr(
+            quicksum(f[d, j] for j in sucesores[d] if j >= m) <= depot_capacities[d]
+        )
+
+    return mdl
+
+
+def datos_solver_scf(parsed_data, arcos=None):
+    """
+    Construye el diccionario de datos que usa solver_scf_gurobi a partir de los datos parseados.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        arcos (ndarray): Conjunto de arcos de arcos.arcos_knn; si es None se usan todos los arcos.
+
+    Retorna:
+        dict: Datos con las distancias indexadas por arco (i, j), i != j.
+    """
+    n = parsed_data["num_customers"]
+    m = parsed_data["num_depots"]
+
+    arc_indices = pares(arcos, m + n)
+
+    return {
+        "num_clientes": n,
+        "num_depositos": m,
+        "distancias": {(i, j): parsed_data["distance_matrix"][i][j] for i, j in arc_indices},
+        "cap_deposito": parsed_data["depot_capacities"],
+        "costo_apertura_deposito": parsed_data["depot_opening_costs"],
+        'demanda': parsed_data["customer_demands"],
+        'cap_vehiculo': parsed_data["vehicle_capacity"]
+    }
+
+
 def solver_scf_gurobi(data):
     """
     Implementación del modelo Single Commodity Flow (SCF) usando Gurobi.
@@ -103,7 +204,7 @@ def solver_scf_gurobi(data):
         dict: Resultados del modelo con métricas clave.
     """
     # Crear el modelo
-    mdl = Model("SCF")
+    mdl = Model_grb("SCF")
 
     # Variables
     x = mdl.addVars(data['distancias'], vtype=GRB.BINARY, name="x")  # Ruta entre nodos
@@ -152,7 +253,7 @@ def solver_scf_gurobi(data):
     # 4. No debe haber circuitos con más de un depósito
     for i in range(data['num_depositos']):
         for j in range(data['num_depositos']):
-            if i != j:
+            if i != j and (i, j) in data['distancias']:
                 mdl.addConstr(x[i, j] == 0)
 
     # 5. No debe haber circuitos entre clientes sin pasar por un depósito
@@ -197,43 +298,8 @@ def solver_scf_gurobi(data):
 
 
 if __name__ == "__main__":
-    # Load the parsed data
-    file_path = "Instances/Benchmark_1/coord100-10-3b.dat"
-    parsed_data = parse_file(file_path)
-
-    model = modelo_scf_cplex(parsed_data)
-
-    # Solve the model
-    start_time = time.time()
-    solution = model.solve()
-    end_time = time.time()
-
-    metrics = {
-        "Modelo": model.name,
-        "Instancia": file_path,
-        "Número de Variables": model.number_of_variables,
-        "Número de Restricciones": model.number_of_constraints,
-        "Valor Función Objetivo": model.objective_value if solution is not None else "N/A",
-        "Tiempo de Cómputo (s)": end_time - start_time
-    }
+    from cliente import main
 
-    print(metrics)
+    main(["Instances/Benchmark_1/coord100-10-3b.dat", "--formulacion", "SCF", "--solver", "cplex"])
     print("\n\n------------------------------------\n")
-
-    model = modelo_scf_gurobi(parsed_data)
-
-    # Solve the model
-    start_time = time.time()
-    model.optimize()
-    end_time = time.time()
-
-    metrics = {
-        "Modelo": model.getAttr("ModelName"),
-        "Instancia": file_path,
-        "Número de Variables": len(model.getVars()),
-        "Número de Restricciones": len(model.getConstrs()),
-        "Valor Función Objetivo": model.objVal if model.status == GRB.OPTIMAL else "N/A",
-        "Tiempo de Cómputo (s)": end_time - start_time
-    }
-
-    print(metrics)
+    main(["Instances/Benchmark_1/coord100-10-3b.dat", "--formulacion", "SCF", "--solver", "gurobi"])
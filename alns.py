@@ -0,0 +1,574 @@
+"""
+Búsqueda adaptativa de vecindario grande (ALNS) para el problema de localización-ruteo con
+múltiples depósitos, sin solver MIP.
+
+Parte de la solución de heuristica.construir_solucion y en cada iteración destruye parte de la
+solución (quitando clientes, rutas o depósitos completos) y la repara reinsertando los clientes
+con inserción golosa o por arrepentimiento. Los operadores se eligen por ruleta con pesos que se
+adaptan según su desempeño y los candidatos se aceptan con recocido simulado.
+
+Representación: cada ruta es un arreglo de clientes (índices 0..n-1, nodo m + i) con su depósito,
+su carga y su costo de recorrido; los costos de inserción y remoción se evalúan como deltas
+vectorizados sobre la matriz de distancias, sin recalcular el costo de la solución completa.
+
+Uso (desde la raíz del repositorio):
+    python alns.py --benchmarks B1 --instancias "coord200-10-*.dat" --iteraciones 5000 --salida results.csv
+"""
+import argparse
+import fnmatch
+import glob
+import math
+import os
+import time
+
+import numpy as np
+
+from heuristica import construir_solucion, costo_solucion
+from testParser import parse_file
+
+
+def _preparar(parsed_data):
+    """
+    Arreglos de NumPy con los datos de la instancia que usan los operadores.
+    """
+    return {
+        "n": parsed_data["num_customers"],
+        "m": parsed_data["num_depots"],
+        "C": np.asarray(parsed_data["distance_matrix"], dtype=np.float64),
+        "demanda": np.asarray(parsed_data["customer_demands"], dtype=np.float64),
+        "capacidad": np.asarray(parsed_data["depot_capacities"], dtype=np.float64),
+        "apertura": np.asarray(parsed_data["depot_opening_costs"], dtype=np.float64),
+        "costo_ruta": float(parsed_data["route_opening_cost"]),
+        "Q": float(parsed_data["vehicle_capacity"]),
+    }
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Solución +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def _costo_recorrido(datos, d, ruta):
+    nodos = np.concatenate(([d], ruta + datos["m"], [d]))
+    return float(datos["C"][nodos[:-1], nodos[1:]].sum())
+
+
+def _nueva_solucion(datos, depositos, rutas):
+    """
+    Solución a partir de listas paralelas de depósitos y rutas (arreglos de clientes).
+    """
+    sol = {"deposito": list(depositos), "rutas": list(rutas)}
+    sol["carga"] = [float(datos["demanda"][r].sum()) for r in sol["rutas"]]
+    sol["recorrido"] = [_costo_recorrido(datos, d, r) for d, r in zip(sol["deposito"], sol["rutas"])]
+    sol["carga_deposito"] = np.bincount(np.asarray(sol["deposito"], dtype=np.int64), weights=sol["carga"],
+                                        minlength=datos["m"]).astype(np.float64)
+    return sol
+
+
+def _copiar(sol):
+    # Las rutas nunca se modifican en su lugar, así que basta con copiar las listas
+    return {"deposito": list(sol["deposito"]), "rutas": list(sol["rutas"]), "carga": list(sol["carga"]),
+            "recorrido": list(sol["recorrido"]), "carga_deposito": sol["carga_deposito"].copy()}
+
+
+def _usados(datos, sol):
+    return np.bincount(np.asarray(sol["deposito"], dtype=np.int64), minlength=datos["m"]) > 0
+
+
+def costo(datos, sol):
+    """
+    Costo total: apertura de depósitos con al menos una ruta, apertura de rutas y recorrido.
+    """
+    return (float(datos["apertura"][_usados(datos, sol)].sum()) + datos["costo_ruta"] * len(sol["rutas"])
+            + sum(sol["recorrido"]))
+
+
+def desde_heuristica(datos, solucion):
+    """
+    Convierte una solución de heuristica.construir_solucion a la representación del ALNS.
+    """
+    return _nueva_solucion(datos, [d for d, _ in solucion["rutas"]],
+                           [np.asarray(ruta, dtype=np.int64) for _, ruta in solucion["rutas"]])
+
+
+def a_heuristica(datos, sol):
+    """
+    Convierte una solución del ALNS al formato de heuristica.construir_solucion.
+    """
+    asignacion = np.full(datos["n"], -1, dtype=np.int64)
+    for d, ruta in zip(sol["deposito"], sol["rutas"]):
+        asignacion[ruta] = d
+    return {
+        "depositos": [int(d) for d in np.nonzero(_usados(datos, sol))[0]],
+        "asignacion": asignacion,
+        "rutas": [(int(d), ruta.tolist()) for d, ruta in zip(sol["deposito"], sol["rutas"])],
+        "costo": costo(datos, sol),
+    }
+
+
+def factible(datos, sol):
+    """
+    Verifica que cada cliente se visite exactamente una vez y que se respeten las capacidades de
+    los vehículos y de los depósitos.
+    """
+    visitas = np.bincount(np.concatenate(sol["rutas"]) if sol["rutas"] else np.zeros(0, dtype=np.int64),
+                          minlength=datos["n"])
+    return (visitas.size == datos["n"] and bool(np.all(visitas == 1))
+            and all(carga <= datos["Q"] + 1e-9 for carga in sol["carga"])
+            and bool(np.all(sol["carga_deposito"] <= datos["capacidad"] + 1e-9)))
+
+
+def _quitar(datos, sol, clientes):
+    """
+    Quita clientes de sus rutas (descartando las rutas vacías) y actualiza cargas y recorridos.
+    """
+    quitar = np.zeros(datos["n"], dtype=bool)
+    quitar[clientes] = True
+    for r in range(len(sol["rutas"]) - 1, -1, -1):
+        ruta = sol["rutas"][r]
+        mascara = quitar[ruta]
+        if not mascara.any():
+            continue
+        d = sol["deposito"][r]
+        restante = ruta[~mascara]
+        sol["carga_deposito"][d] -= datos["demanda"][ruta[mascara]].sum()
+        if restante.size == 0:
+            for clave in ("deposito", "rutas", "carga", "recorrido"):
+                del sol[clave][r]
+        else:
+            sol["rutas"][r] = restante
+            sol["carga"][r] = float(datos["demanda"][restante].sum())
+            sol["recorrido"][r] = _costo_recorrido(datos, d, restante)
+    return sol
+
+
+def _delta_remocion(datos, sol):
+    """
+    Ahorro de quitar cada cliente de su ruta: C[ant, c] + C[c, sig] - C[ant, sig].
+
+    Retorna:
+        tuple: (clientes, ahorro) como arreglos alineados.
+    """
+    C, m = datos["C"], datos["m"]
+    clientes, ahorro = [], []
+    for d, ruta in zip(sol["deposito"], sol["rutas"]):
+        nodos = np.concatenate(([d], ruta + m, [d]))
+        ant, act, sig = nodos[:-2], nodos[1:-1], nodos[2:]
+        clientes.append(ruta)
+        ahorro.append(C[ant, act] + C[act, sig] - C[ant, sig])
+    if not clientes:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    return np.concatenate(clientes), np.concatenate(ahorro)
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Destrucción +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+# Cada operador recibe (datos, sol, q, rng) y retorna (clientes quitados, depósitos cuya
+# apertura no se cobra durante la reparación).
+
+def destruir_aleatorio(datos, sol, q, rng):
+    return rng.choice(datos["n"], size=min(q, datos["n"]), replace=False), set()
+
+
+def destruir_peor(datos, sol, q, rng, p=3.0):
+    """
+    Quita los clientes con mayor ahorro de remoción, con aleatorización ahorro^p (Ropke y Pisinger).
+    """
+    clientes, ahorro = _delta_remocion(datos, sol)
+    orden = clientes[np.argsort(-ahorro, kind='stable')]
+    elegidos = []
+    for _ in range(min(q, orden.size)):
+        k = int(rng.random() ** p * orden.size)
+        elegidos.append(orden[k])
+        orden = np.delete(orden, k)
+    return np.asarray(elegidos, dtype=np.int64), set()
+
+
+def destruir_relacionado(datos, sol, q, rng):
+    """
+    Quita un cliente al azar y sus q - 1 clientes más cercanos (remoción de Shaw por distancia).
+    """
+    m = datos["m"]
+    semilla = rng.integers(datos["n"])
+    distancia = datos["C"][m + semilla, m:]
+    return np.argsort(distancia, kind='stable')[:min(q, datos["n"])], set()
+
+
+def destruir_ruta(datos, sol, q, rng):
+    """
+    Quita todos los clientes de una ruta al azar.
+    """
+    return sol["rutas"][rng.integers(len(sol["rutas"]))].copy(), set()
+
+
+def cerrar_deposito(datos, sol, q, rng):
+    """
+    Cierra un depósito usado al azar quitando todos sus clientes.
+    """
+    usados = np.nonzero(_usados(datos, sol))[0]
+    if usados.size <= 1:
+        return destruir_aleatorio(datos, sol, q, rng)
+    d = rng.choice(usados)
+    clientes = [ruta for dep, ruta in zip(sol["deposito"], sol["rutas"]) if dep == d]
+    return np.concatenate(clientes), set()
+
+
+def abrir_deposito(datos, sol, q, rng):
+    """
+    Abre un depósito no usado al azar y quita los q clientes más cercanos a él; la reparación no
+    cobra su apertura, así que los clientes pueden reasignarse al nuevo depósito.
+    """
+    libres = np.nonzero(~_usados(datos, sol))[0]
+    if libres.size == 0:
+        return destruir_relacionado(datos, sol, q, rng)
+    d = int(rng.choice(libres))
+    distancia = datos["C"][d, datos["m"]:]
+    return np.argsort(distancia, kind='stable')[:min(q, datos["n"])], {d}
+
+
+DESTRUCCION = {
+    "aleatorio": destruir_aleatorio,
+    "peor": destruir_peor,
+    "relacionado": destruir_relacionado,
+    "ruta": destruir_ruta,
+    "cerrar_deposito": cerrar_deposito,
+    "abrir_deposito": abrir_deposito,
+}
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Reparación +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def _opciones(datos, sol, pendientes, gratis):
+    """
+    Costo de insertar cada cliente pendiente en cada posición de cada ruta y en una ruta nueva de
+    cada depósito.
+
+    Las columnas son primero las posiciones de las rutas existentes (contiguas por ruta) y después
+    una ruta nueva por depósito. Las opciones que violan la capacidad del vehículo o del depósito
+    valen infinito.
+
+    Retorna:
+        tuple: (delta (k, columnas), ruta de cada columna (-1 para rutas nuevas), posición de
+            inserción de cada columna (depósito para rutas nuevas), inicio de cada grupo de columnas)
+    """
+    C, m, demanda = datos["C"], datos["m"], datos["demanda"]
+    dem = demanda[pendientes][:, None]
+    nodos_c = pendientes + m
+
+    ant, sig, ruta_col, pos_col, inicios = [], [], [], [], []
+    inicio = 0
+    for r, (d, ruta) in enumerate(zip(sol["deposito"], sol["rutas"])):
+        nodos = np.concatenate(([d], ruta + m, [d]))
+        ant.append(nodos[:-1])
+        sig.append(nodos[1:])
+        ruta_col.append(np.full(nodos.size - 1, r))
+        pos_col.append(np.arange(nodos.size - 1))
+        inicios.append(inicio)
+        inicio += nodos.size - 1
+    num_pos = inicio
+
+    if num_pos:
+        ant, sig = np.concatenate(ant), np.concatenate(sig)
+        ruta_col = np.concatenate(ruta_col)
+        delta_pos = C[ant][:, nodos_c].T + C[nodos_c][:, sig] - C[ant, sig][None, :]
+        carga = np.asarray(sol["carga"])[ruta_col]
+        dep = np.asarray(sol["deposito"])[ruta_col]
+        factible = (carga[None, :] + dem <= datos["Q"] + 1e-9) & \
+                   (sol["carga_deposito"][dep][None, :] + dem <= datos["capacidad"][dep][None, :] + 1e-9)
+        delta_pos = np.where(factible, delta_pos, np.inf)
+    else:
+        delta_pos = np.empty((pendientes.size, 0))
+        ruta_col = np.empty(0, dtype=np.int64)
+
+    depositos = np.arange(m)
+    apertura = np.where(_usados(datos, sol), 0.0, datos["apertura"])
+    apertura[list(gratis)] = 0.0
+    delta_nueva = C[depositos][:, nodos_c].T + C[nodos_c][:, depositos] + datos["costo_ruta"] + apertura[None, :]
+    factible = (dem <= datos["Q"] + 1e-9) & (sol["carga_deposito"][None, :] + dem <= datos["capacidad"][None, :] + 1e-9)
+    delta_nueva = np.where(factible, delta_nueva, np.inf)
+
+    delta = np.concatenate([delta_pos, delta_nueva], axis=1)
+    ruta_col = np.concatenate([ruta_col, np.full(m, -1)])
+    pos_col = np.concatenate(pos_col + [depositos]) if pos_col else depositos
+    inicios = np.asarray(inicios + list(range(num_pos, num_pos + m)), dtype=np.int64)
+    return delta, ruta_col, pos_col, inicios
+
+
+def _insertar(datos, sol, cliente, ruta, pos, delta):
+    """
+    Inserta un cliente en la posición pos de la ruta (o en una ruta nueva del depósito pos si ruta
+    es -1) y actualiza cargas y recorridos con el delta ya calculado.
+    """
+    dem = datos["demanda"][cliente]
+    if ruta < 0:
+        d = int(pos)
+        sol["deposito"].append(d)
+        sol["rutas"].append(np.array([cliente], dtype=np.int64))
+        sol["carga"].append(float(dem))
+        sol["recorrido"].append(float(datos["C"][d, datos["m"] + cliente] + datos["C"][datos["m"] + cliente, d]))
+    else:
+        d = sol["deposito"][ruta]
+        sol["rutas"][ruta] = np.insert(sol["rutas"][ruta], pos, cliente)
+        sol["carga"][ruta] += dem
+        sol["recorrido"][ruta] += delta
+    sol["carga_deposito"][d] += dem
+
+
+def reparar_goloso(datos, sol, pendientes, gratis, rng):
+    """
+    Inserta en cada paso el cliente pendiente con la inserción más barata.
+
+    Retorna:
+        bool: False si algún cliente no cabe en ninguna ruta ni depósito.
+    """
+    pendientes = np.asarray(pendientes, dtype=np.int64)
+    while pendientes.size:
+        delta, ruta_col, pos_col, _ = _opciones(datos, sol, pendientes, gratis)
+        k, col = np.unravel_index(np.argmin(delta), delta.shape)
+        if not np.isfinite(delta[k, col]):
+            return False
+        _insertar(datos, sol, pendientes[k], ruta_col[col], pos_col[col], delta[k, col])
+        pendientes = np.delete(pendientes, k)
+    return True
+
+
+def reparar_regret(datos, sol, pendientes, gratis, rng):
+    """
+    Inserta en cada paso el cliente con mayor arrepentimiento: diferencia entre su mejor inserción
+    y su mejor inserción en otra ruta (regret-2).
+
+    Retorna:
+        bool: False si algún cliente no cabe en ninguna ruta ni depósito.
+    """
+    pendientes = np.asarray(pendientes, dtype=np.int64)
+    while pendientes.size:
+        delta, ruta_col, pos_col, inicios = _opciones(datos, sol, pendientes, gratis)
+        por_ruta = np.minimum.reduceat(delta, inicios, axis=1)
+        dos = np.sort(por_ruta, axis=1)[:, :2] if por_ruta.shape[1] > 1 else np.hstack([por_ruta, por_ruta])
+        if not np.isfinite(dos[:, 0]).all():
+            return False
+        regret = np.where(np.isfinite(dos[:, 1]), dos[:, 1] - dos[:, 0], np.finfo(np.float64).max)
+        k = int(np.lexsort((dos[:, 0], -regret))[0])
+        col = int(np.argmin(delta[k]))
+        _insertar(datos, sol, pendientes[k], ruta_col[col], pos_col[col], delta[k, col])
+        pendientes = np.delete(pendientes, k)
+    return True
+
+
+REPARACION = {"goloso": reparar_goloso, "regret": reparar_regret}
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Movimientos de ruta +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def dos_opt(datos, d, ruta):
+    """
+    Mejora una ruta con 2-opt (mejor mejora) evaluando todos los deltas de una vez.
+
+    Retorna:
+        tuple: (ruta mejorada, ahorro total)
+    """
+    C, m = datos["C"], datos["m"]
+    ahorro_total = 0.0
+    while ruta.size >= 3:
+        nodos = np.concatenate(([d], ruta + m, [d]))
+        a, b = nodos[:-1], nodos[1:]
+        # Invertir el tramo entre los arcos i y j (i < j): (a_i, b_i) y (a_j, b_j) -> (a_i, a_j) y (b_i, b_j)
+        delta = C[a][:, a] + C[b][:, b] - (C[a, b][:, None] + C[a, b][None, :])
+        delta[np.tril_indices(a.size, 1)] = 0.0
+        i, j = np.unravel_index(np.argmin(delta), delta.shape)
+        if delta[i, j] >= -1e-9:
+            break
+        ruta = np.concatenate((ruta[:i], ruta[i:j][::-1], ruta[j:]))
+        ahorro_total -= delta[i, j]
+    return ruta, ahorro_total
+
+
+def pulir(datos, sol):
+    """
+    Aplica dos_opt a todas las rutas de la solución.
+    """
+    for r, (d, ruta) in enumerate(zip(sol["deposito"], sol["rutas"])):
+        mejorada, ahorro = dos_opt(datos, d, ruta)
+        if ahorro > 0:
+            sol["rutas"][r] = mejorada
+            sol["recorrido"][r] = _costo_recorrido(datos, d, mejorada)
+    return sol
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ ALNS +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+# Puntajes de Ropke y Pisinger: nueva mejor solución, mejora de la actual, aceptada sin mejorar
+PUNTAJES = (33.0, 9.0, 13.0)
+
+
+def _ruleta(pesos, rng):
+    return int(rng.choice(len(pesos), p=pesos / pesos.sum()))
+
+
+def alns(parsed_data, iteraciones=5000, tiempo_limite=None, semilla=0, metodo_inicial="savings",
+         q_min=None, q_max=None, segmento=100, reaccion=0.1, peor_inicial=0.05, temperatura_final=1e-3,
+         al_mejorar=None, importar=None):
+    """
+    Resuelve una instancia con ALNS.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados (listas o arreglos de NumPy).
+        iteraciones (int): Número máximo de iteraciones.
+        tiempo_limite (float): Tiempo máximo en segundos (None para sólo limitar iteraciones).
+        semilla (int): Semilla del generador aleatorio.
+        metodo_inicial (str): Método de ruteo de la solución inicial ("savings" o "sweep").
+        q_min, q_max (int): Rango de clientes quitados por iteración (por defecto entre 5% y 30%
+            de los clientes, con un máximo de 40).
+        segmento (int): Iteraciones entre actualizaciones de los pesos de los operadores.
+        reaccion (float): Factor de reacción de la actualización de pesos.
+        peor_inicial (float): Una solución este porcentaje peor que la inicial se acepta con
+            probabilidad 0.5 a la temperatura inicial.
+        temperatura_final (float): Fracción de la temperatura inicial al final de las iteraciones.
+        al_mejorar (callable): Se llama con la nueva mejor solución (formato de heuristica) cada
+            vez que mejora.
+        importar (callable): Se llama al final de cada segmento y retorna una solución externa
+            (formato de heuristica) o None; si es factible y mejor que la mejor actual, la búsqueda
+            continúa desde ella.
+
+    Retorna:
+        dict: Mejor solución en el formato de heuristica.construir_solucion, con la llave adicional
+            "estadisticas" (iteraciones, tiempo, costo inicial, usos y pesos de cada operador).
+    """
+    start_time = time.perf_counter()
+    rng = np.random.default_rng(semilla)
+    datos = _preparar(parsed_data)
+    n = datos["n"]
+    q_min = q_min or max(1, min(4, int(0.05 * n)))
+    q_max = max(q_min, q_max or min(40, max(1, int(0.3 * n))))
+
+    actual = pulir(datos, desde_heuristica(datos, construir_solucion(parsed_data, metodo_inicial)))
+    costo_actual = costo(datos, actual)
+    mejor, costo_mejor = _copiar(actual), costo_actual
+    costo_inicial = costo_actual
+
+    destruccion, reparacion = list(DESTRUCCION), list(REPARACION)
+    pesos_d, pesos_r = np.ones(len(destruccion)), np.ones(len(reparacion))
+    puntos_d, puntos_r = np.zeros(len(destruccion)), np.zeros(len(reparacion))
+    usos_d, usos_r = np.zeros(len(destruccion)), np.zeros(len(reparacion))
+    total_d, total_r = np.zeros(len(destruccion), dtype=np.int64), np.zeros(len(reparacion), dtype=np.int64)
+
+    temperatura = -peor_inicial * costo_actual / math.log(0.5) if costo_actual > 0 else 1.0
+    enfriamiento = temperatura_final ** (1.0 / max(1, iteraciones))
+
+    it = 0
+    for it in range(1, iteraciones + 1):
+        if tiempo_limite is not None and time.perf_counter() - start_time >= tiempo_limite:
+            it -= 1
+            break
+        i_d, i_r = _ruleta(pesos_d, rng), _ruleta(pesos_r, rng)
+        q = int(rng.integers(q_min, q_max + 1))
+
+        candidata = _copiar(actual)
+        quitados, gratis = DESTRUCCION[destruccion[i_d]](datos, candidata, q, rng)
+        _quitar(datos, candidata, quitados)
+        rng.shuffle(quitados)
+        usos_d[i_d] += 1
+        usos_r[i_r] += 1
+        total_d[i_d] += 1
+        total_r[i_r] += 1
+
+        puntaje = 0.0
+        if REPARACION[reparacion[i_r]](datos, candidata, quitados, gratis, rng):
+            costo_candidata = costo(datos, candidata)
+            if costo_candidata < costo_mejor - 1e-9:
+                candidata = pulir(datos, candidata)
+                costo_candidata = costo(datos, candidata)
+                mejor, costo_mejor = _copiar(candidata), costo_candidata
+                actual, costo_actual = candidata, costo_candidata
+                puntaje = PUNTAJES[0]
+                if al_mejorar is not None:
+                    al_mejorar(a_heuristica(datos, mejor))
+            elif costo_candidata < costo_actual - 1e-9:
+                actual, costo_actual = candidata, costo_candidata
+                puntaje = PUNTAJES[1]
+            elif rng.random() < math.exp(-(costo_candidata - costo_actual) / max(temperatura, 1e-12)):
+                actual, costo_actual = candidata, costo_candidata
+                puntaje = PUNTAJES[2]
+        puntos_d[i_d] += puntaje
+        puntos_r[i_r] += puntaje
+
+        if it % segmento == 0:
+            for pesos, puntos, usos in ((pesos_d, puntos_d, usos_d), (pesos_r, puntos_r, usos_r)):
+                usados = usos > 0
+                pesos[usados] = (1 - reaccion) * pesos[usados] + reaccion * puntos[usados] / usos[usados]
+                np.maximum(pesos, 1e-3, out=pesos)
+                puntos[:] = 0.0
+                usos[:] = 0.0
+            externa = importar() if importar is not None else None
+            if externa is not None:
+                externa = desde_heuristica(datos, externa)
+                if factible(datos, externa) and costo(datos, externa) < costo_mejor - 1e-9:
+                    mejor, costo_mejor = _copiar(externa), costo(datos, externa)
+                    actual, costo_actual = externa, costo_mejor
+        temperatura *= enfriamiento
+
+    solucion = a_heuristica(datos, mejor)
+    solucion["estadisticas"] = {
+        "iteraciones": it,
+        "tiempo": time.perf_counter() - start_time,
+        "costo_inicial": costo_inicial,
+        "usos_destruccion": dict(zip(destruccion, total_d.tolist())),
+        "usos_reparacion": dict(zip(reparacion, total_r.tolist())),
+        "pesos_destruccion": dict(zip(destruccion, pesos_d.tolist())),
+        "pesos_reparacion": dict(zip(reparacion, pesos_r.tolist())),
+    }
+    return solucion
+
+
+def get_metrics_alns(parsed_data, benchmark, instance, **kwargs):
+    """
+    Ejecuta el ALNS y retorna sus métricas con las columnas de results.csv.
+
+    El número de variables y restricciones no aplica y se reporta como "N/A".
+    """
+    start_time = time.time()
+    solucion = alns(parsed_data, **kwargs)
+    end_time = time.time()
+    return {
+        "Modelo": "ALNS",
+        "Benchmark": benchmark,
+        "Instancia": instance,
+        "Número de Variables": "N/A",
+        "Número de Restricciones": "N/A",
+        "Valor Función Objetivo": costo_solucion(parsed_data, solucion),
+        "Tiempo de Cómputo (s)": end_time - start_time
+    }
+
+
+def main(argv=None):
+    from runner import COLUMNAS, INSTANCIAS, abrir_csv, directorio_benchmark
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--benchmarks", nargs="+", default=list(INSTANCIAS))
+    parser.add_argument("--instancias", nargs="+", default=None)
+    parser.add_argument("--iteraciones", type=int, default=5000)
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--inicial", choices=["savings", "sweep"], default="savings")
+    parser.add_argument("--base", default="Instances")
+    parser.add_argument("--salida", default=None, help="CSV donde agregar los resultados (opcional)")
+    args = parser.parse_args(argv)
+
+    file, writer = abrir_csv(args.salida) if args.salida else (None, None)
+    try:
+        for benchmark in args.benchmarks:
+            directorio = directorio_benchmark(benchmark, args.base)
+            disponibles = sorted(os.path.basename(p) for p in glob.glob(os.path.join(directorio, "*.dat")))
+            for patron in args.instancias or INSTANCIAS.get(benchmark, ["*.dat"]):
+                for nombre in fnmatch.filter(disponibles, patron):
+                    parsed_data = parse_file(os.path.join(directorio, nombre))
+                    metrics = get_metrics_alns(parsed_data, benchmark, nombre, iteraciones=args.iteraciones,
+                                               tiempo_limite=args.time_limit, semilla=args.semilla,
+                                               metodo_inicial=args.inicial)
+                    print(", ".join(str(metrics[c]) for c in COLUMNAS))
+                    if writer is not None:
+                        writer.writerow(metrics)
+                        file.flush()
+    finally:
+        if file is not None:
+            file.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Conjuntos de arcos dispersos compartidos por las formulaciones.
+
+Un conjunto de arcos es una matriz booleana (m + n, m + n) con la numeración de parse_file
+(depósitos 0..m-1, clientes m..m+n-1): arcos[a, b] indica que el arco a -> b existe en el modelo.
+Los constructores aceptan arcos=None para usar todos los arcos, como en la formulación original.
+"""
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+def arcos_knn(parsed_data, k=10):
+    """
+    Arcos de los k vecinos más cercanos de cada cliente, más todos los arcos depósito-cliente.
+
+    Los arcos entre clientes se simetrizan (si j es vecino de i se agregan i -> j y j -> i) para que
+    cualquier ruta pueda recorrerse en ambos sentidos. No se incluyen arcos entre depósitos.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        k (int): Número de vecinos más cercanos por cliente.
+
+    Retorna:
+        ndarray: Matriz booleana (m + n, m + n) de arcos permitidos.
+    """
+    n = parsed_data["num_customers"]
+    m = parsed_data["num_depots"]
+    customers = np.asarray(parsed_data["customers"], dtype=np.float64).reshape(-1, 2)
+
+    arcos = np.zeros((m + n, m + n), dtype=bool)
+    vecinos = min(k + 1, n)
+    if vecinos > 1:
+        _, idx = cKDTree(customers).query(customers, k=vecinos)
+        filas = np.repeat(np.arange(n), vecinos)
+        arcos[m + filas, m + idx.ravel()] = True
+        arcos |= arcos.T
+    arcos[:m, m:] = True
+    arcos[m:, :m] = True
+    np.fill_diagonal(arcos, False)
+    return arcos
+
+
+def arcos_completos(parsed_data):
+    """
+    Todos los arcos i != j (equivalente a arcos=None).
+    """
+    N = parsed_data["num_customers"] + parsed_data["num_depots"]
+    return ~np.eye(N, dtype=bool)
+
+
+def clientes_primero(arcos, m, n):
+    """
+    Reordena un conjunto de arcos a la numeración de model.py (clientes 0..n-1, depósitos n..n+m-1).
+    """
+    orden = np.concatenate([np.arange(m, m + n), np.arange(m)])
+    return arcos[np.ix_(orden, orden)]
+
+
+def pares(arcos, N, diagonal=False):
+    """
+    Lista de pares (i, j) de un conjunto de arcos en orden lexicográfico.
+
+    Parámetros:
+        arcos (ndarray): Matriz booleana de arcos, o None para todos los pares i != j.
+        N (int): Número total de nodos.
+        diagonal (bool): Si es True, incluye los pares (i, i); algunas formulaciones originales
+            declaran variables para toda la matriz de nodos.
+
+    Retorna:
+        list: Pares (i, j).
+    """
+    mascara = np.ones((N, N), dtype=bool) if arcos is None else np.asarray(arcos, dtype=bool).copy()
+    np.fill_diagonal(mascara, diagonal)
+    return list(zip(*(idx.tolist() for idx in np.nonzero(mascara))))
+
+
+def vecindad(lista_pares, N):
+    """
+    Sucesores y predecesores de cada nodo (sin la diagonal) a partir de una lista de pares.
+
+    Retorna:
+        tuple: (sucesores, predecesores), listas de N listas de nodos en orden creciente.
+    """
+    sucesores = [[] for _ in range(N)]
+    predecesores = [[] for _ in range(N)]
+    for i, j in lista_pares:
+        if i != j:
+            sucesores[i].append(j)
+            predecesores[j].append(i)
+    for lista in predecesores:
+        lista.sort()
+    return sucesores, predecesores
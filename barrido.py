@@ -0,0 +1,236 @@
+"""
+Barridos de parámetros sobre un modelo construido una sola vez.
+
+Para estudios de sensibilidad sobre vehicle_capacity, route_opening_cost y los costos de apertura
+de los depósitos, el modelo se construye una vez desde la representación intermedia
+(representacion.py) y en cada punto del barrido:
+    1. se arma la IR del punto y se compara con la del modelo cargado: como los parámetros sólo
+       cambian valores (no la estructura), las diferencias son unos pocos costos, lados derechos y
+       coeficientes de la matriz;
+    2. sólo esas entradas se actualizan en el modelo de Gurobi o CPLEX, sin reconstruirlo;
+    3. la solución del punto anterior se carga como MIP start (el solver conserva además su base
+       para la relajación de la raíz) y se resuelve.
+
+Las métricas de cada punto se guardan en la base de resultados (resultados.py) a medida que se
+obtienen; el punto forma parte de la llave (parámetro "barrido").
+
+Uso (desde la raíz del repositorio):
+    python barrido.py Instances/Benchmark_1/coord50-5-1.dat --formulacion SCF --solver gurobi \\
+        --vehicle-capacity 70 100 150 --factor-apertura 0.5 1 2 --time-limit 60 --db results.db
+"""
+import argparse
+import itertools
+import os
+import time
+
+import numpy as np
+
+from arcos import arcos_knn
+from mip_start import aplicar_inicio_cplex, aplicar_inicio_gurobi
+from pipeline import extraer_solucion
+from representacion import CARGADORES, REPRESENTACIONES
+from resultados import conectar, guardar
+from runner import COLUMNAS, GET_METRICS
+from testParser import parse_file
+
+# Parámetros que admite un punto del barrido
+PARAMETROS_BARRIDO = ("vehicle_capacity", "route_opening_cost", "factor_apertura")
+
+
+def con_parametros(parsed_data, punto):
+    """
+    Copia de los datos parseados con los parámetros de un punto del barrido.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        punto (dict): Valores de PARAMETROS_BARRIDO; factor_apertura multiplica los costos de
+            apertura de todos los depósitos. Los parámetros ausentes quedan como en la instancia.
+
+    Retorna:
+        dict: Datos con los parámetros del punto.
+    """
+    datos = dict(parsed_data)
+    for parametro in ("vehicle_capacity", "route_opening_cost"):
+        if parametro in punto:
+            datos[parametro] = punto[parametro]
+    if "factor_apertura" in punto:
+        datos["depot_opening_costs"] = (np.asarray(parsed_data["depot_opening_costs"], dtype=np.float64)
+                                        * punto["factor_apertura"])
+    return datos
+
+
+def diferencias(ir, nueva):
+    """
+    Entradas de la IR que cambian entre dos puntos del barrido.
+
+    Retorna:
+        dict: "c" -> (columnas, costos), "rhs" -> (filas, valores) y "A" -> (filas, columnas,
+            valores).
+
+    Lanza:
+        ValueError: Si la estructura de la matriz cambió (el modelo debe reconstruirse).
+    """
+    A, B = ir["A"], nueva["A"]
+    if A.shape != B.shape or not (np.array_equal(A.indptr, B.indptr) and np.array_equal(A.indices, B.indices)):
+        raise ValueError("El punto del barrido cambia la estructura de la matriz de restricciones")
+    columnas = np.flatnonzero(ir["c"] != nueva["c"])
+    filas = np.flatnonzero(ir["rhs"] != nueva["rhs"])
+    entradas = np.flatnonzero(A.data != B.data)
+    filas_a = np.searchsorted(A.indptr, entradas, side='right') - 1
+    return {
+        "c": (columnas, nueva["c"][columnas]),
+        "rhs": (filas, nueva["rhs"][filas]),
+        "A": (filas_a, A.indices[entradas], B.data[entradas]),
+    }
+
+
+def actualizar_gurobi(mdl, cambios):
+    """
+    Aplica las diferencias de la IR a un modelo cargado con representacion.cargar_gurobi.
+    """
+    mdl.update()
+    variables, restricciones = mdl.getVars(), mdl.getConstrs()
+    columnas, costos = cambios["c"]
+    if columnas.size:
+        mdl.setAttr("Obj", [variables[j] for j in columnas.tolist()], costos.tolist())
+    filas, valores = cambios["rhs"]
+    if filas.size:
+        mdl.setAttr("RHS", [restricciones[i] for i in filas.tolist()], valores.tolist())
+    for i, j, valor in zip(*(a.tolist() for a in cambios["A"])):
+        mdl.chgCoeff(restricciones[i], variables[j], valor)
+    mdl.update()
+
+
+def actualizar_cplex(mdl, cambios):
+    """
+    Aplica las diferencias de la IR a un modelo cargado con representacion.cargar_cplex.
+
+    Los cambios se hacen directamente en el motor de CPLEX, cuyas columnas y filas siguen el
+    orden de la IR.
+    """
+    cpx = mdl.get_cplex()
+    columnas, costos = cambios["c"]
+    if columnas.size:
+        cpx.objective.set_linear(list(zip(columnas.tolist(), costos.tolist())))
+    filas, valores = cambios["rhs"]
+    if filas.size:
+        cpx.linear_constraints.set_rhs(list(zip(filas.tolist(), valores.tolist())))
+    if cambios["A"][0].size:
+        cpx.linear_constraints.set_coefficients(list(zip(*(a.tolist() for a in cambios["A"]))))
+
+
+ACTUALIZADORES = {"gurobi": actualizar_gurobi, "cplex": actualizar_cplex}
+
+
+def _iniciar(model_instance, solver, valores):
+    if solver == 'gurobi':
+        aplicar_inicio_gurobi(model_instance, valores)
+    else:
+        model_instance.clear_mip_starts()
+        aplicar_inicio_cplex(model_instance, valores)
+
+
+def barrido(parsed_data, formulacion, solver, puntos, threads=None, time_limit=None, k_vecinos=None):
+    """
+    Resuelve una formulación en cada punto del barrido modificando el modelo en su lugar.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        formulacion (str): "SCF" o "CDA".
+        solver (str): "gurobi" o "cplex".
+        puntos (iterable): Puntos del barrido (ver con_parametros).
+        threads (int): Hilos del solver.
+        time_limit (float): Límite de tiempo por punto, en segundos.
+        k_vecinos (int): Si se entrega, el modelo se construye sólo con los arcos de los k
+            vecinos más cercanos (fijos durante todo el barrido).
+
+    Retorna:
+        generator: Tuplas (punto, métricas) con las columnas de results.csv más "tiempo_build"
+            (construcción del modelo en el primer punto, actualización en los siguientes) y
+            "cambios" (entradas del modelo modificadas).
+    """
+    representar = REPRESENTACIONES[formulacion]
+    kwargs = {"arcos": arcos_knn(parsed_data, k_vecinos)} if k_vecinos else {}
+    model_instance, ir, valores = None, None, {}
+    try:
+        for punto in puntos:
+            start_time = time.time()
+            nueva = representar(con_parametros(parsed_data, punto), **kwargs)
+            if model_instance is None:
+                model_instance = CARGADORES[solver](nueva)
+                cambios = 0
+            else:
+                diferencia = diferencias(ir, nueva)
+                ACTUALIZADORES[solver](model_instance, diferencia)
+                cambios = sum(v[0].size for v in diferencia.values())
+            ir = nueva
+            if valores:
+                _iniciar(model_instance, solver, valores)
+            tiempo_build = time.time() - start_time
+
+            metrics = GET_METRICS[solver](model_instance, "", "", threads=threads, time_limit=time_limit)
+            metrics["tiempo_build"] = tiempo_build
+            metrics["cambios"] = cambios
+            valores = extraer_solucion(model_instance, solver) or valores
+            yield punto, metrics
+    finally:
+        if model_instance is not None:
+            if solver == 'gurobi':
+                model_instance.dispose()
+            else:
+                model_instance.end()
+
+
+def puntos_grilla(**valores):
+    """
+    Producto cartesiano de los valores de cada parámetro (los que son None se omiten).
+
+    Retorna:
+        list: Puntos del barrido como diccionarios.
+    """
+    nombres = [p for p in PARAMETROS_BARRIDO if valores.get(p)]
+    return [dict(zip(nombres, combinacion)) for combinacion in itertools.product(*(valores[p] for p in nombres))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancia")
+    parser.add_argument("--formulacion", choices=list(REPRESENTACIONES), default="SCF")
+    parser.add_argument("--solver", choices=list(CARGADORES), default="gurobi")
+    parser.add_argument("--vehicle-capacity", type=float, nargs="+", default=None)
+    parser.add_argument("--route-opening-cost", type=float, nargs="+", default=None)
+    parser.add_argument("--factor-apertura", type=float, nargs="+", default=None,
+                        help="factores que multiplican los costos de apertura de los depósitos")
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--k-vecinos", type=int, default=None)
+    parser.add_argument("--benchmark", default=None, help="benchmark de la llave (por defecto el directorio)")
+    parser.add_argument("--db", default="results.db", help="base SQLite de resultados")
+    args = parser.parse_args(argv)
+
+    puntos = puntos_grilla(vehicle_capacity=args.vehicle_capacity, route_opening_cost=args.route_opening_cost,
+                           factor_apertura=args.factor_apertura)
+    if not puntos:
+        parser.error("se necesita al menos un parámetro a barrer")
+    benchmark = args.benchmark or os.path.basename(os.path.dirname(os.path.abspath(args.instancia)))
+    instancia = os.path.basename(args.instancia)
+    trabajo = {"formulacion": args.formulacion, "solver": args.solver, "benchmark": benchmark,
+               "instancia": instancia, "threads": args.threads, "time_limit": args.time_limit,
+               "mip_start": None, "k_vecinos": args.k_vecinos, "ir": True}
+
+    con = conectar(args.db)
+    try:
+        start_time = time.time()
+        for punto, metrics in barrido(parse_file(args.instancia), args.formulacion, args.solver, puntos,
+                                      threads=args.threads, time_limit=args.time_limit, k_vecinos=args.k_vecinos):
+            metrics.update(Benchmark=benchmark, Instancia=instancia)
+            guardar(con, {**trabajo, "barrido": punto}, metrics)
+            print(f"{punto}: " + ", ".join(str(metrics[c]) for c in COLUMNAS[3:])
+                  + f" (actualización {metrics['tiempo_build']:.3f} s, {metrics['cambios']} cambios)")
+        print(f"Barrido de {len(puntos)} puntos en {time.time() - start_time:.2f} s")
+    finally:
+        con.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Verificación de la poda de arcos por k vecinos más cercanos: construye cada formulación con el
+conjunto de arcos podado y con el conjunto completo, reporta el número de variables y
+restricciones de ambos y, con --resolver, resuelve los dos modelos para medir cuánto objetivo se
+perdió con la poda.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_arcos [--k 10 ...] [--resolver] [--time-limit S] instancia.dat [...]
+"""
+import argparse
+import os
+
+from arcos import arcos_knn
+from pipeline import liberar_modelo
+from runner import GET_METRICS, MODELOS, construir_modelo
+from testParser import parse_file
+
+
+def _tamano(model_instance, solver):
+    if solver == 'gurobi':
+        model_instance.update()
+        return model_instance.NumVars, model_instance.NumConstrs
+    return model_instance.number_of_variables, model_instance.number_of_constraints
+
+
+def verificar_poda(file_path, formulacion, solver, k, resolver=False, time_limit=None):
+    """
+    Compara el modelo podado a k vecinos con el modelo sobre todos los arcos.
+
+    Retorna:
+        dict: Arcos, variables y restricciones de ambos modelos y, si resolver es True, sus
+            objetivos y la pérdida relativa del modelo podado.
+    """
+    parsed_data = parse_file(file_path)
+    trabajo = {"formulacion": formulacion, "solver": solver, "threads": None, "time_limit": time_limit}
+    nombre = os.path.basename(file_path)
+    fila = {"arcos": int(arcos_knn(parsed_data, k).sum())}
+    for clave, k_vecinos in (("completo", None), ("podado", k)):
+        model_instance = construir_modelo(dict(trabajo, k_vecinos=k_vecinos), parsed_data)
+        fila[f"variables_{clave}"], fila[f"restricciones_{clave}"] = _tamano(model_instance, solver)
+        if resolver:
+            metrics = GET_METRICS[solver](model_instance, "", nombre, time_limit=time_limit)
+            fila[f"objetivo_{clave}"] = metrics["Valor Función Objetivo"]
+        liberar_modelo(model_instance, solver)
+
+    if resolver and all(isinstance(fila[f"objetivo_{c}"], float) for c in ("completo", "podado")):
+        fila["perdida"] = (fila["objetivo_podado"] - fila["objetivo_completo"]) / abs(fila["objetivo_completo"])
+    return fila
+
+
+def _fmt(valor):
+    return f"{valor:.3f}" if isinstance(valor, float) else str(valor)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="+")
+    parser.add_argument("--k", type=int, nargs="+", default=[10])
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS))
+    parser.add_argument("--solvers", nargs="+", default=["gurobi", "cplex"])
+    parser.add_argument("--resolver", action="store_true", help="resolver ambos modelos y medir la pérdida")
+    parser.add_argument("--time-limit", type=float, default=None)
+    args = parser.parse_args()
+
+    print("Instancia | Formulación | Solver | k | Arcos | Variables (completo -> podado) | "
+          "Restricciones (completo -> podado) | Objetivo completo | Objetivo podado | Pérdida")
+    for file_path in args.instancias:
+        for formulacion in args.formulaciones:
+            for solver in args.solvers:
+                for k in args.k:
+                    fila = verificar_poda(file_path, formulacion, solver, k, args.resolver, args.time_limit)
+                    perdida = f"{100 * fila['perdida']:.2f}%" if "perdida" in fila else "N/A"
+                    print(f"{os.path.basename(file_path)} | {formulacion} | {solver} | {k} | {fila['arcos']} | "
+                          f"{fila['variables_completo']} -> {fila['variables_podado']} | "
+                          f"{fila['restricciones_completo']} -> {fila['restricciones_podado']} | "
+                          f"{_fmt(fila.get('objetivo_completo', 'N/A'))} | "
+                          f"{_fmt(fila.get('objetivo_podado', 'N/A'))} | {perdida}")
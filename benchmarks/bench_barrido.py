@@ -0,0 +1,76 @@
+"""
+Benchmark del barrido de parámetros: tiempo de preparar el modelo de cada punto reconstruyéndolo
+(constructor original y constructor de la IR) contra actualizarlo en su lugar con barrido.py.
+
+Sólo mide la preparación del modelo (sin resolver), que es lo que el barrido ahorra; el arranque
+en caliente se mide resolviendo con python barrido.py.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_barrido [--formulaciones SCF CDA] [--solvers gurobi cplex] [instancia.dat ...]
+"""
+import argparse
+import os
+import time
+
+from barrido import ACTUALIZADORES, con_parametros, diferencias, puntos_grilla
+from pipeline import liberar_modelo
+from representacion import CARGADORES, REPRESENTACIONES
+from runner import MODELOS
+from testParser import parse_file
+
+# Instancias de 100 y 200 clientes del benchmark 1
+INSTANCIAS = ["Instances/Benchmark_1/coord100-5-1.dat", "Instances/Benchmark_1/coord200-10-1.dat"]
+
+
+def medir(file_path, formulacion, solver, puntos):
+    """
+    Tiempo total de preparar los modelos de todos los puntos con cada estrategia.
+
+    Retorna:
+        dict: Segundos por estrategia ("original", "ir" y "en_lugar").
+    """
+    parsed_data = parse_file(file_path)
+    tiempos = {}
+    for clave, construir in (("original", MODELOS[formulacion][solver]),
+                             ("ir", lambda datos: CARGADORES[solver](REPRESENTACIONES[formulacion](datos)))):
+        tiempos[clave] = 0.0
+        for punto in puntos:
+            start_time = time.perf_counter()
+            model_instance = construir(con_parametros(parsed_data, punto))
+            if solver == 'gurobi':
+                model_instance.update()
+            tiempos[clave] += time.perf_counter() - start_time
+            liberar_modelo(model_instance, solver)
+
+    start_time = time.perf_counter()
+    ir = REPRESENTACIONES[formulacion](con_parametros(parsed_data, puntos[0]))
+    model_instance = CARGADORES[solver](ir)
+    for punto in puntos[1:]:
+        nueva = REPRESENTACIONES[formulacion](con_parametros(parsed_data, punto))
+        ACTUALIZADORES[solver](model_instance, diferencias(ir, nueva))
+        ir = nueva
+    tiempos["en_lugar"] = time.perf_counter() - start_time
+    liberar_modelo(model_instance, solver)
+    return tiempos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="*", default=INSTANCIAS)
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS))
+    parser.add_argument("--solvers", nargs="+", default=["gurobi", "cplex"])
+    parser.add_argument("--factores", type=float, nargs="+", default=[0.8, 1.0, 1.25, 1.5],
+                        help="factores sobre vehicle_capacity y route_opening_cost de la instancia")
+    args = parser.parse_args()
+
+    print("Instancia | Formulación | Solver | Puntos | Original (s) | IR (s) | En su lugar (s) | Aceleración")
+    for file_path in args.instancias:
+        parsed_data = parse_file(file_path)
+        puntos = puntos_grilla(vehicle_capacity=[parsed_data["vehicle_capacity"] * f for f in args.factores],
+                               route_opening_cost=[parsed_data["route_opening_cost"] * f for f in args.factores])
+        for formulacion in args.formulaciones:
+            for solver in args.solvers:
+                tiempos = medir(file_path, formulacion, solver, puntos)
+                print(f"{os.path.basename(file_path)} | {formulacion} | {solver} | {len(puntos)} | "
+                      f"{tiempos['original']:.2f} | {tiempos['ir']:.2f} | {tiempos['en_lugar']:.2f} | "
+                      f"{tiempos['original'] / tiempos['en_lugar']:.1f}x")
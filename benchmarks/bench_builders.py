@@ -0,0 +1,94 @@
+"""
+Benchmark de los constructores Gurobi: compara la API original (quicksum/addConstr) con la API
+matricial (addMVar/addMConstr) en tiempo de construcción y pico de memoria, y verifica que ambas
+generen el mismo modelo (número de filas, columnas, no ceros y, con --solve, valor objetivo).
+
+Cada construcción corre en un proceso nuevo para que el pico de RSS sea sólo el de ese modelo.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_builders [--solve] [--time-limit S] instancia.dat [...]
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from matrix_builders import MODELOS_GUROBI, construir_modelo_gurobi
+from testParser import parse_file
+
+
+def _peak_rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def medir_construccion(file_path, formulacion, api, resolver=False, time_limit=60.0):
+    """
+    Construye (y opcionalmente resuelve) un modelo y retorna sus métricas de construcción.
+    """
+    parsed_data = parse_file(file_path)
+    rss_base = _peak_rss_mib()
+
+    start_time = time.perf_counter()
+    mdl = construir_modelo_gurobi(formulacion, parsed_data, api)
+    mdl.update()
+    build_time = time.perf_counter() - start_time
+
+    metrics = {
+        "Instancia": os.path.basename(file_path),
+        "Formulación": formulacion,
+        "API": api,
+        "Variables": mdl.NumVars,
+        "Restricciones": mdl.NumConstrs,
+        "No ceros": mdl.NumNZs,
+        "Construcción (s)": build_time,
+        "Pico RSS (MiB)": _peak_rss_mib() - rss_base,
+        "Valor Función Objetivo": "N/A",
+    }
+    if resolver:
+        mdl.Params.OutputFlag = 0
+        mdl.Params.TimeLimit = time_limit
+        mdl.optimize()
+        if mdl.SolCount > 0:
+            metrics["Valor Función Objetivo"] = mdl.ObjVal
+    mdl.dispose()
+    return metrics
+
+
+def equivalentes(a, b, tol=1e-6):
+    """
+    Verifica que dos mediciones de la misma formulación describan el mismo modelo.
+    """
+    if any(a[k] != b[k] for k in ("Variables", "Restricciones", "No ceros")):
+        return False
+    fo_a, fo_b = a["Valor Función Objetivo"], b["Valor Función Objetivo"]
+    if isinstance(fo_a, float) and isinstance(fo_b, float):
+        return abs(fo_a - fo_b) <= tol * max(1.0, abs(fo_a))
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="+")
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS_GUROBI))
+    parser.add_argument("--solve", action="store_true", help="resolver los modelos y comparar el objetivo")
+    parser.add_argument("--time-limit", type=float, default=60.0)
+    args = parser.parse_args()
+
+    columnas = ["Instancia", "Formulación", "API", "Variables", "Restricciones", "No ceros",
+                "Construcción (s)", "Pico RSS (MiB)", "Valor Función Objetivo"]
+    print(" | ".join(columnas) + " | Equivalente")
+
+    ctx = multiprocessing.get_context("spawn")
+    for file_path in args.instancias:
+        for formulacion in args.formulaciones:
+            resultados = {}
+            for api in ("quicksum", "matrix"):
+                with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                    resultados[api] = pool.submit(medir_construccion, file_path, formulacion, api,
+                                                  args.solve, args.time_limit).result()
+            ok = equivalentes(resultados["quicksum"], resultados["matrix"])
+            for api, metrics in resultados.items():
+                fila = [f"{metrics[c]:.3f}" if isinstance(metrics[c], float) else str(metrics[c]) for c in columnas]
+                print(" | ".join(fila) + f" | {'sí' if ok else 'NO'}")
@@ -0,0 +1,42 @@
+"""
+Benchmark del caché de instancias: tiempo de carga en frío (parseo + escritura del caché) contra
+carga en caliente (mapeo en memoria del archivo binario) sobre todo un directorio de instancias.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_cache [directorio]
+"""
+import glob
+import os
+import sys
+import tempfile
+import time
+
+from instance_cache import load_instance
+from testParser import parse_file
+
+
+def cargar_todo(files, loader):
+    """
+    Carga todas las instancias con el loader indicado y retorna el tiempo total en segundos.
+    """
+    start_time = time.perf_counter()
+    for file_path in files:
+        data = loader(file_path)
+        data["distance_matrix"][0][0]  # fuerza el acceso a la matriz
+    return time.perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    directorio = sys.argv[1] if len(sys.argv) > 1 else "Instances/Benchmark_1"
+    files = sorted(glob.glob(os.path.join(directorio, "*.dat")))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        tiempos = {
+            "parse_file (listas)": cargar_todo(files, parse_file),
+            "caché en frío": cargar_todo(files, lambda f: load_instance(f, cache_dir=cache_dir)),
+            "caché en caliente": cargar_todo(files, lambda f: load_instance(f, cache_dir=cache_dir)),
+        }
+
+    print(f"{len(files)} instancias en {directorio}")
+    for nombre, tiempo in tiempos.items():
+        print(f"{nombre:<22}{tiempo * 1e3:>12.2f} ms{tiempo * 1e3 / len(files):>12.3f} ms/instancia")
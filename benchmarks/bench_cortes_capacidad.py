@@ -0,0 +1,101 @@
+"""
+Benchmark de los cortes de capacidad redondeada (cortes_capacidad.py) sobre SCF: compara, con y
+sin cortes, la cota del nodo raíz y el tiempo total de resolución en Gurobi y CPLEX.
+
+La cota de la raíz se mide con una resolución limitada al nodo raíz (NodeLimit = 1 en Gurobi,
+mip.limits.nodes = 0 en CPLEX) y el tiempo con una resolución completa. La mejora de la cota se
+reporta también como fracción cerrada del gap de la raíz contra el mejor objetivo encontrado.
+Cada corrida se hace en un proceso nuevo.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_cortes_capacidad [--time-limit S] [--solvers gurobi cplex] [--ir] instancia.dat [...]
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from cortes_capacidad import configurar_cortes_cplex, configurar_cortes_gurobi, resolver_cortes_gurobi
+from lazy_cda import nuevas_estadisticas
+from representacion import construir_modelo_ir
+from runner import MODELOS
+from testParser import parse_file
+
+
+def correr(file_path, solver, cortes, raiz, time_limit, ir=False):
+    """
+    Construye y resuelve el SCF de una instancia y retorna la cota, el objetivo, el tiempo de
+    resolución y las estadísticas de separación.
+    """
+    parsed_data = parse_file(file_path)
+    mdl = construir_modelo_ir("SCF", solver, parsed_data) if ir else MODELOS["SCF"][solver](parsed_data)
+    stats = nuevas_estadisticas()
+
+    start_time = time.perf_counter()
+    if solver == "gurobi":
+        mdl.Params.OutputFlag = 0
+        mdl.Params.TimeLimit = time_limit
+        if raiz:
+            mdl.Params.NodeLimit = 1
+        if cortes:
+            configurar_cortes_gurobi(mdl, parsed_data)
+            stats = resolver_cortes_gurobi(mdl)
+        else:
+            mdl.optimize()
+        cota = mdl.ObjBound
+        objetivo = mdl.ObjVal if mdl.SolCount > 0 else None
+        mdl.dispose()
+    else:
+        mdl.parameters.timelimit = time_limit
+        if raiz:
+            mdl.parameters.mip.limits.nodes = 0
+        cb = configurar_cortes_cplex(mdl, parsed_data) if cortes else None
+        solucion = mdl.solve()
+        stats = cb.stats if cb is not None else stats
+        cota = mdl.solve_details.best_bound
+        objetivo = solucion.objective_value if solucion is not None else None
+        mdl.end()
+    return {"cota": cota, "objetivo": objetivo, "tiempo": time.perf_counter() - start_time, **stats}
+
+
+def _formato(valor, patron):
+    return "N/A" if valor is None else format(valor, patron)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="+")
+    parser.add_argument("--solvers", nargs="+", default=["gurobi", "cplex"])
+    parser.add_argument("--time-limit", type=float, default=600.0)
+    parser.add_argument("--ir", action="store_true", help="construir los modelos desde representacion.py")
+    args = parser.parse_args()
+
+    print("Instancia | Solver | Cota raíz | Cota raíz con cortes | Gap raíz cerrado (%) | Tiempo (s) | "
+          "Tiempo con cortes (s) | Cambio de tiempo (%) | Cortes | Separación (s) | Objetivo")
+
+    ctx = multiprocessing.get_context("spawn")
+    for file_path in args.instancias:
+        for solver in args.solvers:
+            corridas = {}
+            try:
+                for cortes in (False, True):
+                    for raiz in (True, False):
+                        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                            corridas[cortes, raiz] = pool.submit(correr, file_path, solver, cortes, raiz,
+                                                                 args.time_limit, args.ir).result()
+            except Exception as error:
+                print(f"{os.path.basename(file_path)} | {solver} | error: {error}")
+                continue
+
+            cota, cota_cortes = corridas[False, True]["cota"], corridas[True, True]["cota"]
+            objetivos = [c["objetivo"] for c in corridas.values() if c["objetivo"] is not None]
+            mejor = min(objetivos) if objetivos else None
+            cerrado = (100 * (cota_cortes - cota) / (mejor - cota)
+                       if mejor is not None and mejor - cota > 1e-9 else None)
+            tiempo, tiempo_cortes = corridas[False, False]["tiempo"], corridas[True, False]["tiempo"]
+            completa = corridas[True, False]
+            print(f"{os.path.basename(file_path)} | {solver} | {cota:.2f} | {cota_cortes:.2f} | "
+                  f"{_formato(cerrado, '.1f')} | {tiempo:.2f} | {tiempo_cortes:.2f} | "
+                  f"{100 * (tiempo_cortes - tiempo) / tiempo:+.1f} | {completa['cortes']} | "
+                  f"{completa['tiempo_separacion']:.3f} | {_formato(mejor, '.2f')}")
@@ -0,0 +1,45 @@
+"""
+Benchmark de la descomposición por depósitos: objetivo y tiempo de pared de descomposicion.py
+junto a los modelos monolíticos de runner.py en las instancias del benchmark 1.
+
+Los modelos monolíticos corren en procesos separados con ejecutar_en_paralelo (uno a la vez), así
+que un modelo que agota la memoria o el tiempo no interrumpe la tabla.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_descomposicion [--time-limit S] [--iteraciones K] [instancia.dat ...]
+"""
+import argparse
+import os
+
+from descomposicion import get_metrics_descomposicion
+from runner import INSTANCIAS, MODELOS, ejecutar_en_paralelo, expandir_trabajos
+from testParser import parse_file
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="*", default=INSTANCIAS["B1"])
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS))
+    parser.add_argument("--solvers", nargs="+", default=["gurobi"])
+    parser.add_argument("--time-limit", type=float, default=600.0)
+    parser.add_argument("--iteraciones", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--base", default="Instances")
+    args = parser.parse_args()
+
+    nombres = [os.path.basename(i) for i in args.instancias]
+    trabajos = expandir_trabajos(args.formulaciones, args.solvers, {"B1": nombres},
+                                 time_limit=args.time_limit, base=args.base)
+    filas = {}
+    for trabajo, metrics in ejecutar_en_paralelo(trabajos, workers=1):
+        filas.setdefault(trabajo["instancia"], []).append(metrics)
+
+    print("Instancia | Modelo | Objetivo | Tiempo (s)")
+    for trabajo in {t["instancia"]: t for t in trabajos}.values():
+        parsed_data = parse_file(trabajo["ruta"])
+        filas.setdefault(trabajo["instancia"], []).append(
+            get_metrics_descomposicion(parsed_data, "B1", trabajo["instancia"], iteraciones=args.iteraciones,
+                                       tiempo_limite=args.time_limit, workers=args.workers))
+        for metrics in filas[trabajo["instancia"]]:
+            print(f"{trabajo['instancia']} | {metrics['Modelo']} | {metrics['Valor Función Objetivo']} | "
+                  f"{metrics['Tiempo de Cómputo (s)']}")
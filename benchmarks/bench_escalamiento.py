@@ -0,0 +1,123 @@
+"""
+Suite de escalamiento: genera instancias sintéticas de tamaño creciente (generador.py) y mide,
+por formulación y solver, el tiempo de pared y el pico de RSS de las etapas parse, build,
+presolve y solve del pipeline (pipeline.py), comparando contra una línea base guardada.
+
+Cada medición corre en un proceso nuevo, así que el pico de RSS es sólo el de ese modelo. Una
+medición es una regresión si su tiempo o su memoria superan la línea base en más de la
+tolerancia relativa (y en más de un mínimo absoluto, para no marcar el ruido de las etapas
+cortas). Con regresiones el programa termina con código 1.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_escalamiento --tamanos 20x5 50x5 100x10 --time-limit 60 --guardar-linea-base
+    python -m benchmarks.bench_escalamiento --tamanos 20x5 50x5 100x10 --time-limit 60
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from generador import DISTRIBUCIONES, generar, tamano
+from pipeline import pipeline
+from runner import MODELOS, expandir_trabajos
+
+# Línea base por defecto
+LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base_escalamiento.json")
+
+# Etapas del pipeline que se comparan con la línea base
+ETAPAS = ["parse", "build", "presolve", "solve"]
+
+
+def medir_trabajo(trabajo):
+    """
+    Ejecuta un trabajo con el pipeline y retorna el objetivo, el estado y las mediciones por etapa.
+    """
+    metrics, _, registro = next(pipeline([trabajo]))
+    return {
+        "objetivo": registro["objetivo"],
+        "estado": registro["estado"],
+        "etapas": {e: {"wall": registro["etapas"][e]["wall"], "pico_rss_mib": registro["etapas"][e]["pico_rss_mib"]}
+                   for e in ETAPAS},
+    }
+
+
+def regresiones(actual, base, tolerancia=0.25, minimo_s=0.5, minimo_mib=50.0):
+    """
+    Compara una medición con la línea base.
+
+    Retorna:
+        list: Mensajes con cada etapa cuyo tiempo o pico de RSS empeoró más de lo tolerado.
+    """
+    mensajes = []
+    for etapa in ETAPAS:
+        a, b = actual["etapas"][etapa], base["etapas"][etapa]
+        if a["wall"] > b["wall"] * (1 + tolerancia) and a["wall"] - b["wall"] > minimo_s:
+            mensajes.append(f"{etapa}: {a['wall']:.2f} s (base {b['wall']:.2f} s)")
+        if a["pico_rss_mib"] > b["pico_rss_mib"] * (1 + tolerancia) and a["pico_rss_mib"] - b["pico_rss_mib"] > minimo_mib:
+            mensajes.append(f"{etapa}: {a['pico_rss_mib']:.0f} MiB (base {b['pico_rss_mib']:.0f} MiB)")
+    return mensajes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=tamano, nargs="+", default=[(20, 5), (50, 5), (100, 10), (200, 10)])
+    parser.add_argument("--semillas", type=int, nargs="+", default=[1])
+    parser.add_argument("--distribucion", choices=DISTRIBUCIONES, default="uniforme")
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS))
+    parser.add_argument("--solvers", nargs="+", default=["cplex", "gurobi"])
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--time-limit", type=float, default=60.0)
+    parser.add_argument("--ir", action="store_true")
+    parser.add_argument("--linea-base", default=LINEA_BASE)
+    parser.add_argument("--guardar-linea-base", action="store_true",
+                        help="guardar las mediciones como nueva línea base en vez de comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="empeoramiento relativo tolerado")
+    args = parser.parse_args(argv)
+
+    base = {}
+    if not args.guardar_linea_base and os.path.exists(args.linea_base):
+        with open(args.linea_base, encoding="utf-8") as file:
+            base = json.load(file)
+
+    mediciones, con_regresion = {}, []
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = generar(args.tamanos, args.semillas, os.path.join(directorio, "Benchmark_S"),
+                        distribucion=args.distribucion)
+        trabajos = expandir_trabajos(args.formulaciones, args.solvers, {"BS": [os.path.basename(r) for r in rutas]},
+                                     threads=args.threads, time_limit=args.time_limit, base=directorio, ir=args.ir)
+        print("Instancia | Formulación | Solver | " + " | ".join(f"{e} (s)" for e in ETAPAS)
+              + " | Pico RSS (MiB) | Objetivo | Regresiones")
+        for trabajo in trabajos:
+            clave = f"{trabajo['instancia']}/{trabajo['formulacion']}/{trabajo['solver']}{'/ir' if args.ir else ''}"
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                try:
+                    medicion = pool.submit(medir_trabajo, trabajo).result()
+                except Exception as error:
+                    print(f"{trabajo['instancia']} | {trabajo['formulacion']} | {trabajo['solver']} | "
+                          f"ERROR: {type(error).__name__}: {error}")
+                    continue
+            mediciones[clave] = medicion
+            mensajes = regresiones(medicion, base[clave], args.tolerancia) if clave in base else []
+            if mensajes:
+                con_regresion.append(clave)
+            etapas = medicion["etapas"]
+            print(f"{trabajo['instancia']} | {trabajo['formulacion']} | {trabajo['solver']} | "
+                  + " | ".join(f"{etapas[e]['wall']:.3f}" for e in ETAPAS)
+                  + f" | {max(etapas[e]['pico_rss_mib'] for e in ETAPAS):.1f} | {medicion['objetivo']} | "
+                  + ("; ".join(mensajes) if mensajes else ("-" if clave in base else "sin base")))
+
+    if args.guardar_linea_base:
+        with open(args.linea_base, 'w', encoding="utf-8") as file:
+            json.dump(mediciones, file, indent=1, sort_keys=True)
+        print(f"Línea base con {len(mediciones)} mediciones guardada en {args.linea_base}")
+    elif con_regresion:
+        print(f"{len(con_regresion)} mediciones con regresión: {', '.join(con_regresion)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
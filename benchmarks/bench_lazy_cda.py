@@ -0,0 +1,105 @@
+"""
+Benchmark del modo lazy de CDA: compara el modelo completo (con todas las restricciones
+path_elimination) contra la separación bajo demanda desde soluciones enteras y fraccionarias,
+en Gurobi y CPLEX. Reporta filas, tiempo de construcción y resolución, pico de RSS, objetivo,
+cortes agregados y tiempo de separación.
+
+Cada corrida se hace en un proceso nuevo para que el pico de RSS sea el de ese modelo.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_lazy_cda [--time-limit S] [--solvers gurobi cplex] instancia.dat [...]
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lazy_cda import estadisticas_cplex, resolver_lazy_gurobi
+from model import modelo_cda_cplex, modelo_cda_gurobi
+from testParser import parse_file
+
+MODOS = {
+    "completo": dict(lazy=False),
+    "lazy": dict(lazy=True),
+    "lazy+fraccional": dict(lazy=True, fraccional=True),
+}
+
+
+def _peak_rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def correr(file_path, solver, modo, time_limit):
+    """
+    Construye y resuelve el CDA de una instancia con un solver y modo, y retorna sus métricas.
+    """
+    parsed_data = parse_file(file_path)
+    opciones = MODOS[modo]
+
+    start_time = time.perf_counter()
+    if solver == "gurobi":
+        mdl = modelo_cda_gurobi(parsed_data, **opciones)
+        mdl.update()
+        restricciones = mdl.NumConstrs
+    else:
+        mdl = modelo_cda_cplex(parsed_data, **opciones)
+        restricciones = mdl.number_of_constraints
+    build_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    if solver == "gurobi":
+        mdl.Params.OutputFlag = 0
+        mdl.Params.TimeLimit = time_limit
+        if opciones["lazy"]:
+            stats = resolver_lazy_gurobi(mdl)
+        else:
+            mdl.optimize()
+            stats = {"cortes": 0, "tiempo_separacion": 0.0}
+        objetivo = mdl.ObjVal if mdl.SolCount > 0 else "N/A"
+    else:
+        mdl.parameters.timelimit = time_limit
+        solucion = mdl.solve()
+        stats = estadisticas_cplex(mdl)
+        objetivo = solucion.objective_value if solucion is not None else "N/A"
+    solve_time = time.perf_counter() - start_time
+
+    return {
+        "Instancia": os.path.basename(file_path),
+        "Solver": solver,
+        "Modo": modo,
+        "Restricciones": restricciones,
+        "Construcción (s)": build_time,
+        "Resolución (s)": solve_time,
+        "Pico RSS (MiB)": _peak_rss_mib(),
+        "Valor Función Objetivo": objetivo,
+        "Cortes": stats["cortes"],
+        "Separación (s)": stats["tiempo_separacion"],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="+")
+    parser.add_argument("--solvers", nargs="+", default=["gurobi", "cplex"])
+    parser.add_argument("--modos", nargs="+", default=list(MODOS))
+    parser.add_argument("--time-limit", type=float, default=600.0)
+    args = parser.parse_args()
+
+    columnas = ["Instancia", "Solver", "Modo", "Restricciones", "Construcción (s)", "Resolución (s)",
+                "Pico RSS (MiB)", "Valor Función Objetivo", "Cortes", "Separación (s)"]
+    print(" | ".join(columnas))
+
+    ctx = multiprocessing.get_context("spawn")
+    for file_path in args.instancias:
+        for solver in args.solvers:
+            for modo in args.modos:
+                with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                    try:
+                        metrics = pool.submit(correr, file_path, solver, modo, args.time_limit).result()
+                    except Exception as error:
+                        print(f"{os.path.basename(file_path)} | {solver} | {modo} | error: {error}")
+                        continue
+                print(" | ".join(f"{metrics[c]:.3f}" if isinstance(metrics[c], float) else str(metrics[c])
+                                 for c in columnas))
@@ -0,0 +1,94 @@
+"""
+Benchmark del MIP start heurístico: resuelve cada formulación con y sin la solución de la
+heurística constructiva como inicio y reporta el tiempo hasta el primer incumbente, el objetivo
+y el gap final.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_mip_start [--time-limit S] [--metodo savings|sweep] instancia.dat [...]
+"""
+import argparse
+import os
+import time
+
+from docplex.mp.progress import ProgressListener
+from gurobipy import GRB
+
+from heuristica import construir_solucion
+from mip_start import aplicar_inicio
+from runner import MODELOS
+from testParser import parse_file
+
+
+class _PrimerIncumbente(ProgressListener):
+    """
+    Listener de docplex que guarda el tiempo del primer incumbente.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.tiempo = None
+
+    def notify_progress(self, progress_data):
+        if self.tiempo is None and progress_data.has_incumbent:
+            self.tiempo = progress_data.time
+
+
+def resolver_gurobi(model, time_limit):
+    primer = {}
+
+    def callback(model, where):
+        if where == GRB.Callback.MIPSOL and "tiempo" not in primer:
+            primer["tiempo"] = model.cbGet(GRB.Callback.RUNTIME)
+
+    model.Params.OutputFlag = 0
+    model.Params.TimeLimit = time_limit
+    model.optimize(callback)
+    objetivo = model.ObjVal if model.SolCount > 0 else None
+    gap = model.MIPGap if model.SolCount > 0 else None
+    return primer.get("tiempo"), objetivo, gap
+
+
+def resolver_cplex(mdl, time_limit):
+    listener = _PrimerIncumbente()
+    mdl.add_progress_listener(listener)
+    mdl.parameters.timelimit = time_limit
+    solucion = mdl.solve()
+    if solucion is None:
+        return listener.tiempo, None, None
+    return listener.tiempo, solucion.objective_value, mdl.solve_details.mip_relative_gap
+
+
+RESOLVER = {"gurobi": resolver_gurobi, "cplex": resolver_cplex}
+
+
+def _fmt(valor):
+    return "N/A" if valor is None else f"{valor:.3f}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="+")
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS))
+    parser.add_argument("--solvers", nargs="+", default=["gurobi", "cplex"])
+    parser.add_argument("--metodo", default="savings", choices=["savings", "sweep"])
+    parser.add_argument("--time-limit", type=float, default=60.0)
+    args = parser.parse_args()
+
+    print("Instancia | Formulación | Solver | Inicio | Costo heurística | Heurística (s) | "
+          "Primer incumbente (s) | Objetivo | Gap")
+    for file_path in args.instancias:
+        parsed_data = parse_file(file_path)
+        start_time = time.perf_counter()
+        solucion = construir_solucion(parsed_data, args.metodo)
+        tiempo_heuristica = time.perf_counter() - start_time
+
+        for formulacion in args.formulaciones:
+            for solver in args.solvers:
+                for con_inicio in (False, True):
+                    model_instance = MODELOS[formulacion][solver](parsed_data)
+                    usada = aplicar_inicio(model_instance, formulacion, solver, parsed_data,
+                                           metodo=args.metodo) if con_inicio else solucion
+                    primer, objetivo, gap = RESOLVER[solver](model_instance, args.time_limit)
+                    print(f"{os.path.basename(file_path)} | {formulacion} | {solver} | "
+                          f"{'sí' if con_inicio else 'no'} | {usada['costo']:.3f} | {tiempo_heuristica:.4f} | "
+                          f"{_fmt(primer)} | {_fmt(objetivo)} | {_fmt(gap)}")
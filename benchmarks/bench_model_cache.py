@@ -0,0 +1,80 @@
+"""
+Benchmark del caché de modelos: tiempo de construcción en Python contra tiempo de lectura del MPS
+comprimido, por formulación, solver y constructor (original o IR de representacion.py).
+
+Cada medición corre en un proceso nuevo para que la construcción anterior no deje memoria ni
+entornos del solver abiertos.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_model_cache [--ir] [instancia.dat ...]
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from model_cache import load_model
+from pipeline import liberar_modelo
+from representacion import construir_modelo_ir
+from runner import MODELOS
+from testParser import parse_file
+
+# Instancias de 100 y 200 clientes del benchmark 1
+INSTANCIAS = ["Instances/Benchmark_1/coord100-5-1.dat", "Instances/Benchmark_1/coord100-10-1.dat",
+              "Instances/Benchmark_1/coord200-10-1.dat"]
+
+
+def _tamano(model_instance, solver):
+    if solver == 'gurobi':
+        model_instance.update()
+        return model_instance.NumVars, model_instance.NumConstrs
+    return model_instance.number_of_variables, model_instance.number_of_constraints
+
+
+def medir_carga(file_path, formulacion, solver, ir, cache_dir):
+    """
+    Carga un modelo con load_model y retorna el tiempo, su tamaño y si vino del caché.
+    """
+    parsed_data = parse_file(file_path)
+    if ir:
+        constructor = construir_modelo_ir
+        build = lambda: construir_modelo_ir(formulacion, solver, parsed_data)
+    else:
+        constructor = MODELOS[formulacion][solver]
+        build = lambda: constructor(parsed_data)
+    start_time = time.perf_counter()
+    model_instance, desde_cache = load_model(file_path, formulacion, solver, constructor, build, ir=ir,
+                                             cache_dir=cache_dir)
+    tamano = _tamano(model_instance, solver)
+    tiempo = time.perf_counter() - start_time
+    liberar_modelo(model_instance, solver)
+    return tiempo, tamano, desde_cache
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="*", default=INSTANCIAS)
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS))
+    parser.add_argument("--solvers", nargs="+", default=["gurobi", "cplex"])
+    parser.add_argument("--ir", action="store_true", help="usar los constructores de representacion.py")
+    args = parser.parse_args()
+
+    print("Instancia | Formulación | Solver | Variables | Restricciones | Construcción + escritura (s) | "
+          "Lectura (s) | Aceleración")
+    ctx = multiprocessing.get_context("spawn")
+    for file_path in args.instancias:
+        for formulacion in args.formulaciones:
+            for solver in args.solvers:
+                # Caché vacío por medición: con --ir la entrada se comparte entre solvers
+                tiempos = []
+                with tempfile.TemporaryDirectory() as cache_dir:
+                    for _ in range(2):
+                        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                            tiempos.append(pool.submit(medir_carga, file_path, formulacion, solver, args.ir,
+                                                       cache_dir).result())
+                (construccion, tamano, _), (lectura, _, desde_cache) = tiempos
+                aceleracion = f"{construccion / lectura:.1f}x" if desde_cache else "N/A"
+                print(f"{os.path.basename(file_path)} | {formulacion} | {solver} | {tamano[0]} | {tamano[1]} | "
+                      f"{construccion:.3f} | {lectura:.3f} | {aceleracion}")
@@ -0,0 +1,57 @@
+"""
+Benchmark del parser: compara tiempo y memoria de parse_file con listas (camino original)
+contra parse_file(as_arrays=True) en float64 y float32.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_parser [directorio] [repeticiones]
+"""
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from testParser import parse_file
+
+MODOS = {
+    "listas": dict(as_arrays=False),
+    "numpy-f64": dict(as_arrays=True, dtype=np.float64),
+    "numpy-f32": dict(as_arrays=True, dtype=np.float32),
+}
+
+
+def medir(file_path, repeticiones, **kwargs):
+    """
+    Mide el tiempo medio de parseo y la memoria asignada por una llamada a parse_file.
+
+    Retorna:
+        tuple: (tiempo medio en segundos, memoria retenida por el resultado en bytes,
+                pico de memoria durante el parseo en bytes)
+    """
+    start_time = time.perf_counter()
+    for _ in range(repeticiones):
+        parse_file(file_path, **kwargs)
+    tiempo = (time.perf_counter() - start_time) / repeticiones
+
+    tracemalloc.start()
+    data = parse_file(file_path, **kwargs)
+    retenida, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return tiempo, retenida, pico
+
+
+if __name__ == "__main__":
+    directorio = sys.argv[1] if len(sys.argv) > 1 else "Instances/Benchmark_1"
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print(f"{'Instancia':<22}" + "".join(f"{modo + ' ms':>14}{modo + ' KiB':>15}{modo + ' pico':>16}"
+                                         for modo in MODOS))
+    for file_path in sorted(glob.glob(os.path.join(directorio, "*.dat"))):
+        fila = f"{os.path.basename(file_path):<22}"
+        for kwargs in MODOS.values():
+            tiempo, retenida, pico = medir(file_path, repeticiones, **kwargs)
+            fila += f"{tiempo * 1e3:>14.3f}{retenida / 1024:>15.1f}{pico / 1024:>16.1f}"
+        print(fila)
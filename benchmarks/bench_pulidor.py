@@ -0,0 +1,105 @@
+"""
+Benchmark del pulidor de incumbentes (pulidor.py): compara, con y sin pulido en el callback, el
+objetivo y la cota al límite de tiempo, el tiempo de resolución y las estadísticas del pulidor
+(incumbentes pulidos, soluciones mejoradas inyectadas, ahorro total y tiempo de búsqueda local).
+Cada corrida se hace en un proceso nuevo. En las formulaciones que el pulidor omite (CDA, ver
+pulidor.FORMULACIONES_PULIBLES) la fila lo indica en vez de sus estadísticas.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_pulidor [--time-limit S] [--solvers gurobi cplex] [--modelos SCF CDA]
+        [--tiempo-pulido S] [--ir] instancia.dat [...]
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pulidor import configurar_pulidor_cplex, configurar_pulidor_gurobi, nuevas_estadisticas, resolver_pulido_gurobi
+from representacion import construir_modelo_ir
+from runner import MODELOS
+from testParser import parse_file
+
+
+def correr(file_path, formulacion, solver, pulir, time_limit, tiempo_pulido, ir=False):
+    """
+    Construye y resuelve una instancia y retorna objetivo, cota, tiempo y estadísticas del pulidor.
+    """
+    parsed_data = parse_file(file_path)
+    mdl = construir_modelo_ir(formulacion, solver, parsed_data) if ir else MODELOS[formulacion][solver](parsed_data)
+    nombres = 'gurobi' if ir else None
+    stats = nuevas_estadisticas()
+
+    start_time = time.perf_counter()
+    if solver == "gurobi":
+        mdl.Params.OutputFlag = 0
+        mdl.Params.TimeLimit = time_limit
+        if pulir:
+            configurar_pulidor_gurobi(mdl, parsed_data, formulacion, nombres=nombres, tiempo_max=tiempo_pulido)
+            stats = resolver_pulido_gurobi(mdl)
+        else:
+            mdl.optimize()
+        cota = mdl.ObjBound
+        objetivo = mdl.ObjVal if mdl.SolCount > 0 else None
+        mdl.dispose()
+    else:
+        mdl.parameters.timelimit = time_limit
+        if pulir:
+            configurar_pulidor_cplex(mdl, parsed_data, formulacion, nombres=nombres, tiempo_max=tiempo_pulido)
+        solucion = mdl.solve()
+        stats = mdl._pulidor["stats"] if pulir else stats
+        cota = mdl.solve_details.best_bound
+        objetivo = solucion.objective_value if solucion is not None else None
+        mdl.end()
+    return {"objetivo": objetivo, "cota": cota, "tiempo": time.perf_counter() - start_time, **stats}
+
+
+def _formato(valor, patron):
+    return "N/A" if valor is None else format(valor, patron)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="*")
+    parser.add_argument("--solvers", nargs="+", default=["gurobi", "cplex"])
+    parser.add_argument("--modelos", nargs="+", default=["SCF"])
+    parser.add_argument("--time-limit", type=float, default=60.0)
+    parser.add_argument("--tiempo-pulido", type=float, default=0.5, help="segundos de búsqueda local por incumbente")
+    parser.add_argument("--ir", action="store_true", help="construir los modelos desde representacion.py")
+    args = parser.parse_args()
+    # --solvers y --modelos consumen todos los valores que les siguen: los que no son un solver o un
+    # modelo son las instancias escritas después de la opción
+    for opcion, validos in (("solvers", ("gurobi", "cplex")), ("modelos", MODELOS)):
+        valores = getattr(args, opcion)
+        args.instancias += [valor for valor in valores if valor not in validos]
+        setattr(args, opcion, [valor for valor in valores if valor in validos])
+    if not args.instancias:
+        parser.error("se necesita al menos una instancia")
+
+    print("Instancia | Modelo | Solver | Objetivo | Objetivo pulido | Cota | Cota pulida | Tiempo (s) | "
+          "Tiempo pulido (s) | Incumbentes | Mejoras | Ahorro | Búsqueda local (s)")
+
+    ctx = multiprocessing.get_context("spawn")
+    for file_path in args.instancias:
+        for formulacion in args.modelos:
+            for solver in args.solvers:
+                corridas = {}
+                try:
+                    for pulir in (False, True):
+                        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                            corridas[pulir] = pool.submit(correr, file_path, formulacion, solver, pulir, args.time_limit,
+                                                          args.tiempo_pulido, args.ir).result()
+                except Exception as error:
+                    print(f"{os.path.basename(file_path)} | {formulacion} | {solver} | error: {error}")
+                    continue
+
+                base, pulida = corridas[False], corridas[True]
+                if pulida["omitido"] is not None:
+                    estadisticas = f"pulidor omitido: {pulida['omitido']}"
+                else:
+                    estadisticas = (f"{pulida['llamadas']} | {pulida['mejoras']} | {pulida['ahorro']:.2f} | "
+                                    f"{pulida['tiempo_pulido']:.3f}")
+                print(f"{os.path.basename(file_path)} | {formulacion} | {solver} | "
+                      f"{_formato(base['objetivo'], '.2f')} | {_formato(pulida['objetivo'], '.2f')} | "
+                      f"{base['cota']:.2f} | {pulida['cota']:.2f} | {base['tiempo']:.2f} | {pulida['tiempo']:.2f} | "
+                      + estadisticas)
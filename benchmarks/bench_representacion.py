@@ -0,0 +1,72 @@
+"""
+Benchmark de la representación intermedia: compara el tiempo de construcción de los constructores
+originales con el de la IR cargada en cada solver y, con --resolver, verifica que Gurobi y CPLEX
+lleguen al mismo objetivo sobre el modelo de la IR.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_representacion [--resolver] [--time-limit S] instancia.dat [...]
+"""
+import argparse
+import os
+import time
+
+from pipeline import liberar_modelo
+from representacion import construir_modelo_ir
+from runner import GET_METRICS, MODELOS
+from testParser import parse_file
+
+
+def _tamano(model_instance, solver):
+    if solver == 'gurobi':
+        model_instance.update()
+        return model_instance.NumVars, model_instance.NumConstrs
+    return model_instance.number_of_variables, model_instance.number_of_constraints
+
+
+def medir(file_path, formulacion, solver, resolver=False, time_limit=None):
+    """
+    Construye la formulación con el constructor original y con la IR en un solver.
+
+    Retorna:
+        dict: Tamaño y tiempo de construcción de ambos modelos y, si resolver es True, el objetivo
+            del modelo de la IR.
+    """
+    parsed_data = parse_file(file_path)
+    fila = {}
+    for clave, constructor in (("original", MODELOS[formulacion][solver]),
+                               ("ir", lambda p: construir_modelo_ir(formulacion, solver, p))):
+        start_time = time.perf_counter()
+        model_instance = constructor(parsed_data)
+        tamano = _tamano(model_instance, solver)
+        fila[f"build_{clave}"] = time.perf_counter() - start_time
+        fila[f"tamano_{clave}"] = tamano
+        if resolver and clave == "ir":
+            metrics = GET_METRICS[solver](model_instance, "", os.path.basename(file_path), time_limit=time_limit)
+            fila["objetivo"] = metrics["Valor Función Objetivo"]
+        liberar_modelo(model_instance, solver)
+    return fila
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="+")
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS))
+    parser.add_argument("--resolver", action="store_true", help="resolver el modelo de la IR en ambos solvers")
+    parser.add_argument("--time-limit", type=float, default=None)
+    args = parser.parse_args()
+
+    print("Instancia | Formulación | Solver | Tamaño original | Tamaño IR | Build original (s) | "
+          "Build IR (s) | Objetivo IR")
+    for file_path in args.instancias:
+        for formulacion in args.formulaciones:
+            objetivos = {}
+            for solver in ("gurobi", "cplex"):
+                fila = medir(file_path, formulacion, solver, args.resolver, args.time_limit)
+                objetivos[solver] = fila.get("objetivo", "N/A")
+                print(f"{os.path.basename(file_path)} | {formulacion} | {solver} | {fila['tamano_original']} | "
+                      f"{fila['tamano_ir']} | {fila['build_original']:.3f} | {fila['build_ir']:.3f} | "
+                      f"{objetivos[solver]}")
+            if args.resolver and all(isinstance(o, float) for o in objetivos.values()):
+                diferencia = abs(objetivos["gurobi"] - objetivos["cplex"]) / max(1.0, abs(objetivos["gurobi"]))
+                print(f"  Gurobi y CPLEX {'coinciden' if diferencia <= 1e-6 else 'NO coinciden'} "
+                      f"(diferencia relativa {diferencia:.2e})")
@@ -0,0 +1,340 @@
+"""
+Modo carrera: resuelve una misma instancia con varias combinaciones de formulación y solver (y el
+ALNS) en paralelo y se queda con la primera que gana.
+
+Cada corredor es un proceso. Todos parten del MIP start de la heurística constructiva y reportan
+sus incumbentes al coordinador; los incumbentes que pueden traducirse a rutas (ver
+mip_start.solucion_desde_valores) se reenvían a los demás corredores:
+    - Gurobi los inyecta durante la búsqueda con cbSetSolution,
+    - el ALNS continúa desde ellos si son factibles y mejores,
+    - CPLEX (docplex) sólo los recibe como MIP start al partir, porque docplex no permite
+      inyectar soluciones durante la resolución.
+
+Los corredores se comparan por el costo real de sus soluciones decodificadas y verificadas (ver
+verificador.verificar), no por el objetivo de cada modelo: las formulaciones no tienen objetivos
+comparables (en CDA el objetivo no corresponde necesariamente a rutas factibles). Los incumbentes
+que no se pueden traducir a rutas factibles se ignoran.
+
+La carrera termina cuando un corredor prueba optimalidad o cuando se agota el presupuesto de tiempo
+compartido; en ambos casos gana el corredor con la mejor solución verificada y los demás corredores
+se cancelan. Un corredor prueba optimalidad si termina en óptimo, su solución se verifica factible,
+su costo verificado no supera la cota del modelo (ObjBound, con tolerancia TOL_OPTIMO) y ninguna
+otra solución verificada es mejor: el estado óptimo del modelo no basta, porque el costo verificado
+puede diferir del objetivo (las rutas se cierran en su depósito de origen).
+
+Uso (desde la raíz del repositorio):
+    python carrera.py Instances/Benchmark_1/coord50-5-1.dat --corredores SCF/gurobi SCF/cplex/ir ALNS \\
+        --presupuesto 300 --salida results.csv
+"""
+import argparse
+import multiprocessing
+import os
+import queue
+import time
+
+from docplex.mp.progress import SolutionListener
+from gurobipy import GRB
+
+from alns import alns
+from heuristica import construir_solucion, costo_solucion
+from mip_start import VALORES_INICIO, aplicar_inicio, solucion_desde_valores
+from pipeline import extraer_solucion
+from runner import GET_METRICS, abrir_csv, construir_modelo
+from testParser import parse_file
+from verificador import verificar
+
+# Corredores por defecto: las soluciones de CDA no tienen arcos x y no se traducen a rutas, así que
+# sus corredores nunca tienen una solución verificada que comparar; SCF en CPLEX se construye con
+# representacion.py (/ir), el mismo modelo que en Gurobi, porque modelo_scf_cplex prohíbe los arcos
+# entre clientes y resulta infactible
+CORREDORES = ["SCF/gurobi", "SCF/cplex/ir", "ALNS"]
+
+# Tolerancia relativa (la MIPGap por defecto) para aceptar que el costo verificado alcanza la cota
+# del modelo
+TOL_OPTIMO = 1e-4
+
+# Estados de docplex que prueban optimalidad
+ESTADOS_OPTIMOS_CPLEX = ("integer optimal solution", "integer optimal, tolerance", "optimal")
+
+
+def configuracion(texto):
+    """
+    Interpreta un corredor "FORMULACION/solver[/ir]" o "ALNS".
+    """
+    if texto.upper() == "ALNS":
+        return {"nombre": "ALNS", "formulacion": None, "solver": None, "ir": False}
+    partes = texto.split("/")
+    if len(partes) not in (2, 3) or partes[1] not in ("gurobi", "cplex") or partes[2:] not in ([], ["ir"]):
+        raise ValueError(f"Corredor inválido: {texto} (se espera FORMULACION/solver[/ir] o ALNS)")
+    return {"nombre": texto, "formulacion": partes[0], "solver": partes[1], "ir": len(partes) == 3}
+
+
+def _ultima(cola):
+    """
+    Vacía la cola sin bloquear y retorna la mejor solución recibida (o None).
+    """
+    mejor = None
+    while True:
+        try:
+            solucion = cola.get_nowait()
+        except queue.Empty:
+            return mejor
+        if mejor is None or solucion["costo"] < mejor["costo"]:
+            mejor = solucion
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Corredores +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def _callback_carrera_gurobi(model, where):
+    """
+    Reporta los incumbentes de Gurobi e inyecta los de los otros corredores.
+    """
+    carrera = model._carrera
+    if where == GRB.Callback.MIPSOL:
+        objetivo = model.cbGet(GRB.Callback.MIPSOL_OBJ)
+        valores = dict(zip(carrera["nombres"], model.cbGetSolution(carrera["variables"])))
+        solucion = solucion_desde_valores(carrera["parsed_data"], carrera["formulacion"],
+                                          {k: v for k, v in valores.items() if abs(v) > 1e-9}, carrera["formato"])
+        if solucion is not None:
+            solucion["costo"] = costo_solucion(carrera["parsed_data"], solucion)
+            carrera["costo"] = min(carrera["costo"], solucion["costo"])
+        carrera["salida"].put(("incumbente", carrera["nombre"], objetivo, solucion))
+    elif where == GRB.Callback.MIPNODE and model.cbGet(GRB.Callback.MIPNODE_STATUS) == GRB.OPTIMAL:
+        externa = _ultima(carrera["entrada"])
+        if externa is not None and externa["costo"] < carrera["costo"] - 1e-6:
+            valores = VALORES_INICIO[carrera["formulacion"]](carrera["parsed_data"], externa, carrera["formato"])
+            model.cbSetSolution(carrera["variables"], [valores.get(nombre, 0.0) for nombre in carrera["nombres"]])
+            model.cbUseSolution()
+            carrera["costo"] = externa["costo"]
+
+
+class _ListenerCarrera(SolutionListener):
+    """
+    Reporta los incumbentes de CPLEX al coordinador.
+    """
+
+    def __init__(self, carrera):
+        super().__init__()
+        self.carrera = carrera
+        self.ultimo = None
+
+    def notify_solution(self, sol):
+        objetivo = sol.objective_value
+        if self.ultimo is not None and objetivo >= self.ultimo - 1e-9:
+            return
+        self.ultimo = objetivo
+        carrera = self.carrera
+        valores = {var.name: valor for var, valor in sol.iter_var_values() if abs(valor) > 1e-9}
+        solucion = solucion_desde_valores(carrera["parsed_data"], carrera["formulacion"], valores, carrera["formato"])
+        if solucion is not None:
+            solucion["costo"] = costo_solucion(carrera["parsed_data"], solucion)
+        carrera["salida"].put(("incumbente", carrera["nombre"], objetivo, solucion))
+
+
+def _optimo(metrics, solver):
+    if solver == 'gurobi':
+        return metrics["estado"] == "OPTIMAL"
+    return metrics["estado"] in ESTADOS_OPTIMOS_CPLEX
+
+
+def _correr_mip(config, parsed_data, inicial, fin, threads, salida, entrada):
+    solver, formulacion = config["solver"], config["formulacion"]
+    trabajo = {"formulacion": formulacion, "solver": solver, "ir": config["ir"], "k_vecinos": None,
+               "mip_start": None}
+    model_instance = construir_modelo(trabajo, parsed_data)
+    formato = 'gurobi' if config["ir"] else solver
+    externa = _ultima(entrada)
+    aplicar_inicio(model_instance, formulacion, solver, parsed_data,
+                   solucion=externa if externa is not None and externa["costo"] < inicial["costo"] else inicial,
+                   nombres=formato)
+    carrera = {"nombre": config["nombre"], "formulacion": formulacion, "formato": formato, "parsed_data": parsed_data,
+               "costo": inicial["costo"], "salida": salida, "entrada": entrada}
+
+    tiempo = max(1.0, fin - time.time())
+    if solver == 'gurobi':
+        model_instance.update()
+        carrera["variables"] = model_instance.getVars()
+        carrera["nombres"] = model_instance.getAttr("VarName", carrera["variables"])
+        model_instance._carrera = carrera
+        metrics = GET_METRICS[solver](model_instance, "", "", threads=threads, time_limit=tiempo,
+                                      callback=_callback_carrera_gurobi)
+    else:
+        model_instance.add_progress_listener(_ListenerCarrera(carrera))
+        metrics = GET_METRICS[solver](model_instance, "", "", threads=threads, time_limit=tiempo)
+    metrics["optimo"] = _optimo(metrics, solver)
+    solucion = solucion_desde_valores(parsed_data, formulacion, extraer_solucion(model_instance, solver), formato)
+    return metrics, solucion
+
+
+def _correr_alns(config, parsed_data, fin, salida, entrada):
+    start_time = time.time()
+    solucion = alns(parsed_data, iteraciones=10 ** 9, tiempo_limite=max(0.0, fin - start_time),
+                    al_mejorar=lambda s: salida.put(("incumbente", config["nombre"], s["costo"], s)),
+                    importar=lambda: _ultima(entrada))
+    metrics = {"Modelo": "ALNS", "Número de Variables": "N/A", "Número de Restricciones": "N/A",
+               "Valor Función Objetivo": solucion["costo"], "Tiempo de Cómputo (s)": time.time() - start_time,
+               "estado": "heuristica", "optimo": False}
+    return metrics, solucion
+
+
+def _proceso_corredor(config, parsed_data, inicial, fin, threads, salida, entrada):
+    try:
+        if config["solver"] is None:
+            metrics, solucion = _correr_alns(config, parsed_data, fin, salida, entrada)
+        else:
+            metrics, solucion = _correr_mip(config, parsed_data, inicial, fin, threads, salida, entrada)
+        salida.put(("fin", config["nombre"], metrics, solucion))
+    except Exception as error:
+        salida.put(("error", config["nombre"], f"{type(error).__name__}: {error}", None))
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Coordinador +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def _costo_verificado(parsed_data, solucion):
+    """
+    Costo real de una solución reportada por un corredor, o None si no hay solución o no es factible.
+    """
+    if solucion is None:
+        return None
+    resultado = verificar(parsed_data, solucion)
+    return resultado["costo"] if resultado["factible"] else None
+
+
+def carrera(parsed_data, corredores=None, presupuesto=300.0, threads=None, gracia=10.0):
+    """
+    Corre los corredores en paralelo sobre la instancia y retorna el ganador.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        corredores (list): Corredores "FORMULACION/solver[/ir]" o "ALNS" (por defecto CORREDORES).
+        presupuesto (float): Tiempo total de la carrera en segundos; cada corredor recibe como
+            límite el tiempo que queda al terminar de construir su modelo.
+        threads (int): Hilos por corredor (por defecto los núcleos repartidos entre corredores).
+        gracia (float): Segundos extra sobre el presupuesto antes de cancelar a los corredores.
+
+    Retorna:
+        dict: "ganador" (corredor), "motivo" ("optimo", "presupuesto" o "terminaron"), "objetivo"
+            (costo verificado de la solución ganadora), "tiempo", "solucion" (formato de heuristica)
+            y "corredores" (estado final, objetivo del modelo, costo verificado y tiempo de cada uno).
+    """
+    configuraciones = [configuracion(c) for c in (corredores or CORREDORES)]
+    threads = threads or max(1, (os.cpu_count() or 1) // len(configuraciones))
+    start_time = time.perf_counter()
+    inicial = construir_solucion(parsed_data)
+
+    fin = time.time() + presupuesto
+    ctx = multiprocessing.get_context("spawn")
+    salida = ctx.Queue()
+    entradas = {c["nombre"]: ctx.Queue() for c in configuraciones}
+    procesos = {
+        c["nombre"]: ctx.Process(target=_proceso_corredor,
+                                 args=(c, parsed_data, inicial, fin, threads, salida, entradas[c["nombre"]]),
+                                 daemon=True)
+        for c in configuraciones
+    }
+    for proceso in procesos.values():
+        proceso.start()
+
+    mejor = {"corredor": "inicial", "objetivo": inicial["costo"], "solucion": inicial, "tiempo": 0.0}
+    compartida = inicial["costo"]
+    resumen = {nombre: {"estado": "cancelado", "objetivo": None, "costo": None, "tiempo": None}
+               for nombre in procesos}
+    motivo, pendientes = "presupuesto", set(procesos)
+    try:
+        while pendientes:
+            restante = presupuesto + gracia - (time.perf_counter() - start_time)
+            if restante <= 0:
+                break
+            try:
+                tipo, nombre, dato, solucion = salida.get(timeout=min(restante, 1.0))
+            except queue.Empty:
+                continue
+            ahora = time.perf_counter() - start_time
+
+            if tipo == "incumbente":
+                costo = _costo_verificado(parsed_data, solucion)
+                if costo is None:
+                    continue
+                if costo < mejor["objetivo"] - 1e-9:
+                    mejor = {"corredor": nombre, "objetivo": costo, "solucion": solucion, "tiempo": ahora}
+                if solucion["costo"] < compartida - 1e-6:
+                    compartida = solucion["costo"]
+                    for otro, entrada in entradas.items():
+                        if otro != nombre and otro in pendientes:
+                            entrada.put(solucion)
+                continue
+
+            pendientes.discard(nombre)
+            if tipo == "error":
+                resumen[nombre] = {"estado": "ERROR", "objetivo": None, "costo": None, "tiempo": ahora, "error": dato}
+                continue
+            costo = _costo_verificado(parsed_data, solucion)
+            resumen[nombre] = {"estado": dato["estado"], "objetivo": dato["Valor Función Objetivo"],
+                               "costo": costo, "tiempo": ahora}
+            if costo is None:
+                continue
+            if costo < mejor["objetivo"] - 1e-9:
+                mejor = {"corredor": nombre, "objetivo": costo, "solucion": solucion, "tiempo": ahora}
+            # Un óptimo del modelo sólo termina la carrera si la cota del modelo alcanza el costo
+            # verificado y ninguna otra solución verificada es mejor
+            tol = TOL_OPTIMO * max(1.0, abs(costo))
+            if (dato["optimo"] and dato.get("cota") is not None and costo <= dato["cota"] + tol
+                    and costo <= mejor["objetivo"] + tol):
+                motivo = "optimo"
+                break
+        else:
+            motivo = "terminaron"
+    finally:
+        for proceso in procesos.values():
+            if proceso.is_alive():
+                proceso.terminate()
+        for proceso in procesos.values():
+            proceso.join()
+
+    return {
+        "ganador": mejor["corredor"],
+        "motivo": motivo,
+        "objetivo": mejor["objetivo"],
+        "tiempo": time.perf_counter() - start_time,
+        "tiempo_ganador": mejor["tiempo"],
+        "solucion": mejor["solucion"],
+        "corredores": resumen,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancias", nargs="+")
+    parser.add_argument("--corredores", nargs="+", default=CORREDORES)
+    parser.add_argument("--presupuesto", type=float, default=300.0, help="tiempo total de la carrera (s)")
+    parser.add_argument("--threads", type=int, default=None, help="hilos por corredor")
+    parser.add_argument("--salida", default=None, help="CSV donde agregar el resultado (opcional)")
+    args = parser.parse_args(argv)
+
+    file, writer = abrir_csv(args.salida) if args.salida else (None, None)
+    try:
+        for file_path in args.instancias:
+            resultado = carrera(parse_file(file_path), args.corredores, args.presupuesto, args.threads)
+            nombre = os.path.basename(file_path)
+            print(f"{nombre}: gana {resultado['ganador']} ({resultado['motivo']}) con objetivo "
+                  f"{resultado['objetivo']} a los {resultado['tiempo_ganador']:.2f} s")
+            for corredor, estado in resultado["corredores"].items():
+                print(f"  {corredor} | {estado['estado']} | {estado['objetivo']} | {estado['costo']} | {estado['tiempo']}")
+            if writer is not None:
+                writer.writerow({
+                    "Modelo": f"Carrera[{resultado['ganador']}]",
+                    "Benchmark": os.path.basename(os.path.dirname(file_path)),
+                    "Instancia": nombre,
+                    "Número de Variables": "N/A",
+                    "Número de Restricciones": "N/A",
+                    "Valor Función Objetivo": resultado["objetivo"],
+                    "Tiempo de Cómputo (s)": resultado["tiempo"],
+                })
+                file.flush()
+    finally:
+        if file is not None:
+            file.close()
+
+
+if __name__ == "__main__":
+    main()
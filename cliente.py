@@ -0,0 +1,122 @@
+"""
+Cliente del servidor de resoluciones (servidor.py).
+
+Envía un trabajo (instancia, formulación, solver y parámetros), muestra el progreso del
+incumbente y la cota a medida que llega y al final imprime las métricas. Si el servidor no está
+corriendo, el trabajo se resuelve en este mismo proceso (sin el ahorro del arranque en caliente),
+en un hilo aparte para mostrar el progreso a medida que llega, igual que con el servidor.
+
+Uso (desde la raíz del repositorio):
+    python cliente.py Instances/Benchmark_1/coord20-5-1.dat --formulacion CDA --solver gurobi --time-limit 60
+    python cliente.py --estado
+    python cliente.py --apagar
+"""
+import argparse
+import json
+import os
+import queue
+import socket
+import threading
+
+from resultados import COLUMNAS
+from servidor import SOCKET
+
+
+def pedir(pedido, ruta_socket=SOCKET):
+    """
+    Envía un pedido al servidor y entrega sus respuestas a medida que llegan.
+
+    Retorna:
+        generator: Mensajes del servidor (diccionarios con la llave "tipo"); termina con el
+            resultado, el error o la respuesta al comando.
+
+    Lanza:
+        OSError: Si el servidor no está escuchando en ruta_socket.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexion:
+        conexion.connect(ruta_socket)
+        conexion.sendall((json.dumps(pedido) + "\n").encode())
+        with conexion.makefile(encoding="utf-8") as lineas:
+            for linea in lineas:
+                mensaje = json.loads(linea)
+                yield mensaje
+                if mensaje["tipo"] not in ("aceptado", "progreso"):
+                    return
+
+
+def resolver(pedido, ruta_socket=SOCKET):
+    """
+    Resuelve un pedido en el servidor o, si no hay servidor, en este proceso.
+
+    Retorna:
+        generator: Mensajes con el mismo formato que los del servidor.
+    """
+    try:
+        yield from pedir(pedido, ruta_socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        from servidor import resolver_pedido
+
+        # Como en el servidor, el solver corre en otro hilo y el progreso llega por una cola
+        mensajes = queue.Queue()
+
+        def trabajar():
+            try:
+                metrics = resolver_pedido(pedido, al_progreso=lambda punto: mensajes.put({"tipo": "progreso", **punto}))
+                mensajes.put({"tipo": "resultado", "metricas": metrics, "local": True})
+            except Exception as error:
+                mensajes.put({"tipo": "error", "mensaje": f"{type(error).__name__}: {error}"})
+
+        hilo = threading.Thread(target=trabajar, name="solver", daemon=True)
+        hilo.start()
+        while True:
+            mensaje = mensajes.get()
+            yield mensaje
+            if mensaje["tipo"] != "progreso":
+                break
+        hilo.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancia", nargs="?")
+    parser.add_argument("--formulacion", choices=["SCF", "CDA"], default="SCF")
+    parser.add_argument("--solver", choices=["cplex", "gurobi"], default="gurobi")
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--mip-start", choices=["savings", "sweep"], default=None)
+    parser.add_argument("--k-vecinos", type=int, default=None)
+    parser.add_argument("--ir", action="store_true")
+    parser.add_argument("--fijacion", action="store_true")
+    parser.add_argument("--socket", default=SOCKET)
+    parser.add_argument("--estado", action="store_true", help="consultar el estado del servidor")
+    parser.add_argument("--apagar", action="store_true", help="detener el servidor")
+    args = parser.parse_args(argv)
+
+    if args.estado or args.apagar:
+        try:
+            for mensaje in pedir({"comando": "estado" if args.estado else "apagar"}, args.socket):
+                print(mensaje)
+        except (FileNotFoundError, ConnectionRefusedError):
+            print(f"No hay un servidor escuchando en {args.socket}")
+        return
+    if args.instancia is None:
+        parser.error("falta la instancia")
+
+    pedido = {"instancia": os.path.abspath(args.instancia), "formulacion": args.formulacion, "solver": args.solver,
+              "parametros": {"threads": args.threads, "time_limit": args.time_limit, "mip_start": args.mip_start,
+                             "k_vecinos": args.k_vecinos, "ir": args.ir,
+                             "fijacion": args.fijacion}}
+    for mensaje in resolver(pedido, args.socket):
+        if mensaje["tipo"] == "progreso":
+            print(f"{mensaje['t']:8.2f} s | incumbente {mensaje['incumbente']} | cota {mensaje['cota']}")
+        elif mensaje["tipo"] == "resultado":
+            metrics = mensaje["metricas"]
+            print({c: metrics[c] for c in COLUMNAS})
+            print(f"Estado: {metrics.get('estado')}, gap: {metrics.get('gap')}, factible: {metrics.get('factible')}"
+                  + (" (resuelto sin servidor)" if mensaje.get("local") else ""))
+        elif mensaje["tipo"] == "error":
+            print(f"Error: {mensaje['mensaje']}")
+
+
+if __name__ == "__main__":
+    main()
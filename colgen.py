@@ -0,0 +1,502 @@
+"""
+Generación de columnas para el problema de localización-ruteo (formulación "CG").
+
+Maestro: partición de conjuntos sobre rutas que salen y vuelven a un depósito, más variables y
+de apertura de depósitos:
+
+    min   sum_d f_d y_d + sum_r c_r λ_r
+    s.a.  sum_r a_ir λ_r = 1                        para cada cliente i    (duales π_i)
+          sum_{r de d} q_r λ_r - Q_d y_d <= 0       para cada depósito d   (duales μ_d <= 0)
+          0 <= λ, y <= 1
+
+donde c_r es route_opening_cost más la distancia de la ruta, a_ir las visitas de r a i y q_r su
+carga. El maestro restringido se resuelve como LP con Gurobi o CPLEX y la tarificación busca, para
+cada depósito, rutas de costo reducido c_r - sum_i a_ir π_i - q_r μ_d negativo con un algoritmo de
+etiquetas sobre ng-rutas: cada etiqueta guarda costo reducido, carga y la memoria ng (clientes de
+la vecindad ng del nodo actual que no se pueden revisitar) como máscara de bits. Las extensiones y
+la dominancia (costo, carga y memoria ⊆) se evalúan vectorizadas con NumPy. Primero se tarifica de
+forma heurística (a lo más MAX_ETIQUETAS etiquetas por nodo) y, cuando ésta no encuentra columnas,
+de forma exacta; si la exacta tampoco encuentra, el LP es la cota inferior del maestro completo
+(las ng-rutas relajan las rutas elementales).
+
+Price-and-branch: al terminar la generación (o agotar su parte del tiempo) se resuelve el maestro
+entero con las columnas generadas; las ng-rutas con ciclos no pueden tomar valor 1 en la partición,
+así que la solución entera sólo usa rutas elementales.
+
+Uso (desde la raíz del repositorio):
+    python colgen.py Instances/Benchmark_1/coord20-5-1.dat --solver gurobi --time-limit 60
+    python runner.py --formulaciones CG SCF CDA --benchmarks B1
+"""
+import argparse
+import time
+
+import numpy as np
+import gurobipy as gp
+from gurobipy import GRB
+import cplex
+
+from heuristica import construir_solucion, costo_ruta
+from pulidor import busqueda_local, preparar
+from testParser import parse_file
+from verificador import verificar
+
+# Tamaño de las vecindades ng (incluye al propio cliente)
+NG = 8
+
+# Etiquetas conservadas por nodo y extensión en la tarificación heurística
+MAX_ETIQUETAS = 20
+
+# Columnas agregadas por depósito en cada iteración
+MAX_COLUMNAS = 30
+
+# Costo reducido máximo para considerar que una columna mejora
+EPS_CR = 1e-6
+
+# Fracción del límite de tiempo reservada para generar columnas (el resto es para el maestro entero)
+FRACCION_GENERACION = 0.7
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Tarificación +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def datos_tarificacion(parsed_data, ng=NG):
+    """
+    Datos fijos de la tarificación: distancias, demandas y vecindades ng.
+
+    Retorna:
+        dict: "m", "C", "q", "Q", "F" (costo de apertura de ruta), "vecindad" (arreglo (n, ng)
+            con el cliente y sus ng - 1 clientes más cercanos) y "posicion" (arreglo (n, n) con la
+            posición de cada cliente en la vecindad de otro, o -1).
+    """
+    m, n = parsed_data["num_depots"], parsed_data["num_customers"]
+    C = np.asarray(parsed_data["distance_matrix"], dtype=np.float64)
+    ng = min(ng, n)
+    cercanos = np.argsort(C[m:, m:] + np.diag(np.full(n, np.inf)), axis=1, kind='stable')[:, :ng - 1]
+    vecindad = np.column_stack((np.arange(n), cercanos))
+    posicion = np.full((n, n), -1, dtype=np.int64)
+    posicion[np.arange(n)[:, None], vecindad] = np.arange(ng)
+    return {
+        "m": m,
+        "C": C,
+        "q": np.asarray(parsed_data["customer_demands"], dtype=np.float64),
+        "Q": float(parsed_data["vehicle_capacity"]),
+        "F": float(parsed_data["route_opening_cost"]),
+        "vecindad": vecindad,
+        "posicion": posicion,
+    }
+
+
+def _domina(costo_a, carga_a, mem_a, costo_b, carga_b, mem_b):
+    """
+    Matriz booleana (len(b), len(a)): la etiqueta a domina a la b (mismo nodo).
+    """
+    return ((costo_a[None, :] <= costo_b[:, None] + EPS_CR) & (carga_a[None, :] <= carga_b[:, None])
+            & ((mem_a[None, :] & ~mem_b[:, None]) == 0))
+
+
+def tarificar(datos, d, pi, mu_d, heuristica=True, max_columnas=MAX_COLUMNAS, fin=None):
+    """
+    Busca ng-rutas del depósito d con costo reducido negativo.
+
+    Parámetros:
+        datos (dict): Datos de datos_tarificacion.
+        d (int): Depósito.
+        pi (ndarray): Duales de las filas de partición (uno por cliente).
+        mu_d (float): Dual de la fila de capacidad del depósito d (<= 0).
+        heuristica (bool): Si es True, se conservan a lo más MAX_ETIQUETAS etiquetas por nodo en
+            cada extensión.
+        max_columnas (int): Número máximo de rutas retornadas (las de menor costo reducido).
+        fin (float): Instante (time.perf_counter) en que se detiene la extensión de etiquetas.
+
+    Retorna:
+        list: Tuplas (costo reducido, [clientes en orden de visita]), con índices locales.
+    """
+    m, C, q, Q = datos["m"], datos["C"], datos["q"], datos["Q"]
+    vecindad, posicion = datos["vecindad"], datos["posicion"]
+    n, ng = vecindad.shape
+    bits = np.arange(ng, dtype=np.int64)
+    # Costo reducido de cada arco entre clientes y de salida y regreso al depósito
+    premio = pi + mu_d * q
+    arco = C[m:, m:] - premio[None, :]
+    salida = C[d, m:] - premio + datos["F"]
+    regreso = C[m:, d]
+
+    # Almacén de etiquetas (para reconstruir rutas) y etiquetas no dominadas por nodo
+    nodos, padres = [], []
+    activas = [None] * n
+
+    validos = np.flatnonzero(q <= Q)
+    frontera = {"nodo": validos, "costo": salida[validos], "carga": q[validos],
+                "mem": np.ones(validos.size, dtype=np.int64), "padre": np.full(validos.size, -1, dtype=np.int64)}
+    candidatas = []
+    for _ in range(n):
+        if not frontera["nodo"].size or (fin is not None and time.perf_counter() >= fin):
+            break
+        frontera = _filtrar(frontera, activas, heuristica)
+        ids = np.arange(len(nodos), len(nodos) + frontera["nodo"].size)
+        nodos.extend(frontera["nodo"].tolist())
+        padres.extend(frontera["padre"].tolist())
+        cr = frontera["costo"] + regreso[frontera["nodo"]]
+        negativas = np.flatnonzero(cr < -EPS_CR)
+        candidatas.extend(zip(cr[negativas].tolist(), ids[negativas].tolist()))
+
+        # Extensiones de cada etiqueta a todos los clientes que caben y no están en su memoria
+        i, j = np.nonzero(frontera["carga"][:, None] + q[None, :] <= Q + 1e-9)
+        origen = frontera["nodo"][i]
+        p = posicion[origen, j]  # posición de j en la vecindad del nodo actual
+        libre = (p < 0) | (((frontera["mem"][i] >> np.maximum(p, 0)) & 1) == 0)
+        i, j, origen = i[libre], j[libre], origen[libre]
+        # Nueva memoria: (memoria ∩ vecindad de j) ∪ {j}, en las posiciones de la vecindad de j
+        destino = posicion[j[:, None], vecindad[origen]]
+        activos = ((frontera["mem"][i][:, None] >> bits[None, :]) & 1).astype(bool) & (destino >= 0)
+        mem = np.where(activos, np.left_shift(1, np.maximum(destino, 0)), 0).sum(axis=1) | 1
+        frontera = {"nodo": j, "costo": frontera["costo"][i] + arco[origen, j], "carga": frontera["carga"][i] + q[j],
+                    "mem": mem.astype(np.int64), "padre": ids[i]}
+
+    candidatas.sort()
+    rutas, vistas = [], set()
+    for cr, etiqueta in candidatas:
+        ruta = []
+        while etiqueta >= 0:
+            ruta.append(nodos[etiqueta])
+            etiqueta = padres[etiqueta]
+        ruta.reverse()
+        clave = tuple(ruta)
+        if clave not in vistas:
+            vistas.add(clave)
+            rutas.append((cr, ruta))
+            if len(rutas) >= max_columnas:
+                break
+    return rutas
+
+
+def _filtrar(etiquetas, activas, heuristica):
+    """
+    Descarta las etiquetas nuevas dominadas (por las activas del mismo nodo o entre ellas),
+    actualiza las activas de cada nodo y, en modo heurístico, conserva las MAX_ETIQUETAS más
+    baratas por nodo.
+    """
+    orden = np.lexsort((etiquetas["costo"], etiquetas["nodo"]))
+    etiquetas = {k: v[orden] for k, v in etiquetas.items()}
+    nodo = etiquetas["nodo"]
+    cortes = np.flatnonzero(np.diff(nodo)) + 1
+    conservar = np.zeros(nodo.size, dtype=bool)
+    for inicio, fin in zip(np.concatenate(([0], cortes)), np.concatenate((cortes, [nodo.size]))):
+        costo, carga, mem = (etiquetas[k][inicio:fin] for k in ("costo", "carga", "mem"))
+        j = int(nodo[inicio])
+        # En modo heurístico sólo se examinan las más baratas
+        idx = np.arange(min(fin - inicio, 4 * MAX_ETIQUETAS) if heuristica else fin - inicio)
+        if activas[j] is not None:
+            idx = idx[~_domina(*activas[j], costo[idx], carga[idx], mem[idx]).any(axis=1)]
+        # Entre las nuevas (ordenadas por costo) sólo dominan las anteriores
+        dom = _domina(costo[idx], carga[idx], mem[idx], costo[idx], carga[idx], mem[idx])
+        idx = idx[~np.tril(dom, k=-1).any(axis=1)]
+        if heuristica:
+            idx = idx[:MAX_ETIQUETAS]
+        conservar[inicio + idx] = True
+        nuevas = (costo[idx], carga[idx], mem[idx])
+        if activas[j] is None:
+            activas[j] = nuevas
+        else:
+            sobrevive = ~_domina(*nuevas, *activas[j]).any(axis=1)
+            activas[j] = tuple(np.concatenate((a[sobrevive], b)) for a, b in zip(activas[j], nuevas))
+    return {k: v[conservar] for k, v in etiquetas.items()}
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Maestro +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def nuevo_maestro(parsed_data, solver, threads=None):
+    """
+    Maestro restringido sin columnas de rutas (sólo las y de los depósitos) en el solver dado.
+
+    Retorna:
+        dict: "solver", "modelo" (Model de Gurobi o Cplex), "columnas" (lista de (d, ruta)) y
+            "claves" (conjunto de columnas ya agregadas).
+    """
+    m, n = parsed_data["num_depots"], parsed_data["num_customers"]
+    capacidades = [float(c) for c in parsed_data["depot_capacities"]]
+    apertura = [float(f) for f in parsed_data["depot_opening_costs"]]
+    if solver == 'gurobi':
+        model = gp.Model("CG")
+        model.Params.OutputFlag = 0
+        if threads is not None:
+            model.Params.Threads = threads
+        y = [model.addVar(lb=0.0, ub=1.0, obj=apertura[d], name=f"y[{d}]") for d in range(m)]
+        particion = [model.addLConstr(gp.LinExpr(), GRB.EQUAL, 1.0, name=f"particion[{i}]") for i in range(n)]
+        capacidad = [model.addLConstr(-capacidades[d] * y[d], GRB.LESS_EQUAL, 0.0, name=f"capacidad[{d}]")
+                     for d in range(m)]
+        model.update()
+        return {"solver": solver, "modelo": model, "y": y, "filas": particion + capacidad,
+                "columnas": [], "claves": set()}
+
+    cpx = cplex.Cplex()
+    for salida in (cpx.set_results_stream, cpx.set_log_stream, cpx.set_warning_stream, cpx.set_error_stream):
+        salida(None)
+    if threads is not None:
+        cpx.parameters.threads.set(threads)
+    cpx.objective.set_sense(cpx.objective.sense.minimize)
+    cpx.linear_constraints.add(senses="E" * n + "L" * m, rhs=[1.0] * n + [0.0] * m,
+                               names=[f"particion_{i}" for i in range(n)] + [f"capacidad_{d}" for d in range(m)])
+    cpx.variables.add(obj=apertura, lb=[0.0] * m, ub=[1.0] * m, names=[f"y_{d}" for d in range(m)],
+                      columns=[cplex.SparsePair(ind=[n + d], val=[-capacidades[d]]) for d in range(m)])
+    return {"solver": solver, "modelo": cpx, "columnas": [], "claves": set()}
+
+
+def agregar_columnas(maestro, parsed_data, rutas):
+    """
+    Agrega al maestro las rutas (d, [clientes]) que todavía no tiene.
+
+    Retorna:
+        int: Número de columnas agregadas.
+    """
+    m, n = parsed_data["num_depots"], parsed_data["num_customers"]
+    C = np.asarray(parsed_data["distance_matrix"], dtype=np.float64)
+    q = np.asarray(parsed_data["customer_demands"], dtype=np.float64)
+    nuevas = []
+    for d, ruta in rutas:
+        clave = (int(d), tuple(int(i) for i in ruta))
+        if not ruta or clave in maestro["claves"]:
+            continue
+        maestro["claves"].add(clave)
+        clientes, visitas = np.unique(np.asarray(clave[1], dtype=np.int64), return_counts=True)
+        costo = parsed_data["route_opening_cost"] + costo_ruta(C, clave[0], clave[1], m)
+        filas = clientes.tolist() + [n + clave[0]]
+        coeficientes = visitas.astype(np.float64).tolist() + [float(q[list(clave[1])].sum())]
+        nuevas.append((clave, float(costo), filas, coeficientes))
+    if not nuevas:
+        return 0
+
+    k = len(maestro["columnas"])
+    if maestro["solver"] == 'gurobi':
+        model = maestro["modelo"]
+        for t, (clave, costo, filas, coeficientes) in enumerate(nuevas):
+            model.addVar(lb=0.0, ub=1.0, obj=costo, name=f"ruta[{k + t}]",
+                         column=gp.Column(coeficientes, [maestro["filas"][f] for f in filas]))
+        model.update()
+    else:
+        maestro["modelo"].variables.add(obj=[costo for _, costo, _, _ in nuevas], lb=[0.0] * len(nuevas),
+                                        ub=[1.0] * len(nuevas),
+                                        names=[f"ruta_{k + t}" for t in range(len(nuevas))],
+                                        columns=[cplex.SparsePair(ind=f, val=c) for _, _, f, c in nuevas])
+    maestro["columnas"].extend(clave for clave, _, _, _ in nuevas)
+    return len(nuevas)
+
+
+def resolver_lp(maestro, n):
+    """
+    Resuelve la relajación lineal del maestro restringido.
+
+    Retorna:
+        tuple: (objetivo, duales de partición (n,), duales de capacidad (m,)).
+    """
+    if maestro["solver"] == 'gurobi':
+        model = maestro["modelo"]
+        model.optimize()
+        duales = np.asarray(model.getAttr("Pi", maestro["filas"]), dtype=np.float64)
+        return model.ObjVal, duales[:n], duales[n:]
+    cpx = maestro["modelo"]
+    cpx.set_problem_type(cpx.problem_type.LP)
+    cpx.solve()
+    duales = np.asarray(cpx.solution.get_dual_values(), dtype=np.float64)
+    return cpx.solution.get_objective_value(), duales[:n], duales[n:]
+
+
+def resolver_entero(maestro, m, time_limit=None):
+    """
+    Resuelve el maestro con λ e y binarias sobre las columnas generadas (price-and-branch).
+
+    Retorna:
+        dict: "objetivo" (None sin solución), "cota", "gap", "nodos", "estado" y "rutas" (lista
+            de (d, [clientes]) de las columnas elegidas).
+    """
+    if maestro["solver"] == 'gurobi':
+        model = maestro["modelo"]
+        variables = model.getVars()
+        model.setAttr("VType", variables, [GRB.BINARY] * len(variables))
+        if time_limit is not None:
+            model.Params.TimeLimit = max(time_limit, 1.0)
+        model.optimize()
+        con_solucion = model.SolCount > 0
+        valores = model.getAttr("X", variables) if con_solucion else []
+        resultado = {"objetivo": model.ObjVal if con_solucion else None,
+                     "cota": model.ObjBound if model.status != GRB.INFEASIBLE else None,
+                     "gap": model.MIPGap if con_solucion else None, "nodos": int(model.NodeCount),
+                     "estado": next((k for k in dir(GRB.Status) if getattr(GRB.Status, k) == model.status),
+                                    str(model.status))}
+    else:
+        cpx = maestro["modelo"]
+        total = cpx.variables.get_num()
+        cpx.variables.set_types([(k, cpx.variables.type.binary) for k in range(total)])
+        if time_limit is not None:
+            cpx.parameters.timelimit.set(max(time_limit, 1.0))
+        cpx.solve()
+        con_solucion = cpx.solution.is_primal_feasible()
+        valores = cpx.solution.get_values() if con_solucion else []
+        resultado = {"objetivo": cpx.solution.get_objective_value() if con_solucion else None,
+                     "cota": cpx.solution.MIP.get_best_objective(),
+                     "gap": cpx.solution.MIP.get_mip_relative_gap() if con_solucion else None,
+                     "nodos": cpx.solution.progress.get_num_nodes_processed(),
+                     "estado": cpx.solution.get_status_string()}
+    resultado["rutas"] = [(d, list(ruta)) for (d, ruta), valor in zip(maestro["columnas"], valores[m:])
+                          if valor > 0.5]
+    return resultado
+
+
+def liberar_maestro(maestro):
+    if maestro["solver"] == 'gurobi':
+        maestro["modelo"].dispose()
+    else:
+        maestro["modelo"].end()
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Generación de columnas +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def columnas_iniciales(parsed_data):
+    """
+    Rutas de las heurísticas constructivas (savings y sweep, pulidas con pulidor.busqueda_local)
+    y la ruta de un cliente desde cada depósito usado por ellas, para que el maestro restringido
+    sea factible desde la primera iteración.
+    """
+    busqueda = preparar(parsed_data)
+    rutas = []
+    for metodo in ("savings", "sweep"):
+        solucion = construir_solucion(parsed_data, metodo=metodo)
+        rutas.extend(solucion["rutas"])
+        rutas.extend(busqueda_local(busqueda, solucion)["rutas"])
+        rutas.extend((d, [int(i)]) for d, ruta in solucion["rutas"] for i in ruta)
+    return rutas
+
+
+def generar_columnas(parsed_data, solver, threads=None, time_limit=None, ng=NG):
+    """
+    Resuelve la relajación del maestro por generación de columnas y luego el maestro entero con
+    las columnas generadas (price-and-branch).
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        solver (str): 'gurobi' o 'cplex'.
+        threads (int): Hilos del solver.
+        time_limit (float): Límite de tiempo total en segundos; FRACCION_GENERACION de él se usa
+            para generar columnas.
+        ng (int): Tamaño de las vecindades ng.
+
+    Retorna:
+        dict: "cota_lp" (valor del LP al terminar), "convergio" (la tarificación exacta no encontró
+            columnas, así que cota_lp es cota inferior), "columnas", "iteraciones",
+            "tiempo_lp", "tiempo_tarificacion", "tiempo_entero", "num_variables",
+            "num_restricciones" y la salida de resolver_entero.
+    """
+    start_time = time.perf_counter()
+    fin_generacion = start_time + FRACCION_GENERACION * time_limit if time_limit is not None else np.inf
+    m, n = parsed_data["num_depots"], parsed_data["num_customers"]
+    datos = datos_tarificacion(parsed_data, ng)
+    maestro = nuevo_maestro(parsed_data, solver, threads)
+    agregar_columnas(maestro, parsed_data, columnas_iniciales(parsed_data))
+
+    stats = {"iteraciones": 0, "convergio": False, "tiempo_lp": 0.0, "tiempo_tarificacion": 0.0}
+    heuristica = True
+    try:
+        while time.perf_counter() < fin_generacion:
+            t = time.perf_counter()
+            cota_lp, pi, mu = resolver_lp(maestro, n)
+            stats["tiempo_lp"] += time.perf_counter() - t
+            stats["iteraciones"] += 1
+
+            t = time.perf_counter()
+            rutas = [(d, ruta) for d in range(m)
+                     for _, ruta in tarificar(datos, d, pi, mu[d], heuristica, fin=fin_generacion)]
+            stats["tiempo_tarificacion"] += time.perf_counter() - t
+            if agregar_columnas(maestro, parsed_data, rutas):
+                heuristica = True
+            elif time.perf_counter() >= fin_generacion:
+                break  # La tarificación se cortó: no prueba optimalidad del LP
+            elif heuristica:
+                heuristica = False
+            else:
+                stats["convergio"] = True
+                break
+        stats["cota_lp"] = cota_lp if stats["iteraciones"] else None
+        stats["columnas"] = len(maestro["columnas"])
+        stats["num_variables"] = m + len(maestro["columnas"])
+        stats["num_restricciones"] = n + m
+
+        t = time.perf_counter()
+        restante = time_limit - (t - start_time) if time_limit is not None else None
+        stats.update(resolver_entero(maestro, m, restante))
+        stats["tiempo_entero"] = time.perf_counter() - t
+    finally:
+        liberar_maestro(maestro)
+    return stats
+
+
+def solucion_colgen(rutas):
+    """
+    Solución (formato de heuristica.construir_solucion, sin costo) a partir de las rutas del
+    maestro entero.
+    """
+    return {"depositos": sorted({d for d, _ in rutas}), "rutas": rutas}
+
+
+def get_metrics_cg(parsed_data, solver, benchmark, instance, threads=None, time_limit=None):
+    """
+    Resuelve una instancia por generación de columnas y retorna sus métricas con las columnas de
+    results.csv y los campos extendidos de runner ("estado", "gap", "cota", "nodos"); la cota es
+    la del LP si la generación convergió. Agrega "colgen" con las estadísticas de generar_columnas
+    y "solucion" con la solución entera (None si no hay).
+    """
+    start_time = time.time()
+    stats = generar_columnas(parsed_data, solver, threads=threads, time_limit=time_limit)
+    end_time = time.time()
+    objetivo = stats["objetivo"]
+    cota = stats["cota_lp"] if stats["convergio"] else None
+    return {
+        "Modelo": f"CG_{solver}",
+        "Benchmark": benchmark,
+        "Instancia": instance,
+        "Número de Variables": stats["num_variables"],
+        "Número de Restricciones": stats["num_restricciones"],
+        "Valor Función Objetivo": objetivo if objetivo is not None else "N/A",
+        "Tiempo de Cómputo (s)": end_time - start_time,
+        "estado": stats["estado"],
+        "gap": (objetivo - cota) / abs(objetivo) if objetivo and cota is not None else None,
+        "cota": cota,
+        "nodos": stats["nodos"],
+        "colgen": {k: v for k, v in stats.items() if k != "rutas"},
+        "solucion": solucion_colgen(stats["rutas"]) if objetivo is not None else None,
+    }
+
+
+def resumen(stats):
+    """
+    Línea de resumen de las estadísticas de generar_columnas.
+    """
+    cota = "N/A" if stats["cota_lp"] is None else f"{stats['cota_lp']:.2f}"
+    return (f"cota LP {cota}{'' if stats['convergio'] else ' (sin converger)'}, {stats['columnas']} columnas, "
+            f"{stats['iteraciones']} iteraciones, LP {stats['tiempo_lp']:.2f} s, "
+            f"tarificación {stats['tiempo_tarificacion']:.2f} s, entero {stats['tiempo_entero']:.2f} s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancia")
+    parser.add_argument("--solver", choices=["gurobi", "cplex"], default="gurobi")
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--time-limit", type=float, default=600.0)
+    parser.add_argument("--ng", type=int, default=NG, help="tamaño de las vecindades ng")
+    args = parser.parse_args(argv)
+
+    parsed_data = parse_file(args.instancia)
+    start_time = time.time()
+    stats = generar_columnas(parsed_data, args.solver, threads=args.threads, time_limit=args.time_limit, ng=args.ng)
+    print(resumen(stats))
+    if stats["objetivo"] is None:
+        print(f"Sin solución entera ({stats['estado']})")
+        return
+    verificacion = verificar(parsed_data, solucion_colgen(stats["rutas"]))
+    print(f"Objetivo {stats['objetivo']:.2f} ({stats['estado']}), costo verificado {verificacion['costo']:.2f}, "
+          f"factible {verificacion['factible']}, {len(stats['rutas'])} rutas, {time.time() - start_time:.2f} s")
+    for violacion in verificacion["violaciones"]:
+        print(f"  {violacion}")
+
+
+if __name__ == "__main__":
+    main()
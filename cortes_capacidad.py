@@ -0,0 +1,264 @@
+"""
+Separación de desigualdades de capacidad redondeada como cortes de usuario para SCF.
+
+En SCF el flujo se acopla a los arcos con big-M (f[i,j] <= vehicle_capacity * x[i,j]), así que la
+relajación lineal es débil. Para un conjunto S de clientes, la conservación de flujo obliga a que
+salga de S todo el flujo q(S) de sus demandas y cada arco lleva a lo más vehicle_capacity, de
+modo que toda solución entera cumple la desigualdad de capacidad redondeada
+
+    x(δ+(S)) >= ceil(q(S) / vehicle_capacity),
+
+que con rhs = 1 es la de subtour (S debe conectarse con algún depósito). Como cada cliente tiene
+grado de salida 1, equivale a x(S) <= |S| - ceil(q(S) / vehicle_capacity) con los arcos internos
+de S; se agrega la forma con menos términos.
+
+Los conjuntos candidatos se buscan sobre el grafo soporte de la solución fraccionaria de cada
+nodo con dos heurísticas:
+    - componentes conexas del soporte entre clientes;
+    - cortes mínimos entre cada cliente y los depósitos (flujo máximo con capacidades x).
+"""
+import math
+import time
+
+import numpy as np
+from gurobipy import GRB, quicksum
+import cplex
+from cplex.callbacks import UserCutCallback
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components, maximum_flow
+
+from lazy_cda import nuevas_estadisticas
+
+# Escala para pasar las capacidades fraccionarias a los enteros que usa maximum_flow
+ESCALA_FLUJO = 10 ** 6
+
+
+def _conjuntos_candidatos(x, m, tol):
+    """
+    Conjuntos de clientes (índices locales 0..n-1) a evaluar: componentes conexas del soporte y
+    lados de los cortes mínimos entre cada cliente y los depósitos.
+    """
+    n = x.shape[0] - m
+    xc = x[m:, m:]
+    _, etiquetas = connected_components(csr_matrix(xc + xc.T > tol), directed=False)
+    candidatos = {tuple(np.flatnonzero(etiquetas == c)) for c in np.unique(etiquetas)}
+
+    # Red de flujo: clientes 0..n-1 y los depósitos fusionados en el sumidero n
+    capacidades = np.zeros((n + 1, n + 1))
+    capacidades[:n, :n] = xc
+    capacidades[:n, n] = x[m:, :m].sum(axis=1)
+    capacidades = np.rint(capacidades * ESCALA_FLUJO).astype(np.int32)
+    red = csr_matrix(capacidades)
+    cubiertos = np.zeros(n, dtype=bool)
+    for t in range(n):
+        if cubiertos[t]:
+            continue
+        flujo = maximum_flow(red, t, n).flow.toarray()
+        residual = csr_matrix(capacidades - flujo > 0)
+        # Lado del cliente en el corte mínimo: nodos alcanzables desde t en la red residual
+        alcanzados = np.zeros(n + 1, dtype=bool)
+        frontera, alcanzados[t] = [t], True
+        while frontera:
+            siguiente = residual[frontera].indices
+            siguiente = siguiente[~alcanzados[siguiente]]
+            alcanzados[siguiente] = True
+            frontera = np.unique(siguiente).tolist()
+        S = np.flatnonzero(alcanzados[:n])
+        candidatos.add(tuple(S))
+        cubiertos[S] = True
+    return [np.asarray(S, dtype=np.int64) for S in candidatos]
+
+
+def separar_capacidad(x, m, demandas, capacidad, tol=1e-6, max_cortes=None):
+    """
+    Busca desigualdades de capacidad redondeada violadas por una solución (posiblemente
+    fraccionaria) de SCF.
+
+    Parámetros:
+        x (ndarray): Matriz (m + n, m + n) con los valores de x (numeración de parse_file, ceros
+            en la diagonal y en los arcos que no existen en el modelo).
+        m (int): Número de depósitos.
+        demandas (ndarray): Demandas de los clientes.
+        capacidad (float): Capacidad del vehículo.
+        tol (float): Violación mínima para reportar un corte.
+        max_cortes (int): Número máximo de cortes a retornar (los más violados primero).
+
+    Retorna:
+        list: Tuplas (S, rhs, violación) con S en índices locales de cliente; la desigualdad es
+            x(δ+(S)) >= rhs.
+    """
+    cortes = []
+    for S in _conjuntos_candidatos(x, m, tol):
+        rhs = math.ceil(demandas[S].sum() / capacidad - tol)
+        filas = x[m + S]
+        salida = filas.sum() - filas[:, m + S].sum()
+        if rhs - salida > tol:
+            cortes.append((S, rhs, rhs - salida))
+    cortes.sort(key=lambda corte: -corte[2])
+    return cortes[:max_cortes] if max_cortes is not None else cortes
+
+
+def _terminos(S, rhs, N, m):
+    """
+    Arcos (i, j) y lado derecho de la forma más corta del corte: arcos internos de S con
+    x(S) <= |S| - rhs, o arcos salientes con x(δ+(S)) >= rhs.
+    """
+    nodos = m + S
+    if len(S) - 1 <= N - len(S):
+        i, j = np.meshgrid(nodos, nodos, indexing='ij')
+        return i.ravel(), j.ravel(), "<=", float(len(S) - rhs)
+    fuera = np.setdiff1d(np.arange(N), nodos)
+    i, j = np.meshgrid(nodos, fuera, indexing='ij')
+    return i.ravel(), j.ravel(), ">=", float(rhs)
+
+
+def _arcos_x(nombres):
+    """
+    Posiciones y arcos (i, j), i != j, de las variables x en una lista de nombres de variables
+    (formato de Gurobi "x[i,j]" o de docplex "x_i_j").
+    """
+    posiciones, ii, jj = [], [], []
+    for k, nombre in enumerate(nombres):
+        if nombre.startswith("x["):
+            i, j = nombre[2:-1].split(",")
+        elif nombre.startswith("x_"):
+            i, j = nombre[2:].split("_")
+        else:
+            continue
+        if i != j:
+            posiciones.append(k)
+            ii.append(int(i))
+            jj.append(int(j))
+    return np.asarray(posiciones, dtype=np.int64), np.asarray(ii, dtype=np.int64), np.asarray(jj, dtype=np.int64)
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Gurobi +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def configurar_cortes_gurobi(model, parsed_data, solo_raiz=True, max_cortes=None):
+    """
+    Prepara un modelo Gurobi SCF para separar desigualdades de capacidad redondeada como cortes de
+    usuario (resolver con resolver_cortes_gurobi o pasar callback_cortes_capacidad_gurobi a
+    optimize).
+
+    Parámetros:
+        model (Model): Modelo SCF de SCF.modelo_scf_gurobi o de representacion.py.
+        parsed_data (dict): Diccionario con los datos parseados.
+        solo_raiz (bool): Si es True, sólo se separa en el nodo raíz.
+        max_cortes (int): Máximo de cortes agregados por llamada.
+    """
+    model.update()
+    variables = model.getVars()
+    posiciones, ii, jj = _arcos_x(model.getAttr("VarName", variables))
+    N = parsed_data["num_depots"] + parsed_data["num_customers"]
+    x_mat = np.full((N, N), None, dtype=object)
+    x_mat[ii, jj] = [variables[k] for k in posiciones.tolist()]
+    model.Params.PreCrush = 1
+    model._cortes_capacidad = {
+        "m": parsed_data["num_depots"],
+        "N": N,
+        "ii": ii,
+        "jj": jj,
+        "x_vars": x_mat[ii, jj].tolist(),
+        "x_mat": x_mat,
+        "demandas": np.asarray(parsed_data["customer_demands"], dtype=np.float64),
+        "capacidad": parsed_data["vehicle_capacity"],
+        "solo_raiz": solo_raiz,
+        "max_cortes": max_cortes,
+        "stats": nuevas_estadisticas(),
+    }
+
+
+def callback_cortes_capacidad_gurobi(model, where):
+    """
+    Callback de Gurobi que agrega con cbCut las desigualdades de capacidad redondeada violadas por
+    la relajación de cada nodo.
+    """
+    if where != GRB.Callback.MIPNODE or model.cbGet(GRB.Callback.MIPNODE_STATUS) != GRB.OPTIMAL:
+        return
+    datos = model._cortes_capacidad
+    if datos["solo_raiz"] and model.cbGet(GRB.Callback.MIPNODE_NODCNT) > 0:
+        return
+
+    stats = datos["stats"]
+    start_time = time.perf_counter()
+    m, N = datos["m"], datos["N"]
+    x = np.zeros((N, N))
+    x[datos["ii"], datos["jj"]] = model.cbGetNodeRel(datos["x_vars"])
+    for S, rhs, _ in separar_capacidad(x, m, datos["demandas"], datos["capacidad"], max_cortes=datos["max_cortes"]):
+        i, j, sentido, lado_derecho = _terminos(S, rhs, N, m)
+        expr = quicksum(var for var in datos["x_mat"][i, j] if var is not None)
+        model.cbCut(expr <= lado_derecho if sentido == "<=" else expr >= lado_derecho)
+        stats["cortes"] += 1
+    stats["llamadas"] += 1
+    stats["tiempo_separacion"] += time.perf_counter() - start_time
+
+
+def resolver_cortes_gurobi(model):
+    """
+    Resuelve un modelo preparado con configurar_cortes_gurobi.
+
+    Retorna:
+        dict: Estadísticas de separación (cortes agregados, llamadas y tiempo de separación).
+    """
+    model.optimize(callback_cortes_capacidad_gurobi)
+    return model._cortes_capacidad["stats"]
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ CPLEX +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+class CortesCapacidadCallback(UserCutCallback):
+    """
+    Callback de cortes de usuario de CPLEX: separa desigualdades de capacidad redondeada desde la
+    relajación de cada nodo.
+    """
+
+    def configurar(self, indices, ii, jj, parsed_data, solo_raiz=True, max_cortes=None):
+        self.m = parsed_data["num_depots"]
+        self.N = self.m + parsed_data["num_customers"]
+        self.ii, self.jj = ii, jj
+        self.x_idx = indices
+        self.x_mat = np.full((self.N, self.N), -1, dtype=np.int64)
+        self.x_mat[ii, jj] = indices
+        self.demandas = np.asarray(parsed_data["customer_demands"], dtype=np.float64)
+        self.capacidad = parsed_data["vehicle_capacity"]
+        self.solo_raiz = solo_raiz
+        self.max_cortes = max_cortes
+        self.stats = nuevas_estadisticas()
+
+    def __call__(self):
+        if self.solo_raiz and self.get_current_node_depth() > 0:
+            return
+        start_time = time.perf_counter()
+        x = np.zeros((self.N, self.N))
+        x[self.ii, self.jj] = self.get_values(self.x_idx.tolist())
+        for S, rhs, _ in separar_capacidad(x, self.m, self.demandas, self.capacidad, max_cortes=self.max_cortes):
+            i, j, sentido, lado_derecho = _terminos(S, rhs, self.N, self.m)
+            indices = self.x_mat[i, j]
+            indices = indices[indices >= 0].tolist()
+            self.add(cut=cplex.SparsePair(ind=indices, val=[1.0] * len(indices)),
+                     sense="L" if sentido == "<=" else "G", rhs=lado_derecho)
+            self.stats["cortes"] += 1
+        self.stats["llamadas"] += 1
+        self.stats["tiempo_separacion"] += time.perf_counter() - start_time
+
+
+def configurar_cortes_cplex(mdl, parsed_data, solo_raiz=True, max_cortes=None):
+    """
+    Registra en un modelo docplex SCF el callback que separa desigualdades de capacidad redondeada.
+
+    Parámetros:
+        mdl (Model): Modelo SCF de SCF.modelo_scf_cplex o de representacion.py.
+        parsed_data (dict): Diccionario con los datos parseados.
+        solo_raiz (bool): Si es True, sólo se separa en el nodo raíz.
+        max_cortes (int): Máximo de cortes agregados por llamada.
+
+    Retorna:
+        CortesCapacidadCallback: Callback registrado (sus estadísticas quedan en cb.stats).
+    """
+    variables = list(mdl.iter_variables())
+    posiciones, ii, jj = _arcos_x([var.name for var in variables])
+    indices = np.array([variables[k].index for k in posiciones.tolist()], dtype=np.int64)
+    cb = mdl.register_callback(CortesCapacidadCallback)
+    cb.configurar(indices, ii, jj, parsed_data, solo_raiz=solo_raiz, max_cortes=max_cortes)
+    mdl._cortes_capacidad_callback = cb
+    return cb
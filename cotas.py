@@ -0,0 +1,218 @@
+"""
+Cotas de relajación lineal en lote para comparar la fuerza de las formulaciones.
+
+Construye cada formulación con los mismos constructores de runner.py (con las mismas opciones
+--ir, --k-vecinos y --cache-modelos), le quita la integralidad y resuelve sólo la relajación
+lineal, sin ramificar. Por cada (formulación, solver, instancia) reporta la cota de la raíz, el
+gap entre esa cota y un objetivo de referencia y el tiempo de resolución del LP.
+
+El objetivo de referencia es uno solo por instancia, para que los gaps de las distintas
+formulaciones sean comparables: el menor costo entre
+    1. el mejor costo verificado (ver verificador.verificar) de cualquier formulación y solver de
+       la instancia guardado en la base de resultados (resultados.py), si existe, y
+    2. el costo de la heurística constructiva (heuristica.construir_solucion, con varias rutas
+       por depósito), si logra construir una solución factible.
+Si no hay ninguno, la referencia y el gap se reportan como "N/A" y la cota igual se informa.
+
+Uso (desde la raíz del repositorio):
+    python cotas.py --benchmarks B1 B2 B3 --instancias "*.dat" --workers 4 --salida cotas.csv
+"""
+import argparse
+import csv
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from gurobipy import GRB
+
+from heuristica import construir_solucion
+from model_cache import CACHE_DIR as CACHE_MODELOS
+from resultados import CSV_ENCODING, conectar
+from runner import ESTADOS_GUROBI, INSTANCIAS, MODELOS, construir_modelo, expandir_trabajos
+from testParser import parse_file
+from verificador import verificar
+
+# Columnas del CSV de cotas
+COLUMNAS_COTAS = ["Modelo", "Solver", "Benchmark", "Instancia", "Número de Variables", "Número de Restricciones",
+                  "Cota LP", "Referencia", "Fuente Referencia", "Gap LP (%)", "Tiempo LP (s)",
+                  "Tiempo Construcción (s)", "Estado"]
+
+
+def _tamano(model_instance, solver):
+    if solver == 'gurobi':
+        model_instance.update()
+        return model_instance.NumVars, model_instance.NumConstrs
+    return model_instance.number_of_variables, model_instance.number_of_constraints
+
+
+def resolver_relajacion(model_instance, solver, threads=None, time_limit=None):
+    """
+    Resuelve la relajación lineal de un modelo sin ramificar.
+
+    En Gurobi se resuelve la copia relajada de Model.relax(); en CPLEX se cambia el tipo de
+    problema del motor a LP, lo que descarta la integralidad sin copiar el modelo.
+
+    Retorna:
+        tuple: (cota o None si el LP no terminó en óptimo, estado, tiempo de resolución en segundos)
+    """
+    if solver == 'gurobi':
+        relajado = model_instance.relax()
+        relajado.Params.OutputFlag = 0
+        if threads is not None:
+            relajado.Params.Threads = threads
+        if time_limit is not None:
+            relajado.Params.TimeLimit = time_limit
+        start_time = time.perf_counter()
+        relajado.optimize()
+        tiempo = time.perf_counter() - start_time
+        cota = relajado.ObjVal if relajado.Status == GRB.OPTIMAL else None
+        estado = ESTADOS_GUROBI.get(relajado.Status, str(relajado.Status))
+        relajado.dispose()
+        return cota, estado, tiempo
+
+    cpx = model_instance.get_cplex()
+    cpx.set_log_stream(None)
+    cpx.set_results_stream(None)
+    cpx.set_warning_stream(None)
+    cpx.set_problem_type(cpx.problem_type.LP)
+    if threads is not None:
+        cpx.parameters.threads.set(threads)
+    if time_limit is not None:
+        cpx.parameters.timelimit.set(time_limit)
+    start_time = time.perf_counter()
+    cpx.solve()
+    tiempo = time.perf_counter() - start_time
+    optimo = cpx.solution.get_status() == cpx.solution.status.optimal
+    return (cpx.solution.get_objective_value() if optimo else None), cpx.solution.get_status_string(), tiempo
+
+
+def referencias(db, trabajos):
+    """
+    Mejor costo verificado guardado en la base de resultados por (benchmark, instancia), sobre todas
+    las formulaciones y solvers.
+
+    Retorna:
+        dict: (benchmark, instancia) -> costo; vacío si la base no existe.
+    """
+    if not db or not os.path.exists(db):
+        return {}
+    instancias = {(t["benchmark"], t["instancia"]) for t in trabajos}
+    con = conectar(db)
+    try:
+        cursor = con.execute("SELECT benchmark, instancia, MIN(costo_verificado) FROM resultados "
+                             "WHERE costo_verificado IS NOT NULL GROUP BY benchmark, instancia")
+        return {tuple(f[:2]): f[2] for f in cursor if tuple(f[:2]) in instancias}
+    finally:
+        con.close()
+
+
+def cota_trabajo(trabajo, referencia=None):
+    """
+    Construye el modelo de un trabajo de runner, resuelve su relajación y retorna la fila de cotas.
+
+    Parámetros:
+        trabajo (dict): Trabajo de runner.expandir_trabajos.
+        referencia (float): Mejor costo verificado de la instancia en la base de resultados; se
+            reemplaza por el de la heurística constructiva si éste es menor o si es None.
+
+    Retorna:
+        dict: Fila con las columnas de COLUMNAS_COTAS.
+    """
+    parsed_data = parse_file(trabajo["ruta"])
+    solver = trabajo["solver"]
+    fuente = "resultados" if referencia is not None else "N/A"
+    try:
+        verificacion = verificar(parsed_data, construir_solucion(parsed_data))
+    except ValueError:
+        verificacion = None
+    if verificacion is not None and verificacion["factible"] and (referencia is None
+                                                                  or verificacion["costo"] < referencia):
+        referencia, fuente = verificacion["costo"], "heuristica"
+
+    start_time = time.perf_counter()
+    model_instance = construir_modelo({**trabajo, "mip_start": None}, parsed_data)
+    variables, restricciones = _tamano(model_instance, solver)
+    tiempo_build = time.perf_counter() - start_time
+    nombre = model_instance.ModelName if solver == 'gurobi' else model_instance.name
+    cota, estado, tiempo = resolver_relajacion(model_instance, solver, trabajo["threads"], trabajo["time_limit"])
+    if solver == 'gurobi':
+        model_instance.dispose()
+    else:
+        model_instance.end()
+
+    if cota is not None and referencia is not None:
+        gap = 100.0 * (referencia - cota) / max(abs(referencia), 1e-9)
+    else:
+        gap = "N/A"
+    return {
+        "Modelo": f"{nombre}_LP",
+        "Solver": solver,
+        "Benchmark": trabajo["benchmark"],
+        "Instancia": trabajo["instancia"],
+        "Número de Variables": variables,
+        "Número de Restricciones": restricciones,
+        "Cota LP": cota if cota is not None else "N/A",
+        "Referencia": referencia if referencia is not None else "N/A",
+        "Fuente Referencia": fuente,
+        "Gap LP (%)": gap,
+        "Tiempo LP (s)": tiempo,
+        "Tiempo Construcción (s)": tiempo_build,
+        "Estado": estado,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS))
+    parser.add_argument("--solvers", nargs="+", default=["cplex", "gurobi"])
+    parser.add_argument("--benchmarks", nargs="+", default=list(INSTANCIAS))
+    parser.add_argument("--instancias", nargs="+", default=None,
+                        help="archivos o patrones glob dentro de cada benchmark (por defecto los del notebook)")
+    parser.add_argument("--workers", type=int, default=1, help="procesos simultáneos")
+    parser.add_argument("--threads", type=int, default=1, help="hilos del solver por LP")
+    parser.add_argument("--time-limit", type=float, default=None, help="límite de tiempo por LP (s)")
+    parser.add_argument("--k-vecinos", type=int, default=None)
+    parser.add_argument("--ir", action="store_true")
+    parser.add_argument("--cache-modelos", nargs="?", const=CACHE_MODELOS, default=None, metavar="DIR")
+    parser.add_argument("--base", default="Instances", help="directorio raíz de los benchmarks")
+    parser.add_argument("--db", default="results.db", help="base de resultados con los objetivos de referencia")
+    parser.add_argument("--salida", default=None, help="CSV donde escribir la tabla de cotas (opcional)")
+    args = parser.parse_args(argv)
+
+    instancias = {B: args.instancias or INSTANCIAS.get(B, ["*.dat"]) for B in args.benchmarks}
+    trabajos = expandir_trabajos(args.formulaciones, args.solvers, instancias, threads=args.threads,
+                                 time_limit=args.time_limit, base=args.base, k_vecinos=args.k_vecinos,
+                                 ir=args.ir, cache_modelos=args.cache_modelos)
+    mejores = referencias(args.db, trabajos)
+
+    file, writer = None, None
+    if args.salida:
+        file = open(args.salida, 'w', newline='', encoding=CSV_ENCODING)
+        writer = csv.DictWriter(file, fieldnames=COLUMNAS_COTAS)
+        writer.writeheader()
+    print(" | ".join(COLUMNAS_COTAS))
+    try:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=args.workers, mp_context=ctx) as pool:
+            futuros = {pool.submit(cota_trabajo, trabajo, mejores.get((trabajo["benchmark"], trabajo["instancia"]))):
+                       trabajo for trabajo in trabajos}
+            for futuro in as_completed(futuros):
+                trabajo = futuros[futuro]
+                try:
+                    fila = futuro.result()
+                except Exception as error:
+                    print(f"Error en {trabajo['formulacion']}/{trabajo['solver']}/{trabajo['instancia']}: "
+                          f"{type(error).__name__}: {error}")
+                    continue
+                print(" | ".join(str(fila[c]) for c in COLUMNAS_COTAS))
+                if writer is not None:
+                    writer.writerow(fila)
+                    file.flush()
+    finally:
+        if file is not None:
+            file.close()
+
+
+if __name__ == "__main__":
+    main()
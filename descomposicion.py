@@ -0,0 +1,280 @@
+"""
+Descomposición por depósitos para el problema de localización-ruteo con múltiples depósitos.
+
+En vez de resolver apertura, asignación y ruteo en un único MIP, separa el problema en dos
+niveles que se iteran:
+    1. Maestro de localización-asignación (MIP de Gurobi): decide qué depósitos abrir y a cuál
+       asignar cada cliente respetando depot_capacities, con el costo de ruteo aproximado por la
+       distancia radial depósito-cliente (ida y vuelta) escalada por un factor por depósito, más
+       la fracción de ruta que ocupa la demanda del cliente.
+    2. Subproblemas de ruteo: cada depósito abierto con sus clientes es un problema de ruteo
+       capacitado de un solo depósito, que se resuelve con el ALNS (alns.py) sobre la
+       subinstancia, en paralelo en un pool de procesos.
+
+Retroalimentación entre iteraciones:
+    - el factor de cada depósito se recalibra con el cociente entre el costo de ruteo obtenido y
+      la distancia radial de sus clientes, así que el maestro aprende cuánto cuesta rutear en cada
+      depósito;
+    - cuando el maestro repite una asignación ya evaluada, se agrega un corte que prohíbe ese
+      conjunto de depósitos abiertos y se explora la siguiente configuración.
+
+Los subproblemas ya resueltos (mismo depósito y mismos clientes) se reutilizan sin volver a
+resolverlos. La solución retornada tiene el formato de heuristica.construir_solucion.
+
+Uso (desde la raíz del repositorio):
+    python descomposicion.py --benchmarks B1 --iteraciones 10 --salida results.csv
+"""
+import argparse
+import fnmatch
+import glob
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import gurobipy as gp
+import numpy as np
+from gurobipy import GRB
+
+from alns import alns
+from heuristica import costo_ruta, costo_solucion
+from testParser import parse_file
+
+# Factor inicial entre costo de ruteo y distancia radial (ida y vuelta) de los clientes
+FACTOR_INICIAL = 0.5
+
+
+def subinstancia(parsed_data, d, clientes):
+    """
+    Subinstancia de un solo depósito con los clientes indicados, con el mismo formato que parse_file.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        d (int): Depósito (0..m-1).
+        clientes (list): Clientes asignados al depósito (0..n-1).
+
+    Retorna:
+        dict: Datos de la subinstancia (depósito 0 y clientes 0..k-1 en el orden de clientes).
+    """
+    m = parsed_data["num_depots"]
+    clientes = np.asarray(clientes, dtype=np.int64)
+    nodos = np.concatenate(([d], clientes + m))
+    distancias = np.asarray(parsed_data["distance_matrix"])
+    return {
+        "num_customers": int(clientes.size),
+        "num_depots": 1,
+        "depots": np.asarray(parsed_data["depots"])[[d]],
+        "customers": np.asarray(parsed_data["customers"]).reshape(-1, 2)[clientes],
+        "vehicle_capacity": parsed_data["vehicle_capacity"],
+        "depot_capacities": np.asarray(parsed_data["depot_capacities"])[[d]],
+        "customer_demands": np.asarray(parsed_data["customer_demands"])[clientes],
+        "depot_opening_costs": np.asarray(parsed_data["depot_opening_costs"])[[d]],
+        "route_opening_cost": parsed_data["route_opening_cost"],
+        "distance_matrix": distancias[np.ix_(nodos, nodos)],
+    }
+
+
+def resolver_subproblema(sub_data, iteraciones=2000, tiempo_limite=None, semilla=0):
+    """
+    Resuelve el ruteo de una subinstancia de un solo depósito con el ALNS.
+
+    Retorna:
+        tuple: (rutas como listas de índices locales de clientes, costo de ruteo: apertura de
+            rutas más distancia recorrida)
+    """
+    solucion = alns(sub_data, iteraciones=iteraciones, tiempo_limite=tiempo_limite, semilla=semilla)
+    costs = np.asarray(sub_data["distance_matrix"], dtype=np.float64)
+    rutas = [[int(i) for i in ruta] for _, ruta in solucion["rutas"]]
+    costo = sum(sub_data["route_opening_cost"] + costo_ruta(costs, 0, ruta, 1) for ruta in rutas)
+    return rutas, costo
+
+
+def modelo_maestro(parsed_data):
+    """
+    Maestro de localización-asignación con la API matricial de Gurobi.
+
+    Variables y[d] (apertura) y z[i,d] (asignación). El objetivo de asignación se fija en cada
+    iteración con actualizar_maestro.
+
+    Retorna:
+        Model: Modelo de Gurobi con los atributos _y y _z (MVar (m,) y (n, m)).
+    """
+    n, m = parsed_data["num_customers"], parsed_data["num_depots"]
+    demandas = np.asarray(parsed_data["customer_demands"], dtype=np.float64)
+    capacidades = np.asarray(parsed_data["depot_capacities"], dtype=np.float64)
+    apertura = np.asarray(parsed_data["depot_opening_costs"], dtype=np.float64)
+
+    mdl = gp.Model("Maestro")
+    mdl.Params.OutputFlag = 0
+    y = mdl.addMVar(m, vtype=GRB.BINARY, obj=apertura, name="y")
+    z = mdl.addMVar((n, m), vtype=GRB.BINARY, name="z")
+
+    mdl.addConstr(z.sum(axis=1) == 1, name="asignacion")
+    mdl.addConstr(demandas @ z <= capacidades * y, name="capacidad_deposito")
+    mdl.addConstr(z <= np.ones((n, 1)) * y, name="deposito_abierto")
+    mdl._y, mdl._z = y, z
+    return mdl
+
+
+def actualizar_maestro(mdl, parsed_data, factores):
+    """
+    Fija el costo aproximado de asignar cada cliente a cada depósito.
+
+    costo[i, d] = factores[d] * (c[d, i] + c[i, d]) + route_opening_cost * demanda[i] / Q
+    """
+    m = parsed_data["num_depots"]
+    costs = np.asarray(parsed_data["distance_matrix"], dtype=np.float64)
+    demandas = np.asarray(parsed_data["customer_demands"], dtype=np.float64)
+    radial = costs[:m, m:].T + costs[m:, :m]
+    fraccion_ruta = parsed_data["route_opening_cost"] * demandas / parsed_data["vehicle_capacity"]
+    mdl._z.Obj = factores[None, :] * radial + fraccion_ruta[:, None]
+
+
+def _asignacion(mdl):
+    return np.argmax(mdl._z.X, axis=1).astype(np.int64)
+
+
+def descomponer(parsed_data, iteraciones=10, tiempo_limite=None, workers=None, iteraciones_sub=2000,
+                semilla=0, threads=None):
+    """
+    Resuelve la instancia iterando el maestro de localización-asignación y los subproblemas de ruteo.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        iteraciones (int): Número máximo de iteraciones maestro-subproblemas.
+        tiempo_limite (float): Tiempo máximo en segundos (se revisa entre iteraciones).
+        workers (int): Procesos del pool de subproblemas (por defecto os.cpu_count()).
+        iteraciones_sub (int): Iteraciones del ALNS en cada subproblema.
+        semilla (int): Semilla del ALNS de los subproblemas.
+        threads (int): Hilos de Gurobi para el maestro (opcional).
+
+    Retorna:
+        dict: Mejor solución encontrada con el formato de heuristica.construir_solucion, más la
+            llave "estadisticas" con la historia de la búsqueda.
+    """
+    start_time = time.perf_counter()
+    n, m = parsed_data["num_customers"], parsed_data["num_depots"]
+    costs = np.asarray(parsed_data["distance_matrix"], dtype=np.float64)
+    radial = costs[:m, m:].T + costs[m:, :m]
+
+    mdl = modelo_maestro(parsed_data)
+    if threads is not None:
+        mdl.Params.Threads = threads
+    factores = np.full(m, FACTOR_INICIAL)
+    resueltos = {}  # (d, clientes) -> (rutas, costo de ruteo)
+    evaluadas = set()
+    mejor, historia = None, []
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        for it in range(iteraciones):
+            if tiempo_limite is not None and time.perf_counter() - start_time >= tiempo_limite:
+                break
+            actualizar_maestro(mdl, parsed_data, factores)
+            mdl.optimize()
+            if mdl.SolCount == 0:
+                break
+            asignacion = _asignacion(mdl)
+            abiertos = [int(d) for d in np.unique(asignacion)]
+            clave = tuple(asignacion.tolist())
+
+            if clave in evaluadas:
+                # Corte de retroalimentación: se prohíbe el conjunto de depósitos abiertos
+                y = mdl._y
+                mdl.addConstr(gp.quicksum(1 - y[d] for d in abiertos)
+                              + gp.quicksum(y[d] for d in range(m) if d not in abiertos) >= 1,
+                              name=f"corte[{it}]")
+                historia.append({"iteracion": it, "corte": abiertos})
+                continue
+            evaluadas.add(clave)
+
+            grupos = {d: tuple(np.nonzero(asignacion == d)[0].tolist()) for d in abiertos}
+            pendientes = {d: pool.submit(resolver_subproblema, subinstancia(parsed_data, d, clientes),
+                                         iteraciones_sub, None, semilla)
+                          for d, clientes in grupos.items() if (d, clientes) not in resueltos}
+            for d, futuro in pendientes.items():
+                resueltos[(d, grupos[d])] = futuro.result()
+
+            rutas = []
+            for d, clientes in grupos.items():
+                rutas_locales, costo_ruteo = resueltos[(d, clientes)]
+                rutas.extend((d, [clientes[i] for i in ruta]) for ruta in rutas_locales)
+                factores[d] = costo_ruteo / max(radial[list(clientes), d].sum(), 1e-9)
+            solucion = {"depositos": abiertos, "asignacion": asignacion, "rutas": rutas}
+            solucion["costo"] = costo_solucion(parsed_data, solucion)
+            historia.append({"iteracion": it, "depositos": abiertos, "costo": solucion["costo"],
+                             "objetivo_maestro": mdl.ObjVal, "subproblemas": len(pendientes)})
+            if mejor is None or solucion["costo"] < mejor["costo"] - 1e-9:
+                mejor = solucion
+
+    mdl.dispose()
+    if mejor is None:
+        raise RuntimeError("El maestro de localización-asignación no encontró una asignación factible")
+    mejor["estadisticas"] = {
+        "iteraciones": len(historia),
+        "tiempo": time.perf_counter() - start_time,
+        "subproblemas": len(resueltos),
+        "historia": historia,
+    }
+    return mejor
+
+
+def get_metrics_descomposicion(parsed_data, benchmark, instance, **kwargs):
+    """
+    Ejecuta la descomposición y retorna sus métricas con las columnas de results.csv.
+
+    El número de variables y restricciones no aplica y se reporta como "N/A".
+    """
+    start_time = time.time()
+    solucion = descomponer(parsed_data, **kwargs)
+    end_time = time.time()
+    return {
+        "Modelo": "Descomposicion",
+        "Benchmark": benchmark,
+        "Instancia": instance,
+        "Número de Variables": "N/A",
+        "Número de Restricciones": "N/A",
+        "Valor Función Objetivo": solucion["costo"],
+        "Tiempo de Cómputo (s)": end_time - start_time
+    }
+
+
+def main(argv=None):
+    from runner import COLUMNAS, INSTANCIAS, abrir_csv, directorio_benchmark
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--benchmarks", nargs="+", default=list(INSTANCIAS))
+    parser.add_argument("--instancias", nargs="+", default=None)
+    parser.add_argument("--iteraciones", type=int, default=10)
+    parser.add_argument("--iteraciones-sub", type=int, default=2000)
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--base", default="Instances")
+    parser.add_argument("--salida", default=None, help="CSV donde agregar los resultados (opcional)")
+    args = parser.parse_args(argv)
+
+    file, writer = abrir_csv(args.salida) if args.salida else (None, None)
+    try:
+        for benchmark in args.benchmarks:
+            directorio = directorio_benchmark(benchmark, args.base)
+            disponibles = sorted(os.path.basename(p) for p in glob.glob(os.path.join(directorio, "*.dat")))
+            for patron in args.instancias or INSTANCIAS.get(benchmark, ["*.dat"]):
+                for nombre in fnmatch.filter(disponibles, patron):
+                    parsed_data = parse_file(os.path.join(directorio, nombre))
+                    metrics = get_metrics_descomposicion(parsed_data, benchmark, nombre, iteraciones=args.iteraciones,
+                                                         tiempo_limite=args.time_limit, workers=args.workers,
+                                                         iteraciones_sub=args.iteraciones_sub,
+                                                         semilla=args.semilla, threads=args.threads)
+                    print(", ".join(str(metrics[c]) for c in COLUMNAS))
+                    if writer is not None:
+                        writer.writerow(metrics)
+                        file.flush()
+    finally:
+        if file is not None:
+            file.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+"""
+Fijación de variables por costo reducido y por cotas antes de resolver el MIP.
+
+Con la cota inferior z_LP de la relajación lineal y una cota superior z_UB (la de una solución
+conocida), toda solución que mejore z_UB cumple, para cada variable en su cota inferior en el
+óptimo del LP con costo reducido rc > 0, que x_j - lb_j <= (z_UB - z_LP) / rc (y lo simétrico en
+la cota superior). Así:
+    - las variables binarias (x, y, y las v de los modelos donde son binarias) con
+      |rc| > z_UB - z_LP quedan fijas en el valor que tienen en el LP;
+    - las continuas (f, v) se acotan a lb + (z_UB - z_LP) / rc.
+Las soluciones con costo z_UB no se eliminan, así que la solución de la cota superior (por ejemplo
+el MIP start heurístico) sigue siendo factible.
+
+Además se descartan los conjuntos de depósitos abiertos que no pueden ser parte de una solución
+que mejore z_UB: los cuyo costo de apertura (coeficientes de y en el objetivo, los demás costos
+son no negativos) supera z_UB y, en las formulaciones donde depot_capacities acota la demanda
+asignada a cada depósito (FORMULACIONES_COBERTURA), los que no cubren la demanda total. Se
+agregan las restricciones agregadas correspondientes y, con pocos depósitos, se enumeran todos
+los subconjuntos para fijar los depósitos que están abiertos (o cerrados) en todos los que
+quedan.
+
+La cota superior sale de la heurística constructiva evaluada en el objetivo del modelo o del
+mejor objetivo del mismo modelo en la base de resultados (resultados.py). En CDA la heurística
+entra sólo con su apertura y su asignación (v, y, con x = 0; ver FORMULACIONES_SIN_ARCOS). La de
+la heurística sólo se usa si su punto cumple las filas, las cotas y la integralidad del modelo
+(punto_factible); si no hay cota verificada no se resuelve el LP, y si queda bajo z_LP no se fija
+nada. En ambos casos el motivo queda en las estadísticas ("omitida").
+
+Uso (desde la raíz del repositorio):
+    python fijacion.py Instances/Benchmark_1/coord50-5-1.dat --formulacion SCF --solver gurobi --ir \\
+        [--db results.db] [--cota-superior Z] [--resolver --time-limit 60]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import cplex
+from gurobipy import GRB, quicksum
+from scipy.sparse import csr_matrix
+
+from heuristica import construir_solucion
+from mip_start import VALORES_INICIO
+from resultados import conectar
+from testParser import parse_file
+
+# Número máximo de depósitos para enumerar todos los subconjuntos de depósitos abiertos
+MAX_DEPOSITOS_ENUMERACION = 20
+
+# Formulaciones cuyas filas de depot_capacities acotan la demanda asignada a cada depósito, así que
+# los depósitos abiertos deben cubrir la demanda total. En SCF sólo acotan el flujo que sale del
+# depósito, que puede ser 0 (el flujo crece hacia el depósito final), y la cobertura no se cumple.
+FORMULACIONES_COBERTURA = ("CDA",)
+
+# Formulaciones en las que las rutas de la heurística no son un punto factible: en CDA la fila
+# vehicle_capacity acota la demanda de todos los arcos entre clientes a la vez, así que la cota
+# superior se evalúa en el punto con la apertura y la asignación de la heurística y x = 0
+FORMULACIONES_SIN_ARCOS = ("CDA",)
+
+
+def _familia(nombre):
+    """
+    Nombre del bloque de una variable ("x" para "x[1,2]" o "x_1_2").
+    """
+    return nombre.split("[")[0].split("_")[0]
+
+
+def datos_modelo(model_instance, solver):
+    """
+    Nombres, costos, cotas y tipos de todas las variables del modelo, en el orden del motor.
+
+    Retorna:
+        dict: "nombres" (lista), "c", "lb", "ub" (arreglos) y "enteras" (arreglo booleano).
+    """
+    if solver == 'gurobi':
+        model_instance.update()
+        variables = model_instance.getVars()
+        return {
+            "nombres": model_instance.getAttr("VarName", variables),
+            "c": np.asarray(model_instance.getAttr("Obj", variables), dtype=np.float64),
+            "lb": np.asarray(model_instance.getAttr("LB", variables), dtype=np.float64),
+            "ub": np.asarray(model_instance.getAttr("UB", variables), dtype=np.float64),
+            "enteras": np.asarray([t != GRB.CONTINUOUS for t in model_instance.getAttr("VType", variables)]),
+        }
+    cpx = model_instance.get_cplex()
+    ub = np.asarray(cpx.variables.get_upper_bounds(), dtype=np.float64)
+    return {
+        "nombres": cpx.variables.get_names(),
+        "c": np.asarray(cpx.objective.get_linear(), dtype=np.float64),
+        "lb": np.asarray(cpx.variables.get_lower_bounds(), dtype=np.float64),
+        "ub": np.where(ub >= cplex.infinity, np.inf, ub),
+        "enteras": np.asarray([t != 'C' for t in cpx.variables.get_types()]),
+    }
+
+
+def relajacion_costos_reducidos(model_instance, solver):
+    """
+    Resuelve la relajación lineal sobre una copia del modelo.
+
+    Retorna:
+        tuple: (cota z_LP, valores, costos reducidos) en el orden de las variables del modelo, o
+            (None, None, None) si el LP no terminó en óptimo.
+    """
+    if solver == 'gurobi':
+        relajado = model_instance.relax()
+        relajado.Params.OutputFlag = 0
+        relajado.optimize()
+        try:
+            if relajado.Status != GRB.OPTIMAL:
+                return None, None, None
+            variables = relajado.getVars()
+            return (relajado.ObjVal, np.asarray(relajado.getAttr("X", variables), dtype=np.float64),
+                    np.asarray(relajado.getAttr("RC", variables), dtype=np.float64))
+        finally:
+            relajado.dispose()
+
+    copia = cplex.Cplex(model_instance.get_cplex())
+    try:
+        copia.set_log_stream(None)
+        copia.set_results_stream(None)
+        copia.set_warning_stream(None)
+        copia.set_problem_type(copia.problem_type.LP)
+        copia.solve()
+        if copia.solution.get_status() != copia.solution.status.optimal:
+            return None, None, None
+        return (copia.solution.get_objective_value(), np.asarray(copia.solution.get_values(), dtype=np.float64),
+                np.asarray(copia.solution.get_reduced_costs(), dtype=np.float64))
+    finally:
+        copia.end()
+
+
+def fijar_por_costo_reducido(lb, ub, enteras, valores, costos_reducidos, brecha, tol=1e-6):
+    """
+    Nuevas cotas de las variables tras la fijación por costo reducido.
+
+    Parámetros:
+        lb, ub (ndarray): Cotas actuales.
+        enteras (ndarray): Máscara de variables enteras o binarias.
+        valores (ndarray): Solución óptima del LP.
+        costos_reducidos (ndarray): Costos reducidos del LP (problema de minimización).
+        brecha (float): z_UB - z_LP (no negativa).
+        tol (float): Tolerancia para decidir si una variable está en su cota y para la brecha.
+
+    Retorna:
+        tuple: (lb, ub) nuevas.
+    """
+    lb, ub = lb.copy(), ub.copy()
+    rc = costos_reducidos
+    en_inferior = (valores <= lb + tol) & (rc > tol)
+    en_superior = (valores >= ub - tol) & (rc < -tol) & np.isfinite(ub)
+    with np.errstate(divide='ignore'):
+        holgura = (brecha + tol) / np.abs(rc)
+    holgura = np.where(enteras, np.floor(holgura), holgura)
+    ub[en_inferior] = np.minimum(ub[en_inferior], lb[en_inferior] + holgura[en_inferior])
+    lb[en_superior] = np.maximum(lb[en_superior], ub[en_superior] - holgura[en_superior])
+    return lb, ub
+
+
+def _indices_y(nombres, formulacion, formato, n):
+    """
+    Posición en el modelo de la variable y de cada depósito (índices locales 0..m-1).
+    """
+    desplazamiento = n if formulacion == "CDA" and formato == 'gurobi' else 0
+    indices = {}
+    for k, nombre in enumerate(nombres):
+        if nombre.startswith("y[") or nombre.startswith("y_"):
+            indices[int(nombre[2:].rstrip("]")) - desplazamiento] = k
+    return indices
+
+
+def subconjuntos_depositos(capacidades, costos, demanda, cota_superior, tol=1e-6):
+    """
+    Depósitos que quedan fijos al descartar los conjuntos de depósitos abiertos que no cubren la
+    demanda o cuyo costo de apertura supera la cota superior.
+
+    Con hasta MAX_DEPOSITOS_ENUMERACION depósitos se enumeran todos los subconjuntos; con más sólo
+    se fijan abiertos los depósitos sin los que el resto no cubre la demanda.
+
+    Retorna:
+        tuple: (máscara de depósitos fijos abiertos, máscara de fijos cerrados, subconjuntos
+            descartados o None si no se enumeraron).
+    """
+    m = capacidades.size
+    if m > MAX_DEPOSITOS_ENUMERACION:
+        abiertos = capacidades.sum() - capacidades < demanda - tol
+        return abiertos, np.zeros(m, dtype=bool), None
+    conjuntos = (np.arange(2 ** m)[:, None] >> np.arange(m)) & 1
+    validos = (conjuntos @ capacidades >= demanda - tol) & (conjuntos @ costos <= cota_superior + tol)
+    if not validos.any():
+        return np.zeros(m, dtype=bool), np.zeros(m, dtype=bool), 0
+    restantes = conjuntos[validos].astype(bool)
+    return restantes.all(axis=0), ~restantes.any(axis=0), int(2 ** m - validos.sum())
+
+
+def _filas_modelo(model_instance, solver):
+    """
+    Matriz de restricciones lineales, lado derecho, sentido ("<", ">", "=") y rango (0 salvo en
+    las filas de rango de CPLEX) del modelo; None si tiene restricciones que no son lineales.
+    """
+    if solver == 'gurobi':
+        model_instance.update()
+        if model_instance.NumQConstrs or model_instance.NumGenConstrs or model_instance.NumSOS:
+            return None
+        restricciones = model_instance.getConstrs()
+        sentidos = np.asarray(model_instance.getAttr("Sense", restricciones))
+        return (model_instance.getA().tocsr(),
+                np.asarray(model_instance.getAttr("RHS", restricciones), dtype=np.float64),
+                sentidos, np.zeros(sentidos.size))
+    cpx = model_instance.get_cplex()
+    if cpx.quadratic_constraints.get_num() or cpx.indicator_constraints.get_num() or cpx.SOS.get_num():
+        return None
+    filas = cpx.linear_constraints.get_rows()
+    largos = [len(fila.ind) for fila in filas]
+    A = csr_matrix((np.concatenate([fila.val for fila in filas]) if filas else np.zeros(0),
+                    np.concatenate([fila.ind for fila in filas]).astype(np.int64) if filas else np.zeros(0, np.int64),
+                    np.concatenate(([0], np.cumsum(largos)))),
+                   shape=(len(filas), cpx.variables.get_num()))
+    sentidos = np.array([{"L": "<", "G": ">", "E": "=", "R": "R"}[k] for k in cpx.linear_constraints.get_senses()])
+    return (A, np.asarray(cpx.linear_constraints.get_rhs(), dtype=np.float64), sentidos,
+            np.asarray(cpx.linear_constraints.get_range_values(), dtype=np.float64))
+
+
+def punto_factible(model_instance, solver, x, datos=None, tol=1e-6):
+    """
+    Verifica que un punto cumple las filas lineales (residuos de A·x contra el lado derecho), las
+    cotas lb <= x <= ub y la integralidad del modelo.
+
+    Retorna:
+        bool: True si el punto es factible en el modelo (False si el modelo tiene restricciones
+            no lineales que no se pueden revisar).
+    """
+    datos = datos or datos_modelo(model_instance, solver)
+    if np.any(x < datos["lb"] - tol) or np.any(x > datos["ub"] + tol):
+        return False
+    if np.any(np.abs(x[datos["enteras"]] - np.round(x[datos["enteras"]])) > tol):
+        return False
+    filas = _filas_modelo(model_instance, solver)
+    if filas is None:
+        return False
+    A, rhs, sentidos, rangos = filas
+    ax = A @ x
+    escala = tol * np.maximum(1.0, np.abs(rhs))
+    # Filas de rango de CPLEX: rhs <= a·x <= rhs + rango (rango negativo invierte los extremos)
+    inferior = np.where(sentidos == "R", rhs + np.minimum(rangos, 0.0), rhs)
+    superior = np.where(sentidos == "R", rhs + np.maximum(rangos, 0.0), rhs)
+    viola = (((sentidos == "<") | (sentidos == "=") | (sentidos == "R")) & (ax > superior + escala)) | \
+            (((sentidos == ">") | (sentidos == "=") | (sentidos == "R")) & (ax < inferior - escala))
+    return not viola.any()
+
+
+def cota_superior_heuristica(model_instance, formulacion, solver, parsed_data, datos=None, nombres=None):
+    """
+    Valor en el objetivo del modelo de la solución de la heurística constructiva (la misma que
+    carga mip_start.aplicar_inicio, sin los arcos x en FORMULACIONES_SIN_ARCOS), o None si ese punto
+    no es factible en el modelo.
+    """
+    datos = datos or datos_modelo(model_instance, solver)
+    try:
+        solucion = construir_solucion(parsed_data, una_ruta_por_deposito=formulacion == "SCF")
+    except ValueError:
+        solucion = construir_solucion(parsed_data)
+    valores = VALORES_INICIO[formulacion](parsed_data, solucion, nombres or solver)
+    if formulacion in FORMULACIONES_SIN_ARCOS:
+        valores = {nombre: valor for nombre, valor in valores.items() if _familia(nombre) != "x"}
+    x = np.array([valores.get(nombre, 0.0) for nombre in datos["nombres"]])
+    if not punto_factible(model_instance, solver, x, datos):
+        return None
+    return float(datos["c"] @ x)
+
+
+def cota_superior_resultados(db, trabajo, modelo):
+    """
+    Mejor objetivo guardado en la base de resultados para el mismo modelo (mismo nombre, es decir
+    misma formulación y variante) y la misma instancia; None si no hay.
+    """
+    if not db or not os.path.exists(db):
+        return None
+    con = conectar(db)
+    try:
+        fila = con.execute("SELECT MIN(objetivo) FROM resultados WHERE formulacion = ? AND solver = ? AND "
+                           "benchmark = ? AND instancia = ? AND modelo = ?",
+                           (trabajo["formulacion"], trabajo["solver"], trabajo["benchmark"], trabajo["instancia"],
+                            modelo)).fetchone()
+        return fila[0]
+    finally:
+        con.close()
+
+
+def _aplicar(model_instance, solver, lb, ub, cambios, restricciones):
+    """
+    Cambia las cotas de las variables en `cambios` y agrega las restricciones (lista de
+    (nombre, índices, coeficientes, sentido, lado derecho)).
+    """
+    if solver == 'gurobi':
+        variables = model_instance.getVars()
+        seleccion = [variables[k] for k in cambios.tolist()]
+        model_instance.setAttr("LB", seleccion, lb[cambios].tolist())
+        model_instance.setAttr("UB", seleccion, ub[cambios].tolist())
+        for nombre, indices, coeficientes, sentido, rhs in restricciones:
+            expr = quicksum(a * variables[k] for k, a in zip(indices, coeficientes))
+            model_instance.addConstr(expr >= rhs if sentido == ">=" else expr <= rhs, name=nombre)
+        model_instance.update()
+        return
+    variables = list(model_instance.iter_variables())
+    seleccion = [variables[k] for k in cambios.tolist()]
+    model_instance.change_var_lower_bounds(seleccion, lb[cambios].tolist())
+    model_instance.change_var_upper_bounds(seleccion, ub[cambios].tolist())
+    for nombre, indices, coeficientes, sentido, rhs in restricciones:
+        expr = model_instance.scal_prod([variables[k] for k in indices], coeficientes)
+        model_instance.add_constraint(expr >= rhs if sentido == ">=" else expr <= rhs, nombre)
+
+
+def fijar(model_instance, formulacion, solver, parsed_data, cota_superior=None, nombres=None, tol=1e-6):
+    """
+    Fija y acota variables del modelo antes de resolverlo (ver la descripción del módulo).
+
+    Parámetros:
+        model_instance: Modelo de Gurobi o docplex ya construido.
+        formulacion (str): "SCF" o "CDA".
+        solver (str): "gurobi" o "cplex".
+        parsed_data (dict): Diccionario con los datos parseados.
+        cota_superior (float): Objetivo de una solución conocida del mismo modelo; si es None se
+            usa el de la heurística constructiva, si su punto es factible en el modelo.
+        nombres (str): Formato de los nombres de las variables ("gurobi" o "cplex"); por defecto
+            el del solver (los modelos de representacion usan los de Gurobi en ambos).
+        tol (float): Tolerancia numérica.
+
+    Retorna:
+        dict: Estadísticas: cota LP y superior, variables fijas por bloque ("fijadas"), variables
+            continuas acotadas, depósitos fijos, subconjuntos de depósitos descartados, restricciones
+            agregadas, tamaño del modelo, tiempo y "omitida" (motivo por el que no se fijó nada,
+            o None). También quedan en model_instance._fijacion.
+    """
+    start_time = time.perf_counter()
+    nombres = nombres or solver
+    datos = datos_modelo(model_instance, solver)
+    if cota_superior is None:
+        cota_superior = cota_superior_heuristica(model_instance, formulacion, solver, parsed_data, datos, nombres)
+    stats = {"cota_lp": None, "cota_superior": cota_superior, "variables": len(datos["nombres"]), "fijadas": {},
+             "acotadas": 0, "depositos_abiertos": [], "depositos_cerrados": [], "subconjuntos_descartados": None,
+             "restricciones": 0, "tiempo": 0.0, "omitida": None}
+
+    lb, ub = datos["lb"], datos["ub"]
+    # Sin una cota superior verificada y no menor que z_LP no hay nada seguro que fijar
+    if cota_superior is None:
+        stats["omitida"] = "la solución heurística no es factible en el modelo"
+    else:
+        cota_lp, valores, costos_reducidos = relajacion_costos_reducidos(model_instance, solver)
+        stats["cota_lp"] = cota_lp
+        if cota_lp is not None and cota_superior < cota_lp - tol:
+            stats["omitida"] = "z_UB menor que z_LP"
+    if stats["omitida"] is not None:
+        stats["tiempo"] = time.perf_counter() - start_time
+        model_instance._fijacion = stats
+        return stats
+    if cota_lp is not None:
+        lb, ub = fijar_por_costo_reducido(lb, ub, datos["enteras"], valores, costos_reducidos,
+                                          max(cota_superior - cota_lp, 0.0), tol)
+
+    # Conjuntos de depósitos abiertos
+    n = parsed_data["num_customers"]
+    capacidades = np.asarray(parsed_data["depot_capacities"], dtype=np.float64)
+    demanda = float(np.sum(parsed_data["customer_demands"])) if formulacion in FORMULACIONES_COBERTURA else 0.0
+    indices_y = _indices_y(datos["nombres"], formulacion, nombres, n)
+    restricciones = []
+    if len(indices_y) == capacidades.size:
+        columnas = np.array([indices_y[d] for d in range(capacidades.size)])
+        costos = datos["c"][columnas]
+        if demanda > 0:
+            restricciones.append(("fijacion_capacidad", columnas.tolist(), capacidades.tolist(), ">=", demanda))
+        # El resto del objetivo es no negativo, así que la apertura sola no puede superar z_UB
+        otras = np.setdiff1d(np.arange(len(datos["nombres"])), columnas)
+        if np.all(datos["c"][otras] >= 0) and np.all(datos["lb"][otras] >= 0):
+            restricciones.append(("fijacion_presupuesto", columnas.tolist(), costos.tolist(), "<=", cota_superior))
+            abiertos, cerrados, descartados = subconjuntos_depositos(capacidades, costos, demanda, cota_superior, tol)
+            lb[columnas[abiertos]] = np.maximum(lb[columnas[abiertos]], 1.0)
+            ub[columnas[cerrados]] = 0.0
+            stats.update(depositos_abiertos=np.flatnonzero(abiertos).tolist(),
+                         depositos_cerrados=np.flatnonzero(cerrados).tolist(), subconjuntos_descartados=descartados)
+    stats["restricciones"] = len(restricciones)
+
+    cambios = np.flatnonzero((lb != datos["lb"]) | (ub != datos["ub"]))
+    fijas = cambios[lb[cambios] >= ub[cambios] - tol]
+    for k in fijas.tolist():
+        familia = _familia(datos["nombres"][k])
+        stats["fijadas"][familia] = stats["fijadas"].get(familia, 0) + 1
+    stats["acotadas"] = int(cambios.size - fijas.size)
+    ub[fijas] = lb[fijas]
+    _aplicar(model_instance, solver, lb, ub, cambios, restricciones)
+    stats["tiempo"] = time.perf_counter() - start_time
+    model_instance._fijacion = stats
+    return stats
+
+
+def resumen(stats):
+    """
+    Línea de resumen de las estadísticas de fijar.
+    """
+    if stats.get("omitida"):
+        return f"z_LP {stats['cota_lp']}, z_UB {stats['cota_superior']}: sin fijación ({stats['omitida']})"
+    fijadas = sum(stats["fijadas"].values())
+    por_bloque = ", ".join(f"{k}: {v}" for k, v in sorted(stats["fijadas"].items())) or "-"
+    return (f"z_LP {stats['cota_lp']}, z_UB {stats['cota_superior']}: {fijadas} de {stats['variables']} variables "
+            f"fijas ({100.0 * fijadas / max(stats['variables'], 1):.1f} %; {por_bloque}), {stats['acotadas']} "
+            f"acotadas, depósitos abiertos {stats['depositos_abiertos']} y cerrados {stats['depositos_cerrados']}, "
+            f"{stats['subconjuntos_descartados']} conjuntos de depósitos descartados, {stats['tiempo']:.2f} s")
+
+
+def main(argv=None):
+    # runner usa fijar al construir los modelos, así que se importa aquí para evitar el ciclo
+    from runner import GET_METRICS, MODELOS, construir_modelo
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancia")
+    parser.add_argument("--formulacion", choices=list(MODELOS), default="SCF")
+    parser.add_argument("--solver", choices=["cplex", "gurobi"], default="gurobi")
+    parser.add_argument("--ir", action="store_true")
+    parser.add_argument("--k-vecinos", type=int, default=None)
+    parser.add_argument("--cota-superior", type=float, default=None)
+    parser.add_argument("--db", default=None, help="tomar la cota superior del mejor resultado guardado")
+    parser.add_argument("--resolver", action="store_true", help="resolver el modelo después de fijar")
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--time-limit", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    parsed_data = parse_file(args.instancia)
+    trabajo = {"formulacion": args.formulacion, "solver": args.solver, "ruta": args.instancia,
+               "benchmark": os.path.basename(os.path.dirname(os.path.abspath(args.instancia))),
+               "instancia": os.path.basename(args.instancia), "threads": args.threads,
+               "time_limit": args.time_limit, "mip_start": None, "k_vecinos": args.k_vecinos, "ir": args.ir}
+    model_instance = construir_modelo(trabajo, parsed_data)
+    modelo = model_instance.ModelName if args.solver == 'gurobi' else model_instance.name
+    cota_superior = args.cota_superior
+    if cota_superior is None:
+        cota_superior = cota_superior_resultados(args.db, trabajo, modelo)
+    print(resumen(fijar(model_instance, args.formulacion, args.solver, parsed_data, cota_superior,
+                        'gurobi' if args.ir else None)))
+    if args.resolver:
+        metrics = GET_METRICS[args.solver](model_instance, trabajo["benchmark"], trabajo["instancia"],
+                                           threads=args.threads, time_limit=args.time_limit)
+        print(metrics)
+    if args.solver == 'gurobi':
+        model_instance.dispose()
+    else:
+        model_instance.end()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Generador de instancias sintéticas con semilla, en el mismo formato .dat que lee parse_file.
+
+Las instancias imitan las del benchmark 1 (coordenadas enteras en un cuadrado, demandas enteras
+entre 11 y 20, costo de apertura de ruta 1000) con tamaño, distribución espacial y holgura de
+capacidad configurables:
+    - distribución "uniforme": clientes y depósitos uniformes en el cuadrado;
+    - distribución "agrupada": clientes alrededor de centros normales, con depósitos cerca de ellos;
+    - distribución "mixta": la mitad de los clientes uniformes y la mitad agrupados.
+La holgura de depósitos es el cociente entre la capacidad total de los depósitos y la demanda
+total; la del vehículo se fija como el número medio de clientes que caben en una ruta.
+
+Uso (desde la raíz del repositorio):
+    python generador.py --tamanos 50x5 100x10 400x20 --semillas 1 2 3 --distribucion agrupada \\
+        --salida Instances/Benchmark_S
+"""
+import argparse
+import os
+
+import numpy as np
+
+# Distribuciones espaciales de los clientes
+DISTRIBUCIONES = ("uniforme", "agrupada", "mixta")
+
+
+def _puntos_agrupados(rng, cantidad, centros, lado):
+    asignados = centros[rng.integers(0, len(centros), cantidad)]
+    return np.clip(np.rint(asignados + rng.normal(0.0, lado / 12.0, (cantidad, 2))), 0, lado)
+
+
+def generar_instancia(n, m, semilla=0, distribucion="uniforme", lado=50, holgura_deposito=2.0,
+                      clientes_por_ruta=5.0):
+    """
+    Genera una instancia sintética con el formato del diccionario de parse_file (sin la matriz de
+    distancias, que calcula parse_file al leer el archivo).
+
+    Parámetros:
+        n (int): Número de clientes.
+        m (int): Número de depósitos.
+        semilla (int): Semilla del generador; la misma semilla produce la misma instancia.
+        distribucion (str): "uniforme", "agrupada" o "mixta".
+        lado (int): Lado del cuadrado de coordenadas.
+        holgura_deposito (float): Capacidad total de los depósitos sobre la demanda total (mayor
+            que 1; valores cercanos a 1 dan instancias ajustadas).
+        clientes_por_ruta (float): Clientes de demanda media que caben en un vehículo.
+
+    Retorna:
+        dict: Datos de la instancia con coordenadas, capacidades, demandas y costos enteros.
+    """
+    if distribucion not in DISTRIBUCIONES:
+        raise ValueError(f"Distribución desconocida: {distribucion} (opciones: {', '.join(DISTRIBUCIONES)})")
+    if holgura_deposito <= 1.0:
+        raise ValueError("holgura_deposito debe ser mayor que 1 para que la instancia sea factible")
+    rng = np.random.default_rng(semilla)
+
+    if distribucion == "uniforme":
+        depots = rng.integers(0, lado + 1, (m, 2)).astype(np.float64)
+        customers = rng.integers(0, lado + 1, (n, 2)).astype(np.float64)
+    else:
+        centros = rng.uniform(lado * 0.1, lado * 0.9, (max(2, m // 2), 2))
+        depots = _puntos_agrupados(rng, m, centros, lado)
+        agrupados = n if distribucion == "agrupada" else n // 2
+        customers = np.concatenate([_puntos_agrupados(rng, agrupados, centros, lado),
+                                    rng.integers(0, lado + 1, (n - agrupados, 2)).astype(np.float64)])
+        customers = customers[rng.permutation(n)]
+
+    demands = rng.integers(11, 21, n).astype(np.float64)
+    vehicle_capacity = float(np.ceil(clientes_por_ruta * demands.mean()))
+    # Capacidades de depósito con ±25 % de variación, escaladas a la holgura pedida
+    pesos = rng.uniform(0.75, 1.25, m)
+    depot_capacities = np.ceil(pesos / pesos.sum() * holgura_deposito * demands.sum())
+    # Costo de apertura proporcional a la capacidad, como en las instancias del benchmark 1
+    depot_opening_costs = np.rint(depot_capacities * rng.uniform(40.0, 60.0, m))
+
+    return {
+        "num_customers": n,
+        "num_depots": m,
+        "depots": [tuple(p) for p in depots.tolist()],
+        "customers": [tuple(p) for p in customers.tolist()],
+        "vehicle_capacity": vehicle_capacity,
+        "depot_capacities": depot_capacities.tolist(),
+        "customer_demands": demands.tolist(),
+        "depot_opening_costs": depot_opening_costs.tolist(),
+        "route_opening_cost": 1000.0,
+    }
+
+
+def _numero(valor):
+    return str(int(valor)) if float(valor).is_integer() else repr(float(valor))
+
+
+def escribir_instancia(datos, ruta):
+    """
+    Escribe una instancia en el formato .dat del benchmark 1 (secciones separadas por una línea en
+    blanco, coordenadas separadas por tabulador y un 0 final).
+    """
+    secciones = [
+        [str(datos["num_customers"])],
+        [str(datos["num_depots"])],
+        ["\t".join(map(_numero, p)) for p in datos["depots"]],
+        ["\t".join(map(_numero, p)) for p in datos["customers"]],
+        [_numero(datos["vehicle_capacity"])],
+        [_numero(c) for c in datos["depot_capacities"]],
+        [_numero(q) for q in datos["customer_demands"]],
+        [_numero(f) for f in datos["depot_opening_costs"]],
+        [_numero(datos["route_opening_cost"])],
+        ["0"],
+    ]
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, 'w') as file:
+        file.write("\n".join(secciones[0] + secciones[1]) + "\n\n")
+        file.write("".join("\n".join(seccion) + "\n\n" for seccion in secciones[2:]))
+
+
+def nombre_instancia(n, m, semilla, distribucion="uniforme"):
+    """
+    Nombre de archivo de una instancia sintética (coord<n>-<m>-<semilla> con sufijo u/a/x según
+    la distribución).
+    """
+    return f"coord{n}-{m}-{semilla}{distribucion[0] if distribucion != 'mixta' else 'x'}.dat"
+
+
+def generar(tamanos, semillas, directorio, **kwargs):
+    """
+    Genera y escribe una instancia por cada tamaño (n, m) y semilla.
+
+    Retorna:
+        list: Rutas de los archivos escritos.
+    """
+    rutas = []
+    for n, m in tamanos:
+        for semilla in semillas:
+            ruta = os.path.join(directorio, nombre_instancia(n, m, semilla, kwargs.get("distribucion", "uniforme")))
+            escribir_instancia(generar_instancia(n, m, semilla, **kwargs), ruta)
+            rutas.append(ruta)
+    return rutas
+
+
+def tamano(texto):
+    """
+    Interpreta un tamaño "NxM" (clientes x depósitos).
+    """
+    n, _, m = texto.lower().partition("x")
+    return int(n), int(m)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=tamano, nargs="+", required=True, help="tamaños NxM")
+    parser.add_argument("--semillas", type=int, nargs="+", default=[1])
+    parser.add_argument("--distribucion", choices=DISTRIBUCIONES, default="uniforme")
+    parser.add_argument("--lado", type=int, default=50)
+    parser.add_argument("--holgura-deposito", type=float, default=2.0)
+    parser.add_argument("--clientes-por-ruta", type=float, default=5.0)
+    parser.add_argument("--salida", default=os.path.join("Instances", "Benchmark_S"))
+    args = parser.parse_args(argv)
+
+    for ruta in generar(args.tamanos, args.semillas, args.salida, distribucion=args.distribucion, lado=args.lado,
+                        holgura_deposito=args.holgura_deposito, clientes_por_ruta=args.clientes_por_ruta):
+        print(ruta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Heurística constructiva para el problema de localización-ruteo con múltiples depósitos.
+
+Trabaja directamente sobre el diccionario de parse_file (listas o arreglos de NumPy):
+    1. Abre depósitos en orden de costo de apertura por unidad de capacidad hasta cubrir la demanda.
+    2. Asigna clientes por arrepentimiento (regret) al depósito abierto más cercano con capacidad.
+    3. Construye las rutas de cada depósito con ahorros de Clarke-Wright o con barrido (sweep).
+
+Índices: depósito d en 0..m-1 (nodo d de la matriz de distancias) y cliente i en 0..n-1 (nodo m + i).
+"""
+import numpy as np
+
+
+def _datos(parsed_data):
+    m = parsed_data["num_depots"]
+    return (
+        parsed_data["num_customers"],
+        m,
+        np.asarray(parsed_data["distance_matrix"], dtype=np.float64),
+        np.asarray(parsed_data["customer_demands"], dtype=np.float64),
+        np.asarray(parsed_data["depot_capacities"], dtype=np.float64),
+        np.asarray(parsed_data["depot_opening_costs"], dtype=np.float64),
+    )
+
+
+def costo_ruta(costs, d, ruta, m):
+    """
+    Costo de recorrido de una ruta que sale y vuelve al depósito d.
+    """
+    nodos = np.concatenate(([d], np.asarray(ruta, dtype=np.int64) + m, [d]))
+    return float(costs[nodos[:-1], nodos[1:]].sum())
+
+
+def costo_solucion(parsed_data, solucion):
+    """
+    Costo total de una solución: apertura de depósitos, apertura de rutas y distancia recorrida.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        solucion (dict): Solución con las llaves "depositos" y "rutas" (lista de (d, [clientes])).
+
+    Retorna:
+        float: Costo total.
+    """
+    n, m, costs, _, _, opening = _datos(parsed_data)
+    return (float(opening[list(solucion["depositos"])].sum())
+            + parsed_data["route_opening_cost"] * len(solucion["rutas"])
+            + sum(costo_ruta(costs, d, ruta, m) for d, ruta in solucion["rutas"]))
+
+
+def abrir_depositos(parsed_data, capacidad=None, holgura=0.0):
+    """
+    Abre depósitos de menor costo de apertura por unidad de capacidad hasta cubrir la demanda total.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        capacidad (ndarray): Capacidad efectiva de cada depósito (por defecto depot_capacities).
+        holgura (float): Fracción de capacidad extra sobre la demanda total.
+
+    Retorna:
+        ndarray: Arreglo booleano (m,) con los depósitos abiertos.
+    """
+    n, m, _, demands, caps, opening = _datos(parsed_data)
+    capacidad = caps if capacidad is None else capacidad
+    abiertos = np.zeros(m, dtype=bool)
+    requerido = demands.sum() * (1.0 + holgura)
+    for d in np.argsort(opening / np.maximum(capacidad, 1e-9), kind='stable'):
+        if capacidad[abiertos].sum() >= requerido:
+            break
+        abiertos[d] = True
+    return abiertos
+
+
+def asignar_clientes(parsed_data, abiertos, capacidad=None):
+    """
+    Asigna cada cliente a un depósito abierto, priorizando a los de mayor arrepentimiento.
+
+    Si un cliente no cabe en ningún depósito abierto se abre el depósito cerrado más barato
+    (apertura más distancia) que tenga capacidad suficiente.
+
+    Retorna:
+        tuple: (asignación (n,) con el depósito de cada cliente, depósitos abiertos (m,))
+    """
+    n, m, costs, demands, caps, opening = _datos(parsed_data)
+    capacidad = caps if capacidad is None else capacidad
+    abiertos = abiertos.copy()
+    residual = capacidad.astype(np.float64).copy()
+    dist = costs[m:, :m]  # (n, m) distancia cliente-depósito
+    asignacion = np.full(n, -1, dtype=np.int64)
+
+    ordenadas = np.sort(np.where(abiertos, dist, np.inf), axis=1)
+    regret = ordenadas[:, 1] - ordenadas[:, 0] if m > 1 else np.zeros(n)
+    regret = np.nan_to_num(regret, posinf=np.finfo(np.float64).max)
+    for i in np.argsort(-regret, kind='stable'):
+        candidatos = np.nonzero(abiertos & (residual >= demands[i]))[0]
+        if candidatos.size == 0:
+            cerrados = np.nonzero(~abiertos & (residual >= demands[i]))[0]
+            if cerrados.size == 0:
+                raise ValueError(f"No hay capacidad de depósito suficiente para el cliente {i}")
+            d = cerrados[np.argmin(opening[cerrados] + dist[i, cerrados])]
+            abiertos[d] = True
+        else:
+            d = candidatos[np.argmin(dist[i, candidatos])]
+        asignacion[i] = d
+        residual[d] -= demands[i]
+
+    abiertos &= np.bincount(asignacion, minlength=m) > 0
+    return asignacion, abiertos
+
+
+def rutas_savings(parsed_data, d, clientes, capacidad):
+    """
+    Rutas de un depósito con el algoritmo de ahorros de Clarke-Wright (versión paralela).
+
+    Retorna:
+        list: Lista de rutas (listas de clientes en orden de visita).
+    """
+    n, m, costs, demands, _, _ = _datos(parsed_data)
+    clientes = np.asarray(clientes, dtype=np.int64)
+    k = clientes.size
+    if k == 0:
+        return []
+
+    nodos = clientes + m
+    ahorro = costs[d, nodos][:, None] + costs[nodos, d][None, :] - costs[np.ix_(nodos, nodos)]
+    a, b = np.nonzero(np.triu(np.ones((k, k), dtype=bool), 1))
+    valores = ahorro[a, b]
+    orden = np.argsort(-valores, kind='stable')
+
+    rutas = {r: [r] for r in range(k)}
+    ruta_de = np.arange(k)
+    carga = {r: demands[clientes[r]] for r in range(k)}
+    for p in orden:
+        if valores[p] <= 0:
+            break
+        i, j = a[p], b[p]
+        ri, rj = ruta_de[i], ruta_de[j]
+        if ri == rj or carga[ri] + carga[rj] > capacidad:
+            continue
+        ruta_i, ruta_j = rutas[ri], rutas[rj]
+        # i y j deben ser extremos de sus rutas; se orientan para unir ...i + j...
+        if ruta_i[-1] != i:
+            if ruta_i[0] != i:
+                continue
+            ruta_i.reverse()
+        if ruta_j[0] != j:
+            if ruta_j[-1] != j:
+                continue
+            ruta_j.reverse()
+        ruta_i.extend(ruta_j)
+        carga[ri] += carga.pop(rj)
+        del rutas[rj]
+        ruta_de[ruta_j] = ri
+
+    return [[int(clientes[c]) for c in ruta] for ruta in rutas.values()]
+
+
+def rutas_sweep(parsed_data, d, clientes, capacidad):
+    """
+    Rutas de un depósito con el algoritmo de barrido: clientes ordenados por ángulo alrededor del
+    depósito y cortados en rutas cada vez que se excede la capacidad.
+
+    Retorna:
+        list: Lista de rutas (listas de clientes en orden de visita).
+    """
+    demands = np.asarray(parsed_data["customer_demands"], dtype=np.float64)
+    depot = np.asarray(parsed_data["depots"][d], dtype=np.float64)
+    customers = np.asarray(parsed_data["customers"], dtype=np.float64).reshape(-1, 2)
+    clientes = np.asarray(clientes, dtype=np.int64)
+    if clientes.size == 0:
+        return []
+
+    delta = customers[clientes] - depot
+    orden = clientes[np.argsort(np.arctan2(delta[:, 1], delta[:, 0]), kind='stable')]
+    rutas, actual, carga = [], [], 0.0
+    for i in orden:
+        if actual and carga + demands[i] > capacidad:
+            rutas.append(actual)
+            actual, carga = [], 0.0
+        actual.append(int(i))
+        carga += demands[i]
+    rutas.append(actual)
+    return rutas
+
+
+METODOS_RUTEO = {"savings": rutas_savings, "sweep": rutas_sweep}
+
+
+def construir_solucion(parsed_data, metodo="savings", una_ruta_por_deposito=False):
+    """
+    Construye una solución factible de localización-ruteo.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        metodo (str): "savings" (Clarke-Wright) o "sweep" (barrido).
+        una_ruta_por_deposito (bool): Limita cada depósito a una sola ruta (capacidad efectiva
+            min(capacidad del depósito, capacidad del vehículo)), como exige la formulación SCF.
+
+    Retorna:
+        dict: Solución con las llaves:
+            "depositos": lista de depósitos abiertos,
+            "asignacion": arreglo (n,) con el depósito de cada cliente,
+            "rutas": lista de tuplas (depósito, [clientes en orden de visita]),
+            "costo": costo total (ver costo_solucion).
+    """
+    vehicle_capacity = parsed_data["vehicle_capacity"]
+    capacidad = np.asarray(parsed_data["depot_capacities"], dtype=np.float64)
+    if una_ruta_por_deposito:
+        capacidad = np.minimum(capacidad, vehicle_capacity)
+
+    abiertos = abrir_depositos(parsed_data, capacidad)
+    asignacion, abiertos = asignar_clientes(parsed_data, abiertos, capacidad)
+
+    rutas = []
+    for d in np.nonzero(abiertos)[0]:
+        d = int(d)
+        clientes = np.nonzero(asignacion == d)[0]
+        rutas_d = METODOS_RUTEO[metodo](parsed_data, d, clientes, vehicle_capacity)
+        if una_ruta_por_deposito and len(rutas_d) > 1:
+            rutas_d = [[i for ruta in rutas_d for i in ruta]]
+        rutas.extend((d, ruta) for ruta in rutas_d)
+
+    solucion = {
+        "depositos": [int(d) for d in np.nonzero(abiertos)[0]],
+        "asignacion": asignacion,
+        "rutas": rutas,
+    }
+    solucion["costo"] = costo_solucion(parsed_data, solucion)
+    return solucion
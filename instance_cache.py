@@ -0,0 +1,139 @@
+import glob
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+from testParser import parse_file_arrays
+
+# Directorio por defecto del caché binario de instancias
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".instance_cache")
+
+# Campos escalares guardados al inicio del archivo: num_customers, num_depots, vehicle_capacity, route_opening_cost
+_HEADER = 4
+
+
+def file_hash(file_path):
+    """
+    Calcula el hash SHA-256 del contenido de un archivo de instancia.
+
+    Parámetros:
+        file_path (str): Ruta al archivo .dat.
+
+    Retorna:
+        str: Hash hexadecimal del contenido.
+    """
+    with open(file_path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def cache_path(file_path, digest, dtype=np.float64, cache_dir=CACHE_DIR):
+    """
+    Ruta del archivo de caché para una instancia, su hash de contenido y un tipo de dato.
+    """
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(cache_dir, f"{name}-{digest[:16]}-{np.dtype(dtype).name}.npy")
+
+
+def _write_cache(path, parsed_data, dtype):
+    """
+    Escribe la instancia como un único arreglo plano .npy de forma atómica.
+
+    Distintos procesos pueden escribir la misma entrada a la vez: cada uno escribe en un archivo
+    temporal y lo renombra, por lo que nunca se lee un archivo a medio escribir.
+    """
+    n = parsed_data["num_customers"]
+    m = parsed_data["num_depots"]
+    flat = np.concatenate([
+        np.array([n, m, parsed_data["vehicle_capacity"], parsed_data["route_opening_cost"]], dtype=dtype),
+        parsed_data["depots"].ravel(),
+        parsed_data["customers"].ravel(),
+        parsed_data["depot_capacities"],
+        parsed_data["customer_demands"],
+        parsed_data["depot_opening_costs"],
+        parsed_data["distance_matrix"].ravel(),
+    ]).astype(dtype, copy=False)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            np.save(file, flat)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _read_cache(path, mmap=True):
+    """
+    Reconstruye el diccionario de la instancia a partir del arreglo plano del caché.
+
+    Con mmap=True el archivo se mapea en memoria en modo sólo lectura y todos los arreglos
+    retornados son vistas sobre ese mapeo, compartido entre procesos a través del page cache.
+    """
+    flat = np.load(path, mmap_mode='r' if mmap else None)
+    n, m = int(flat[0]), int(flat[1])
+
+    pos = _HEADER
+    points = flat[pos:pos + 2 * (m + n)].reshape(m + n, 2)
+    pos += 2 * (m + n)
+    depot_capacities = flat[pos:pos + m]
+    pos += m
+    customer_demands = flat[pos:pos + n]
+    pos += n
+    depot_opening_costs = flat[pos:pos + m]
+    pos += m
+    distance_matrix = flat[pos:pos + (m + n) * (m + n)].reshape(m + n, m + n)
+
+    return {
+        "num_customers": n,
+        "num_depots": m,
+        "depots": points[:m],
+        "customers": points[m:],
+        "vehicle_capacity": float(flat[2]),
+        "depot_capacities": depot_capacities,
+        "customer_demands": customer_demands,
+        "depot_opening_costs": depot_opening_costs,
+        "route_opening_cost": float(flat[3]),
+        "distance_matrix": distance_matrix,
+    }
+
+
+def load_instance(file_path, dtype=np.float64, cache_dir=CACHE_DIR, mmap=True):
+    """
+    Carga una instancia usando el caché binario, parseando el .dat sólo si es necesario.
+
+    La entrada del caché se identifica por el hash del contenido del archivo fuente, así que
+    cualquier cambio en el .dat la invalida; las entradas antiguas de la misma instancia se borran.
+
+    Parámetros:
+        file_path (str): Ruta al archivo .dat de la instancia.
+        dtype: Tipo de punto flotante de los arreglos (float64 por defecto, float32 opcional).
+        cache_dir (str): Directorio donde se guardan los archivos de caché.
+        mmap (bool): Si es True, los arreglos son vistas de sólo lectura sobre el archivo mapeado.
+
+    Retorna:
+        dict: Diccionario con las mismas llaves que parse_file(as_arrays=True).
+    """
+    digest = file_hash(file_path)
+    path = cache_path(file_path, digest, dtype, cache_dir)
+    if not os.path.exists(path):
+        _write_cache(path, parse_file_arrays(file_path, dtype=dtype), dtype)
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        for stale in glob.glob(os.path.join(cache_dir, f"{glob.escape(name)}-*-{np.dtype(dtype).name}.npy")):
+            if stale != path:
+                try:
+                    os.remove(stale)
+                except FileNotFoundError:
+                    pass
+    return _read_cache(path, mmap=mmap)
+
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """
+    Elimina todos los archivos del caché de instancias.
+    """
+    for path in glob.glob(os.path.join(cache_dir, "*.npy")):
+        os.remove(path)
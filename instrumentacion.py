@@ -0,0 +1,330 @@
+"""
+Instrumentación por etapa y de convergencia para cada resolución.
+
+Mide el tiempo de pared, el tiempo de CPU (de todos los hilos del proceso) y el pico de RSS de
+cada etapa: parse, build, presolve, solve y extract. El límite entre presolve y solve se detecta
+desde el solver: en Gurobi con el primer callback posterior al presolve y en CPLEX con la primera
+notificación de progreso del branch and bound. Durante la resolución se registra además la
+trayectoria del incumbente y de la cota en el tiempo.
+
+Cada resolución produce un registro (diccionario serializable a JSON) que se guarda como una línea
+de un archivo JSON Lines; los registros se agregan en curvas de tiempo a gap por formulación y
+solver.
+
+Uso (desde la raíz del repositorio):
+    python instrumentacion.py registros.jsonl --umbrales 0.1 0.05 0.01 0.0001
+"""
+import argparse
+import json
+import math
+import resource
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from docplex.mp.progress import ProgressClock, ProgressListener
+from gurobipy import GRB
+
+ETAPAS = ["parse", "build", "presolve", "solve", "extract"]
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Memoria +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def reset_pico_rss():
+    """
+    Reinicia el pico de RSS del proceso (VmHWM) para medir la etapa siguiente por separado.
+
+    Sólo funciona en Linux; en otros sistemas el pico reportado es el acumulado del proceso.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+    except OSError:
+        pass
+
+
+def memoria_mib(campo):
+    """
+    Lee un campo de memoria de /proc/self/status en MiB (None si no está disponible).
+    """
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith(campo + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def pico_rss_mib():
+    """
+    Pico de RSS del proceso en MiB desde el último reset_pico_rss.
+    """
+    pico = memoria_mib("VmHWM")
+    return pico if pico is not None else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Etapas +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+class _Reloj:
+    """
+    Marca de inicio de una etapa: tiempo de pared y de CPU.
+    """
+
+    def __init__(self):
+        reset_pico_rss()
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+
+    def medicion(self):
+        return {
+            "wall": time.perf_counter() - self.wall,
+            "cpu": time.process_time() - self.cpu,
+            "pico_rss_mib": pico_rss_mib(),
+            "rss_mib": memoria_mib("VmRSS"),
+        }
+
+
+@contextmanager
+def medir(registro, etapa):
+    """
+    Mide el tiempo de pared, el tiempo de CPU, el pico de RSS y el RSS final de una etapa y los
+    guarda en registro[etapa].
+    """
+    reloj = _Reloj()
+    try:
+        yield
+    finally:
+        registro[etapa] = reloj.medicion()
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Trayectoria +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def _finito(valor):
+    return valor if valor is not None and math.isfinite(valor) and abs(valor) < 1e20 else None
+
+
+def gap(incumbente, cota):
+    """
+    Gap relativo |incumbente - cota| / |incumbente| (definición de Gurobi); None sin incumbente.
+    """
+    if incumbente is None or cota is None:
+        return None
+    if incumbente == cota:
+        return 0.0
+    return abs(incumbente - cota) / abs(incumbente) if incumbente != 0 else math.inf
+
+
+def _nuevo_monitor(etapas, callback=None, al_progreso=None):
+    return {"reloj": _Reloj(), "etapas": etapas, "trayectoria": [], "callback": callback,
+            "al_progreso": al_progreso}
+
+
+def _registrar(monitor, t, incumbente, cota):
+    """
+    Agrega un punto a la trayectoria si cambió el incumbente o la cota.
+    """
+    incumbente, cota = _finito(incumbente), _finito(cota)
+    trayectoria = monitor["trayectoria"]
+    if trayectoria and trayectoria[-1]["incumbente"] == incumbente and trayectoria[-1]["cota"] == cota:
+        return
+    trayectoria.append({"t": t, "incumbente": incumbente, "cota": cota})
+    if monitor["al_progreso"] is not None:
+        monitor["al_progreso"](trayectoria[-1])
+
+
+def _fin_presolve(monitor):
+    """
+    Cierra la etapa presolve (si sigue abierta) y comienza a medir solve.
+    """
+    if "presolve" not in monitor["etapas"]:
+        monitor["etapas"]["presolve"] = monitor["reloj"].medicion()
+        monitor["reloj"] = _Reloj()
+
+
+def _cerrar(monitor):
+    _fin_presolve(monitor)
+    monitor["etapas"]["solve"] = monitor["reloj"].medicion()
+
+
+def callback_instrumentacion_gurobi(model, where):
+    """
+    Callback de Gurobi que marca el fin del presolve y registra incumbente y cota; si el monitor
+    tiene un callback propio (por ejemplo el de lazy_cda) se llama después.
+    """
+    monitor = model._instrumentacion
+    if where not in (GRB.Callback.POLLING, GRB.Callback.PRESOLVE, GRB.Callback.MESSAGE):
+        _fin_presolve(monitor)
+    if where == GRB.Callback.MIP:
+        _registrar(monitor, model.cbGet(GRB.Callback.RUNTIME), model.cbGet(GRB.Callback.MIP_OBJBST),
+                   model.cbGet(GRB.Callback.MIP_OBJBND))
+    elif where == GRB.Callback.MIPSOL:
+        _registrar(monitor, model.cbGet(GRB.Callback.RUNTIME), model.cbGet(GRB.Callback.MIPSOL_OBJBST),
+                   model.cbGet(GRB.Callback.MIPSOL_OBJBND))
+    if monitor["callback"] is not None:
+        monitor["callback"](model, where)
+
+
+class ListenerInstrumentacion(ProgressListener):
+    """
+    Listener de docplex que marca el fin del presolve y registra incumbente y cota.
+    """
+
+    def __init__(self, monitor):
+        super().__init__(ProgressClock.All)
+        self.monitor = monitor
+
+    def notify_progress(self, progress_data):
+        _fin_presolve(self.monitor)
+        _registrar(self.monitor, progress_data.time,
+                   progress_data.current_objective if progress_data.has_incumbent else None,
+                   progress_data.best_bound)
+
+
+def _final(model_instance, solver):
+    """
+    Incumbente y cota al terminar la resolución (None si no están disponibles).
+    """
+    if solver == 'gurobi':
+        if not model_instance.IsMIP:
+            return (model_instance.ObjVal,) * 2 if model_instance.SolCount > 0 else (None, None)
+        incumbente = model_instance.ObjVal if model_instance.SolCount > 0 else None
+        cota = model_instance.ObjBound if model_instance.Status != GRB.INFEASIBLE else None
+        return incumbente, cota
+    detalles = model_instance.solve_details
+    incumbente = model_instance.objective_value if model_instance.solution is not None else None
+    return incumbente, detalles.best_bound if detalles is not None else None
+
+
+def resolver_instrumentado(model_instance, solver, etapas, resolver, callback=None, al_progreso=None):
+    """
+    Resuelve un modelo midiendo presolve y solve por separado y registrando la trayectoria.
+
+    Parámetros:
+        model_instance: Modelo de Gurobi o docplex ya construido.
+        solver (str): "gurobi" o "cplex".
+        etapas (dict): Registro donde se guardan las mediciones de "presolve" y "solve".
+        resolver (callable): Función que resuelve el modelo; recibe el modelo y, en Gurobi, el
+            callback que debe pasarse a optimize (por ejemplo runner.get_metrics_grb).
+        callback (callable): Callback de Gurobi adicional (por ejemplo el de lazy_cda).
+        al_progreso (callable): Si se entrega, se llama con cada punto nuevo de la trayectoria
+            (desde el hilo del solver).
+
+    Retorna:
+        tuple: (resultado de resolver, trayectoria como lista de {"t", "incumbente", "cota"}); el
+            último punto es el resultado final, aunque el solver no haya notificado progreso.
+    """
+    monitor = _nuevo_monitor(etapas, callback, al_progreso)
+    inicio = time.perf_counter()
+    if solver == 'gurobi':
+        model_instance._instrumentacion = monitor
+        try:
+            resultado = resolver(model_instance, callback_instrumentacion_gurobi)
+        finally:
+            del model_instance._instrumentacion
+    else:
+        listener = ListenerInstrumentacion(monitor)
+        model_instance.add_progress_listener(listener)
+        try:
+            resultado = resolver(model_instance, None)
+        finally:
+            model_instance.remove_progress_listener(listener)
+    _cerrar(monitor)
+    _registrar(monitor, time.perf_counter() - inicio, *_final(model_instance, solver))
+    return resultado, monitor["trayectoria"]
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Registros +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def nuevo_registro(trabajo):
+    """
+    Registro vacío de una resolución a partir de un trabajo de runner.expandir_trabajos.
+    """
+    return {
+        "formulacion": trabajo["formulacion"],
+        "solver": trabajo["solver"],
+        "benchmark": trabajo["benchmark"],
+        "instancia": trabajo["instancia"],
+        "parametros": {k: trabajo.get(k) for k in ("threads", "time_limit", "mip_start", "k_vecinos")},
+        "etapas": {},
+        "trayectoria": [],
+    }
+
+
+def escribir_registro(ruta, registro):
+    """
+    Agrega un registro como una línea de un archivo JSON Lines.
+    """
+    with open(ruta, "a", encoding="utf-8") as file:
+        file.write(json.dumps(registro, ensure_ascii=False, default=float) + "\n")
+
+
+def leer_registros(ruta):
+    """
+    Lee los registros de un archivo JSON Lines.
+    """
+    with open(ruta, encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def tiempo_a_gap(trayectoria, umbral):
+    """
+    Primer instante de la trayectoria con gap <= umbral (None si nunca se alcanza).
+    """
+    for punto in trayectoria:
+        g = gap(punto["incumbente"], punto["cota"])
+        if g is not None and g <= umbral:
+            return punto["t"]
+    return None
+
+
+def curvas_tiempo_a_gap(registros, umbrales):
+    """
+    Agrega los registros en curvas de tiempo a gap por formulación y solver.
+
+    Retorna:
+        dict: (formulación, solver) -> {umbral: tiempos ordenados de las instancias que alcanzaron
+            el umbral}, con la llave "total" para el número de registros del grupo. La fracción de
+            instancias con gap <= umbral antes de t es el número de tiempos <= t dividido por total.
+    """
+    curvas = defaultdict(lambda: {"total": 0, **{u: [] for u in umbrales}})
+    for registro in registros:
+        curva = curvas[(registro["formulacion"], registro["solver"])]
+        curva["total"] += 1
+        for umbral in umbrales:
+            t = tiempo_a_gap(registro["trayectoria"], umbral)
+            if t is not None:
+                curva[umbral].append(t)
+    for curva in curvas.values():
+        for umbral in umbrales:
+            curva[umbral].sort()
+    return dict(curvas)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("registros", help="archivo JSON Lines con los registros de pipeline.py --registros")
+    parser.add_argument("--umbrales", type=float, nargs="+", default=[0.1, 0.05, 0.01, 1e-4])
+    args = parser.parse_args(argv)
+
+    registros = leer_registros(args.registros)
+    print("Formulación | Solver | Gap | Alcanzado | Mediana (s) | Máximo (s)")
+    for (formulacion, solver), curva in sorted(curvas_tiempo_a_gap(registros, args.umbrales).items()):
+        for umbral in args.umbrales:
+            tiempos = curva[umbral]
+            mediana = f"{tiempos[len(tiempos) // 2]:.2f}" if tiempos else "N/A"
+            maximo = f"{tiempos[-1]:.2f}" if tiempos else "N/A"
+            print(f"{formulacion} | {solver} | {umbral:g} | {len(tiempos)}/{curva['total']} | {mediana} | {maximo}")
+
+    print("\nEtapa | Pared media (s) | CPU media (s) | Pico RSS máximo (MiB)")
+    for etapa in ETAPAS:
+        medidas = [r["etapas"][etapa] for r in registros if etapa in r["etapas"]]
+        if medidas:
+            print(f"{etapa} | {sum(m['wall'] for m in medidas) / len(medidas):.3f} | "
+                  f"{sum(m['cpu'] for m in medidas) / len(medidas):.3f} | "
+                  f"{max(m['pico_rss_mib'] for m in medidas):.1f}")
+
+
+if __name__ == "__main__":
+    main()
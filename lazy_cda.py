@@ -0,0 +1,213 @@
+import time
+
+import numpy as np
+from gurobipy import GRB
+import cplex
+from cplex.callbacks import LazyConstraintCallback, UserCutCallback
+
+
+def separar_path_elimination(x_cc, v, tol=1e-6, max_cortes=None):
+    """
+    Busca restricciones path_elimination violadas: v[i,d] + x[i,j] <= v[j,d] + 1.
+
+    Sólo se revisan los arcos entre clientes con x[i,j] > tol, por lo que el costo es proporcional
+    al soporte de la solución y no a m·n·(n-1).
+
+    Parámetros:
+        x_cc (ndarray): Matriz (n, n) con los valores de x entre clientes (índices locales 0..n-1).
+        v (ndarray): Matriz (n, m) con los valores de asignación cliente-depósito.
+        tol (float): Violación mínima para reportar un corte.
+        max_cortes (int): Número máximo de cortes a retornar (los más violados primero).
+
+    Retorna:
+        tuple: Arreglos (i, j, d) con los índices locales de los cortes violados.
+    """
+    ii, jj = np.nonzero(x_cc > tol)
+    ii, jj = ii[ii != jj], jj[ii != jj]
+    viol = v[ii, :] + x_cc[ii, jj, None] - v[jj, :] - 1.0
+    k, d = np.nonzero(viol > tol)
+    if max_cortes is not None and k.size > max_cortes:
+        orden = np.argsort(-viol[k, d], kind='stable')[:max_cortes]
+        k, d = k[orden], d[orden]
+    return ii[k], jj[k], d
+
+
+def nuevas_estadisticas():
+    """
+    Diccionario de estadísticas de separación compartido por los backends.
+    """
+    return {"cortes": 0, "llamadas": 0, "tiempo_separacion": 0.0}
+
+
+def _arcos_clientes(x_cc):
+    """
+    Índices (i, j) de los arcos entre clientes que existen en el modelo (x_cc[i][j] no es None).
+    """
+    n = len(x_cc)
+    existe = np.array([[x_cc[i][j] is not None for j in range(n)] for i in range(n)], dtype=bool).reshape(n, n)
+    np.fill_diagonal(existe, False)
+    return np.nonzero(existe)
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Gurobi +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def configurar_path_elimination_gurobi(model, x_cc, v_cd, fraccional=False, max_cortes=None):
+    """
+    Prepara un modelo Gurobi CDA para separar path_elimination como restricciones lazy.
+
+    Parámetros:
+        model (Model): Modelo CDA construido sin el bloque path_elimination.
+        x_cc (list): Lista de listas (n, n) con las variables x entre clientes (None en la diagonal
+            y en los arcos que no existen en el modelo).
+        v_cd (list): Lista de listas (n, m) con las variables v de asignación.
+        fraccional (bool): Si es True, también se separa desde las relajaciones de los nodos.
+        max_cortes (int): Máximo de cortes agregados por llamada.
+    """
+    n = len(v_cd)
+    ii, jj = _arcos_clientes(x_cc)
+    model.Params.LazyConstraints = 1
+    model._path_elimination = {
+        "n": n,
+        "m": len(v_cd[0]) if n else 0,
+        "ii": ii,
+        "jj": jj,
+        "x_cc": x_cc,
+        "v_cd": v_cd,
+        "x_vars": [x_cc[i][j] for i, j in zip(ii, jj)],
+        "v_vars": [var for fila in v_cd for var in fila],
+        "fraccional": fraccional,
+        "max_cortes": max_cortes,
+        "stats": nuevas_estadisticas(),
+    }
+
+
+def callback_path_elimination_gurobi(model, where):
+    """
+    Callback de Gurobi que agrega con cbLazy las restricciones path_elimination violadas.
+    """
+    datos = model._path_elimination
+    if where == GRB.Callback.MIPSOL:
+        x_val = model.cbGetSolution(datos["x_vars"])
+        v_val = model.cbGetSolution(datos["v_vars"])
+    elif (where == GRB.Callback.MIPNODE and datos["fraccional"]
+          and model.cbGet(GRB.Callback.MIPNODE_STATUS) == GRB.OPTIMAL):
+        x_val = model.cbGetNodeRel(datos["x_vars"])
+        v_val = model.cbGetNodeRel(datos["v_vars"])
+    else:
+        return
+
+    stats = datos["stats"]
+    start_time = time.perf_counter()
+    n, m = datos["n"], datos["m"]
+    x_cc = np.zeros((n, n))
+    x_cc[datos["ii"], datos["jj"]] = x_val
+    v = np.asarray(v_val, dtype=np.float64).reshape(n, m)
+
+    x, vv = datos["x_cc"], datos["v_cd"]
+    for i, j, d in zip(*separar_path_elimination(x_cc, v, max_cortes=datos["max_cortes"])):
+        model.cbLazy(vv[i][d] + x[i][j] <= vv[j][d] + 1)
+        stats["cortes"] += 1
+    stats["llamadas"] += 1
+    stats["tiempo_separacion"] += time.perf_counter() - start_time
+
+
+def resolver_lazy_gurobi(model):
+    """
+    Resuelve un modelo preparado con configurar_path_elimination_gurobi.
+
+    Retorna:
+        dict: Estadísticas de separación (cortes agregados, llamadas y tiempo de separación).
+    """
+    model.optimize(callback_path_elimination_gurobi)
+    return model._path_elimination["stats"]
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ CPLEX +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+class _PathEliminationMixin:
+    """
+    Lógica común a los callbacks de CPLEX: lee x y v, separa y agrega los cortes.
+    """
+
+    def configurar(self, x_cc, v_cd, max_cortes=None):
+        n = len(v_cd)
+        self.n, self.m = n, len(v_cd[0]) if n else 0
+        self.ii, self.jj = _arcos_clientes(x_cc)
+        self.x_idx = np.array([x_cc[i][j].index for i, j in zip(self.ii, self.jj)], dtype=np.int64)
+        self.v_idx = np.array([var.index for fila in v_cd for var in fila], dtype=np.int64)
+        self.x_mat = np.full((n, n), -1, dtype=np.int64)
+        self.x_mat[self.ii, self.jj] = self.x_idx
+        self.v_mat = self.v_idx.reshape(n, self.m)
+        self.max_cortes = max_cortes
+        self.stats = nuevas_estadisticas()
+
+    def separar(self):
+        start_time = time.perf_counter()
+        valores = np.asarray(self.get_values(), dtype=np.float64)
+        x_cc = np.zeros((self.n, self.n))
+        x_cc[self.ii, self.jj] = valores[self.x_idx]
+        v = valores[self.v_idx].reshape(self.n, self.m)
+
+        cortes = []
+        for i, j, d in zip(*separar_path_elimination(x_cc, v, max_cortes=self.max_cortes)):
+            cortes.append(cplex.SparsePair(
+                ind=[int(self.v_mat[i, d]), int(self.x_mat[i, j]), int(self.v_mat[j, d])], val=[1.0, 1.0, -1.0]))
+        self.stats["llamadas"] += 1
+        self.stats["cortes"] += len(cortes)
+        self.stats["tiempo_separacion"] += time.perf_counter() - start_time
+        return cortes
+
+
+class PathEliminationLazyCallback(_PathEliminationMixin, LazyConstraintCallback):
+    """
+    Callback lazy de CPLEX: separa path_elimination desde las soluciones enteras.
+    """
+
+    def __call__(self):
+        for corte in self.separar():
+            self.add(constraint=corte, sense="L", rhs=1.0)
+
+
+class PathEliminationUserCutCallback(_PathEliminationMixin, UserCutCallback):
+    """
+    Callback de cortes de usuario de CPLEX: separa path_elimination desde soluciones fraccionarias.
+    """
+
+    def __call__(self):
+        for corte in self.separar():
+            self.add(cut=corte, sense="L", rhs=1.0)
+
+
+def configurar_path_elimination_cplex(mdl, x_cc, v_cd, fraccional=False, max_cortes=None):
+    """
+    Registra en un modelo docplex CDA los callbacks que separan path_elimination.
+
+    Parámetros:
+        mdl (Model): Modelo docplex construido sin el bloque path_elimination.
+        x_cc (list): Lista de listas (n, n) con las variables x entre clientes (None en la diagonal
+            y en los arcos que no existen en el modelo).
+        v_cd (list): Lista de listas (n, m) con las variables v de asignación.
+        fraccional (bool): Si es True, también se separa desde soluciones fraccionarias.
+        max_cortes (int): Máximo de cortes agregados por llamada.
+
+    Retorna:
+        list: Callbacks registrados; sus estadísticas se combinan con estadisticas_cplex.
+    """
+    callbacks = [mdl.register_callback(PathEliminationLazyCallback)]
+    if fraccional:
+        callbacks.append(mdl.register_callback(PathEliminationUserCutCallback))
+    for cb in callbacks:
+        cb.configurar(x_cc, v_cd, max_cortes=max_cortes)
+    mdl._path_elimination_callbacks = callbacks
+    return callbacks
+
+
+def estadisticas_cplex(mdl):
+    """
+    Suma las estadísticas de separación de los callbacks registrados en un modelo docplex.
+    """
+    stats = nuevas_estadisticas()
+    for cb in getattr(mdl, "_path_elimination_callbacks", []):
+        for key in stats:
+            stats[key] += cb.stats[key]
+    return stats
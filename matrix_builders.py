@@ -0,0 +1,199 @@
+import numpy as np
+import gurobipy as gp
+from gurobipy import Model as Model_grb, GRB
+
+from SCF import modelo_scf_gurobi, solver_scf_gurobi, datos_solver_scf
+from model import modelo_cda_gurobi
+from lazy_cda import configurar_path_elimination_gurobi
+from representacion import cargar_gurobi, ensamblar, representacion_cda, representacion_scf
+
+
+def modelo_scf_gurobi_matrix(parsed_data, arcos=None):
+    """
+    Modelo SCF de modelo_scf_gurobi construido con la API matricial de Gurobi.
+
+    Misma formulación (variables, orden de restricciones y coeficientes) que modelo_scf_gurobi, pero
+    construida desde la IR de representacion.representacion_scf y cargada con addMVar/addMConstr.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        arcos (ndarray): Conjunto de arcos de arcos.arcos_knn; si es None se usan todos los pares
+            de nodos (incluida la diagonal, igual que el original).
+
+    Retorna:
+        Model: Modelo de Gurobi con el problema SCF formulado.
+    """
+    ir = representacion_scf(parsed_data, arcos)
+    mdl = cargar_gurobi(ir)
+    mdl._arcs = ir["arcos"]
+    return mdl
+
+
+def solver_scf_gurobi_matrix(data):
+    """
+    Modelo de solver_scf_gurobi construido con la API matricial de Gurobi.
+
+    Recibe el mismo diccionario de datos que solver_scf_gurobi (ver datos_solver_scf) y genera la
+    misma formulación, respetando la indexación original de depósitos y clientes.
+
+    Parámetros:
+        data (dict): Diccionario con los datos necesarios para el modelo.
+
+    Retorna:
+        Model: Modelo de Gurobi con el problema SCF formulado.
+    """
+    m = data['num_depositos']
+    n = data['num_clientes']
+    arcos = np.array(list(data['distancias']), dtype=np.int64).reshape(-1, 2)
+    distancias = np.fromiter(data['distancias'].values(), dtype=np.float64, count=len(arcos))
+    demanda = np.asarray(data['demanda'], dtype=np.float64)
+    cap_deposito = np.asarray(data['cap_deposito'], dtype=np.float64)
+    costo_apertura = np.asarray(data['costo_apertura_deposito'], dtype=np.float64)
+    K = len(arcos)
+    N = max(int(arcos.max()) + 1, m + n) if K else m + n
+
+    mdl = Model_grb("SCF")
+
+    # Variables
+    nombres = [f"{i},{j}]" for i, j in arcos.tolist()]
+    x = mdl.addMVar(K, vtype=GRB.BINARY, obj=distancias, name=np.array(["x[" + a for a in nombres]))  # Ruta entre nodos
+    f = mdl.addMVar(K, lb=0, vtype=GRB.CONTINUOUS, name=np.array(["f[" + a for a in nombres]))  # Flujo continuo
+    fd = mdl.addMVar((m, n), lb=0, vtype=GRB.CONTINUOUS, name="fd")  # Flujo desde depósitos a clientes
+    y = mdl.addMVar(m, vtype=GRB.BINARY, obj=costo_apertura, name="y")  # Uso de depósitos
+    mdl.ModelSense = GRB.MINIMIZE
+
+    # Posición de cada arco (i, j) en x y f; -1 si el arco no existe
+    pos = np.full((N, N), -1, dtype=np.int64)
+    pos[arcos[:, 0], arcos[:, 1]] = np.arange(K)
+
+    def col_fd(d, j):
+        return 2 * K + d * n + j
+
+    def col_y(d):
+        return 2 * K + m * n + d
+
+    deps = np.arange(m)
+
+    # Arcos (deposito, j) con j en range(num_clientes) presentes en distancias
+    sd, sj = np.nonzero(pos[:m, :n] >= 0)
+    salida = pos[sd, sj]
+    # Arcos (cliente, deposito) con cliente en range(num_clientes)
+    ed, ec = np.nonzero(pos[:n, :m].T >= 0)
+    entrada = pos[ec, ed]
+    # Arcos (i, j) entre depósitos distintos
+    pi, pj = np.nonzero(~np.eye(m, dtype=bool))
+    par = pos[pi, pj]
+    par_ok = par >= 0
+    # Arcos entre clientes, en el orden de distancias
+    entre_clientes = np.nonzero((arcos[:, 0] >= m) & (arcos[:, 1] >= m))[0]
+    # Arcos (i, cliente) con i en range(num_depositos + num_clientes)
+    fc, fi = np.nonzero(pos[:m + n, :n].T >= 0)
+    llegada = pos[fi, fc]
+    # Pares (d, j) de fd
+    gd, gj = np.meshgrid(deps, np.arange(n), indexing='ij')
+    gd, gj = gd.ravel(), gj.ravel()
+    # 10. Una fila por cada condición "es cliente" del arco
+    cond = np.stack([arcos[:, 0] >= m, arcos[:, 1] >= m], axis=1)
+    arco_10 = np.nonzero(cond)[0]
+
+    bloques = [
+        # 1. Capacidad de los depósitos
+        (np.concatenate([sd, deps]), np.concatenate([salida, col_y(deps)]),
+         np.concatenate([demanda[sj], -cap_deposito]), m, GRB.LESS_EQUAL, 0.0),
+        # 2. Capacidad de los vehículos
+        (np.concatenate([sd, deps]), np.concatenate([salida, col_y(deps)]),
+         np.concatenate([demanda[sj], np.full(m, -float(data['cap_vehiculo']))]), m, GRB.LESS_EQUAL, 0.0),
+        # 3. Circuitos que comienzan y terminan en el mismo depósito
+        (np.concatenate([sd, ed]), np.concatenate([salida, entrada]),
+         np.concatenate([np.ones(salida.size), -np.ones(entrada.size)]), m, GRB.EQUAL, 0.0),
+        # 4. No debe haber circuitos con más de un depósito
+        (np.arange(par_ok.sum()), par[par_ok], 1.0, int(par_ok.sum()), GRB.EQUAL, 0.0),
+        # 5. No debe haber circuitos entre clientes sin pasar por un depósito
+        (np.arange(entre_clientes.size), entre_clientes, 1.0, entre_clientes.size, GRB.EQUAL, 0.0),
+        # 6. Conservación de flujo: Un cliente debe recibir exactamente una unidad de flujo
+        (fc, K + llegada, 1.0, n, GRB.EQUAL, 1.0),
+        # 7. Cada depósito debe servir al menos a un cliente
+        (np.concatenate([sd, deps]), np.concatenate([salida, col_y(deps)]),
+         np.concatenate([np.ones(salida.size), -np.ones(m)]), m, GRB.GREATER_EQUAL, 0.0),
+        # 8. Flujo total desde todos los depósitos hacia los clientes
+        (np.concatenate([gd, sd]), np.concatenate([col_fd(gd, gj), salida]),
+         np.concatenate([np.ones(gd.size), -np.ones(salida.size)]), m, GRB.EQUAL, 0.0),
+        # 9. Restricción de flujo en los arcos (d, j): El flujo debe estar acotado
+        (np.concatenate([np.arange(m * n), np.arange(m * n)]), np.concatenate([col_fd(gd, gj), col_y(gd)]),
+         np.concatenate([np.ones(m * n), -cap_deposito[gd]]), m * n, GRB.LESS_EQUAL, 0.0),
+        # 10. Restricción de flujo entre clientes y depósitos
+        (np.concatenate([np.arange(arco_10.size), np.arange(arco_10.size)]),
+         np.concatenate([K + arco_10, arco_10]),
+         np.concatenate([np.ones(arco_10.size), np.full(arco_10.size, -(n - 1.0))]),
+         arco_10.size, GRB.LESS_EQUAL, 0.0),
+    ]
+
+    A, sense, rhs = ensamblar(bloques, 2 * K + m * n + m)
+    mdl.addMConstr(A, gp.hstack([x, f, fd.reshape(-1), y]), sense, rhs)
+
+    mdl._x, mdl._f, mdl._fd, mdl._y, mdl._arcs = x, f, fd, y, arcos
+    return mdl
+
+
+def modelo_cda_gurobi_matrix(parsed_data, lazy=False, fraccional=False, arcos=None):
+    """
+    Modelo CDA de model.modelo_cda_gurobi construido con la API matricial de Gurobi.
+
+    Mantiene la indexación del modelo original (clientes 0..n-1, depósitos n..n+m-1) y el mismo
+    orden de variables y restricciones; se construye desde la IR de representacion.representacion_cda.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        lazy (bool): Si es True, path_elimination se separa bajo demanda (ver lazy_cda).
+        fraccional (bool): Con lazy=True, separa también desde soluciones fraccionarias.
+        arcos (ndarray): Conjunto de arcos de arcos.arcos_knn (numeración de parse_file); si es None
+            se usan todos los arcos.
+
+    Retorna:
+        Model: Modelo de Gurobi con el problema CDA formulado.
+    """
+    n = parsed_data["num_customers"]
+    m = parsed_data["num_depots"]
+    ir = representacion_cda(parsed_data, arcos, path_elimination=not lazy)
+    model = cargar_gurobi(ir)
+    model._v = model._v.reshape(n, m)
+    if lazy:
+        existe = ir["existe"]
+        x_vars = model._x.tolist()
+        pos = np.full(existe.shape, -1, dtype=np.int64)
+        pos[existe] = np.arange(len(x_vars))
+        configurar_path_elimination_gurobi(
+            model, [[x_vars[pos[i, j]] if existe[i, j] else None for j in range(n)] for i in range(n)],
+            model._v.tolist(), fraccional=fraccional)
+    return model
+
+
+# Constructores de modelos Gurobi disponibles por formulación y API de construcción
+MODELOS_GUROBI = {
+    "SCF": {"quicksum": modelo_scf_gurobi, "matrix": modelo_scf_gurobi_matrix},
+    "SCF-arcos": {"quicksum": lambda parsed_data, arcos=None: solver_scf_gurobi(datos_solver_scf(parsed_data, arcos)),
+                  "matrix": lambda parsed_data, arcos=None: solver_scf_gurobi_matrix(
+                      datos_solver_scf(parsed_data, arcos))},
+    "CDA": {"quicksum": modelo_cda_gurobi, "matrix": modelo_cda_gurobi_matrix},
+}
+
+
+def construir_modelo_gurobi(formulacion, parsed_data, api="quicksum", **kwargs):
+    """
+    Construye un modelo Gurobi eligiendo la formulación y la API de construcción.
+
+    Parámetros:
+        formulacion (str): "SCF", "SCF-arcos" (solver_scf_gurobi) o "CDA".
+        parsed_data (dict): Diccionario con los datos parseados.
+        api (str): "quicksum" (constructores originales) o "matrix" (API matricial).
+        **kwargs: Opciones adicionales del constructor (por ejemplo lazy=True para CDA o arcos
+            para restringir el conjunto de arcos).
+
+    Retorna:
+        Model: Modelo de Gurobi sin resolver.
+    """
+    try:
+        constructor = MODELOS_GUROBI[formulacion][api]
+    except KeyError:
+        raise ValueError(f"Combinación formulación/API desconocida: {formulacion}/{api}") from None
+    return constructor(parsed_data, **kwargs)
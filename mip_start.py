@@ -0,0 +1,177 @@
+"""
+Traducción de soluciones heurísticas a valores de inicio (MIP start) para cada formulación.
+
+Los valores se generan por nombre de variable, por lo que sirven tanto para los constructores
+originales como para los de matrix_builders y representacion, que usan los nombres de Gurobi.
+"""
+from collections import defaultdict
+
+from docplex.mp.solution import SolveSolution
+
+from heuristica import construir_solucion
+from verificador import decodificar, verificar
+
+
+def _arcos_rutas(solucion, nodo_deposito, nodo_cliente):
+    """
+    Arcos (a, b) de todas las rutas, con la numeración de nodos de la formulación.
+    """
+    arcos = []
+    for d, ruta in solucion["rutas"]:
+        nodos = [nodo_deposito(d)] + [nodo_cliente(i) for i in ruta] + [nodo_deposito(d)]
+        arcos.extend(zip(nodos[:-1], nodos[1:]))
+    return arcos
+
+
+def _rutas_por_deposito(solucion):
+    """
+    Une las rutas de cada depósito en un solo recorrido (SCF admite una ruta por depósito).
+    """
+    unidas = defaultdict(list)
+    for d, ruta in solucion["rutas"]:
+        unidas[d].extend(ruta)
+    return dict(solucion, rutas=list(unidas.items()))
+
+
+def valores_scf(parsed_data, solucion, solver):
+    """
+    Valores de x, f, y (y fd en CPLEX) del modelo SCF para una solución heurística.
+
+    Nodos: depósitos 0..m-1 y clientes m..m+n-1. Según el balance de flujo del modelo
+    (sale - entra = demanda), f en cada arco es la demanda acumulada de la ruta hasta ese punto.
+    """
+    n = parsed_data["num_customers"]
+    m = parsed_data["num_depots"]
+    demands = parsed_data["customer_demands"]
+    solucion = _rutas_por_deposito(solucion)
+    fmt = (lambda v, *k: f"{v}_" + "_".join(map(str, k))) if solver == 'cplex' else \
+        (lambda v, *k: f"{v}[" + ",".join(map(str, k)) + "]")
+
+    valores = {fmt("y", d): 1.0 for d in solucion["depositos"]}
+    for d, ruta in solucion["rutas"]:
+        nodos = [d] + [m + i for i in ruta] + [d]
+        carga = 0.0
+        for t, (a, b) in enumerate(zip(nodos[:-1], nodos[1:])):
+            valores[fmt("x", a, b)] = 1.0
+            valores[fmt("f", a, b)] = carga
+            if t < len(ruta):
+                carga += demands[ruta[t]]
+    if solver == 'cplex':
+        for d in range(m):
+            for j in range(n):
+                valores[fmt("fd", d, j)] = 1.0
+    return valores
+
+
+def valores_cda(parsed_data, solucion, solver):
+    """
+    Valores de x, v, y del modelo CDA para una solución heurística.
+
+    Gurobi (model.py) numera clientes 0..n-1 y depósitos n..n+m-1; CPLEX numera los nodos con
+    los depósitos primero (0..m-1) y usa v[i, d] con d en 0..m-1.
+    """
+    n = parsed_data["num_customers"]
+    m = parsed_data["num_depots"]
+    if solver == 'gurobi':
+        nodo_deposito, nodo_cliente = (lambda d: n + d), (lambda i: i)
+        fmt = lambda v, a, b=None: f"{v}[{a}]" if b is None else f"{v}[{a},{b}]"
+    else:
+        nodo_deposito, nodo_cliente = (lambda d: d), (lambda i: m + i)
+        fmt = lambda v, a, b=None: f"{v}_{a}" if b is None else f"{v}_{a}_{b}"
+
+    valores = {fmt("y", nodo_deposito(d)): 1.0 for d in solucion["depositos"]}
+    for a, b in _arcos_rutas(solucion, nodo_deposito, nodo_cliente):
+        valores[fmt("x", a, b)] = 1.0
+    for i, d in enumerate(solucion["asignacion"]):
+        valores[fmt("v", i, nodo_deposito(d))] = 1.0
+    return valores
+
+
+VALORES_INICIO = {"SCF": valores_scf, "CDA": valores_cda}
+
+
+def solucion_desde_valores(parsed_data, formulacion, valores, solver):
+    """
+    Traduce los valores de una solución del modelo (por nombre de variable) a una solución con el
+    formato de heuristica.construir_solucion; es la operación inversa de VALORES_INICIO.
+
+    Las rutas se reconstruyen siguiendo los arcos x activos desde cada depósito (ver
+    verificador.decodificar) y se cierran en su depósito de origen, aunque el modelo las haya
+    cerrado en otro (SCF no lo impide).
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        formulacion (str): "SCF" o "CDA".
+        valores (dict): Nombre de variable -> valor (ver pipeline.extraer_solucion).
+        solver (str): Formato de los nombres ("gurobi" o "cplex"), como en valores_scf/valores_cda.
+
+    Retorna:
+        dict: Solución, o None si las rutas reconstruidas no son factibles (ver
+            verificador.verificar).
+    """
+    solucion, _ = decodificar(parsed_data, formulacion, list(valores), list(valores.values()), solver)
+    return solucion if verificar(parsed_data, solucion)["factible"] else None
+
+
+def aplicar_inicio_gurobi(model, valores):
+    """
+    Fija el atributo Start de las variables nombradas; el resto queda en 0.
+
+    Retorna:
+        int: Número de variables del inicio que existen en el modelo.
+    """
+    model.update()
+    variables = model.getVars()
+    nombres = model.getAttr("VarName", variables)
+    inicio = [valores.get(nombre, 0.0) for nombre in nombres]
+    model.setAttr("Start", variables, inicio)
+    return sum(nombre in valores for nombre in nombres)
+
+
+def aplicar_inicio_cplex(mdl, valores):
+    """
+    Agrega un MIP start completo a un modelo docplex; las variables no nombradas quedan en 0.
+
+    Retorna:
+        int: Número de variables del inicio que existen en el modelo.
+    """
+    inicio = SolveSolution(mdl)
+    encontrados = 0
+    for var in mdl.iter_variables():
+        valor = valores.get(var.name, 0.0)
+        encontrados += var.name in valores
+        if valor:
+            inicio.add_var_value(var, valor)
+    mdl.add_mip_start(inicio, complete_vars=True)
+    return encontrados
+
+
+def aplicar_inicio(model_instance, formulacion, solver, parsed_data, solucion=None, metodo="savings",
+                   nombres=None):
+    """
+    Construye (si no se entrega) una solución heurística y la carga como MIP start.
+
+    Parámetros:
+        model_instance: Modelo de Gurobi o docplex ya construido.
+        formulacion (str): "SCF" o "CDA".
+        solver (str): "gurobi" o "cplex".
+        parsed_data (dict): Diccionario con los datos parseados.
+        solucion (dict): Solución de heuristica.construir_solucion; si es None se construye.
+        metodo (str): Método de ruteo de la heurística ("savings" o "sweep").
+        nombres (str): Formulación cuyos nombres de variables usa el modelo ("gurobi" o "cplex");
+            por defecto la del solver. Los modelos de representacion usan los de Gurobi en ambos.
+
+    Retorna:
+        dict: La solución heurística usada.
+    """
+    if solucion is None:
+        try:
+            solucion = construir_solucion(parsed_data, metodo, una_ruta_por_deposito=formulacion == "SCF")
+        except ValueError:
+            solucion = construir_solucion(parsed_data, metodo)
+    valores = VALORES_INICIO[formulacion](parsed_data, solucion, nombres or solver)
+    if solver == 'gurobi':
+        aplicar_inicio_gurobi(model_instance, valores)
+    else:
+        aplicar_inicio_cplex(model_instance, valores)
+    return solucion
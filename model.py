@@ -1,91 +1,181 @@
-from testParser import parse_file
+from lazy_cda import configurar_path_elimination_cplex, configurar_path_elimination_gurobi
+from arcos import clientes_primero, pares
+from docplex.mp.model import Model as Model_cpx
 import gurobipy as gp
 from gurobipy import Model, quicksum, GRB
 import math
-import time
-
-# Load the parsed data
-file_path = "Instances/Benchmark_1/coord20-5-1.dat"
-parsed_data = parse_file(file_path)
-
-# Extract parameters from parsed data
-n = parsed_data["num_customers"]  # Number of customers
-m = parsed_data["num_depots"]  # Number of depots
-depot_coords = parsed_data["depots"]  # List of depot coords (e.g., [(0, 0), (1, 1), ...])
-customer_coords = parsed_data["customers"]  # List of customer coords (e.g., [(0, 0), (1, 1), ...])
-vehicle_capacity = parsed_data["vehicle_capacity"]  # Capacity of a vehicle
-depot_capacities = parsed_data["depot_capacities"]  # List of depot capacities
-customer_demands = parsed_data["customer_demands"]  # List of customer demands
-opening_costs_depots = parsed_data["depot_opening_costs"]  # List of depot opening costs
-route_opening_cost = parsed_data["route_opening_cost"]  # Cost of opening a route
-costs = parsed_data["distance_matrix"]  # Distance matrix
-
-# Create a list of customers
-customers = range(n)
-
-# Create a list of depots
-depots = range(n, n + m)
-
-# Hacer que keys() funcione
-arc_indices = [(i, j) for i in range(m + n) for j in range(m + n) if i != j]
-
-# Create a Gurobi model
-model = Model("F-MDRP_CDA")
-
-# Variables
-x = model.addVars(arc_indices, vtype=GRB.BINARY,
-                  name="x")  # Variable Binaria que indica si el arco de i a j está siendo usado
-v = model.addVars([(i, d) for i in customers for d in depots], vtype=GRB.CONTINUOUS,
-                  name="v")  # Variable continua que indica si el cliente está asignado a un depot d
-y = model.addVars(depots, vtype=GRB.BINARY, name="y")  # Variable binaria que indica si el depot d está abierto
-
-# Funcion objetivo
-
-model.setObjective(
-    gp.quicksum(costs[i][j] * x[i, j] for i, j in arc_indices) +  # Minimizar el costo de la ruta +
-    gp.quicksum(opening_costs_depots[d - n] * y[d] for d in depots) +  # El costo del inicio del depot +
-    route_opening_cost * gp.quicksum(x[d, i] for d in depots for i in customers),  # El inicio de la ruta.
-    GRB.MINIMIZE
-)
-
-# Restricción CDA
-# Asegura que cada cliente este asignado a un sólo depot
-model.addConstrs((gp.quicksum(v[i, d] for d in depots) == 1 for i in customers), "client_assignment")
-
-# Asegura que si se ocupa un arco [i,d], el cliente [d,i] o [i,d] estará ahí
-model.addConstrs((x[d, i] <= v[i, d] for d in depots for i in customers), "client_inclusion_outgoing")
-model.addConstrs((x[i, d] <= v[i, d] for d in depots for i in customers), "client_inclusion_incoming")
-
-# Restriccion que elimina subtours
-model.addConstrs((v[i, d] + x[i, j] <= v[j, d] + 1 for d in depots for i in customers for j in customers if i != j),
-                 "path_elimination")
-
-# Restricciones genéricas
-# Restriccion capacidad depot
-model.addConstrs(
-    (gp.quicksum(customer_demands[i] * v[i, d] for i in customers) <= depot_capacities[d - n] * y[d] for d in depots),
-    "depot_capacity")
-
-# Restriccion capacidad vehiculo
-model.addConstrs(
-    (gp.quicksum(customer_demands[i] * x[i, j] for i in customers for j in customers if i != j) <= vehicle_capacity for
-     d in depots), "vehicle_capacity")
-
-# Restriccion depot abierto
-model.addConstrs((v[i, d] <= y[d] for d in depots for i in customers), "depot_open")
-
-# Solve the model
-start_time = time.time()
-model.optimize()
-end_time = time.time()
-
-metrics = {
-    "Modelo": model.getAttr("ModelName"),
-    "Instancia": file_path,
-    "Número de Variables": len(model.getVars()),
-    "Número de Restricciones": len(model.getConstrs()),
-    "Valor Función Objetivo": model.objVal,
-    "Tiempo de Cómputo (s)": end_time - start_time
-}
-
-print(metrics)
+
+
+def modelo_cda_gurobi(parsed_data, lazy=False, fraccional=False, arcos=None):
+    """
+    Implementación del modelo CDA (Capacitated Depot Allocation) usando Gurobi.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        lazy (bool): Si es True, las restricciones path_elimination no se agregan al modelo y se
+            separan bajo demanda (resolver con lazy_cda.resolver_lazy_gurobi).
+        fraccional (bool): Con lazy=True, separa también desde soluciones fraccionarias.
+        arcos (ndarray): Conjunto de arcos de arcos.arcos_knn (numeración de parse_file); si es None
+            se usan todos los arcos.
+
+    Retorna:
+        Model: Modelo de Gurobi con el problema CDA formulado.
+    """
+    # Extract parameters from parsed data
+    n = parsed_data["num_customers"]  # Number of customers
+    m = parsed_data["num_depots"]  # Number of depots
+    depot_coords = parsed_data["depots"]  # List of depot coords (e.g., [(0, 0), (1, 1), ...])
+    customer_coords = parsed_data["customers"]  # List of customer coords (e.g., [(0, 0), (1, 1), ...])
+    vehicle_capacity = parsed_data["vehicle_capacity"]  # Capacity of a vehicle
+    depot_capacities = parsed_data["depot_capacities"]  # List of depot capacities
+    customer_demands = parsed_data["customer_demands"]  # List of customer demands
+    opening_costs_depots = parsed_data["depot_opening_costs"]  # List of depot opening costs
+    route_opening_cost = parsed_data["route_opening_cost"]  # Cost of opening a route
+    costs = parsed_data["distance_matrix"]  # Distance matrix
+
+    # Create a list of customers
+    customers = range(n)
+
+    # Create a list of depots
+    depots = range(n, n + m)
+
+    # Hacer que keys() funcione
+    arc_indices = pares(None if arcos is None else clientes_primero(arcos, m, n), m + n)
+
+    # Create a Gurobi model
+    model = Model("F-MDRP_CDA")
+
+    # Variables
+    x = model.addVars(arc_indices, vtype=GRB.BINARY,
+                      name="x")  # Variable Binaria que indica si el arco de i a j está siendo usado
+    v = model.addVars([(i, d) for i in customers for d in depots], vtype=GRB.CONTINUOUS,
+                      name="v")  # Variable continua que indica si el cliente está asignado a un depot d
+    y = model.addVars(depots, vtype=GRB.BINARY, name="y")  # Variable binaria que indica si el depot d está abierto
+
+    # Funcion objetivo
+
+    model.setObjective(
+        # distance_matrix usa la numeración de parse_file (depósitos primero)
+        gp.quicksum(costs[i - n if i >= n else i + m][j - n if j >= n else j + m] * x[i, j]
+                    for i, j in arc_indices) +  # Minimizar el costo de la ruta +
+        gp.quicksum(opening_costs_depots[d - n] * y[d] for d in depots) +  # El costo del inicio del depot +
+        route_opening_cost * gp.quicksum(x[d, i] for d in depots for i in customers),  # El inicio de la ruta.
+        GRB.MINIMIZE
+    )
+
+    # Restricción CDA
+    # Asegura que cada cliente este asignado a un sólo depot
+    model.addConstrs((gp.quicksum(v[i, d] for d in depots) == 1 for i in customers), "client_assignment")
+
+    # Asegura que si se ocupa un arco [i,d], el cliente [d,i] o [i,d] estará ahí
+    model.addConstrs((x[d, i] <= v[i, d] for d in depots for i in customers), "client_inclusion_outgoing")
+    model.addConstrs((x[i, d] <= v[i, d] for d in depots for i in customers), "client_inclusion_incoming")
+
+    # Restriccion que elimina subtours
+    if lazy:
+        configurar_path_elimination_gurobi(
+            model, [[x[i, j] if i != j and (i, j) in x else None for j in customers] for i in customers],
+            [[v[i, d] for d in depots] for i in customers], fraccional=fraccional)
+    else:
+        model.addConstrs(
+            (v[i, d] + x[i, j] <= v[j, d] + 1 for d in depots for i in customers for j in customers
+             if i != j and (i, j) in x),
+            "path_elimination")
+
+    # Restricciones genéricas
+    # Restriccion capacidad depot
+    model.addConstrs(
+        (gp.quicksum(customer_demands[i] * v[i, d] for i in customers) <= depot_capacities[d - n] * y[d] for d in
+         depots),
+        "depot_capacity")
+
+    # Restriccion capacidad vehiculo
+    model.addConstrs(
+        (gp.quicksum(customer_demands[i] * x[i, j] for i in customers for j in customers
+                     if i != j and (i, j) in x) <= vehicle_capacity
+         for d in depots), "vehicle_capacity")
+
+    # Restriccion depot abierto
+    model.addConstrs((v[i, d] <= y[d] for d in depots for i in customers), "depot_open")
+
+    return model
+
+
+def modelo_cda_cplex(parsed_data, lazy=False, fraccional=False, arcos=None):
+    """
+    Implementación del modelo CDA (Capacitated Depot Allocation) usando CPLEX.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        lazy (bool): Si es True, las restricciones de relación entre asignaciones y rutas no se
+            agregan al modelo y se separan bajo demanda con callbacks de CPLEX.
+        fraccional (bool): Con lazy=True, separa también desde soluciones fraccionarias.
+        arcos (ndarray): Conjunto de arcos de arcos.arcos_knn; si es None se usan todos los pares
+            de nodos, como en la formulación original.
+
+    Retorna:
+        Model: Modelo de CPLEX con el problema CDA formulado.
+    """
+    n = parsed_data["num_customers"]
+    m = parsed_data["num_depots"]
+    depots = parsed_data["depots"]
+    customers = parsed_data["customers"]
+    vehicle_capacity = parsed_data["vehicle_capacity"]
+    depot_capacities = parsed_data["depot_capacities"]
+    customer_demands = parsed_data["customer_demands"]
+    opening_costs_depots = parsed_data["depot_opening_costs"]
+    costs = parsed_data["distance_matrix"]
+
+    mdl = Model_cpx(name="CDA_cpx")
+
+    # Variables
+    v = mdl.binary_var_matrix(n, m, name="v")  # Cliente asignado a depósito
+    x = mdl.binary_var_dict(pares(arcos, n + m, diagonal=arcos is None), name="x")  # Uso de arcos
+    y = mdl.binary_var_list(m, name="y")  # Uso de depósitos
+
+    # Función objetivo
+    mdl.minimize(
+        mdl.sum(costs[i][j] * x[i, j] for i, j in x) +
+        mdl.sum(opening_costs_depots[d] * y[d] for d in range(m))
+    )
+
+    # Restricciones
+    # 1. Cada cliente asignado a un único depósito
+    for i in range(n):
+        mdl.add_constraint(mdl.sum(v[i, d] for d in range(m)) == 1)
+
+    # 2. Si un cliente está asignado a un depósito, el depósito debe estar activo
+    for i in range(n):
+        for d in range(m):
+            mdl.add_constraint(v[i, d] <= y[d])
+
+    # 3. Relación entre asignaciones y rutas
+    if lazy:
+        configurar_path_elimination_cplex(
+            mdl, [[x.get((i + m, j + m)) if i != j else None for j in range(n)] for i in range(n)],
+            [[v[i, d] for d in range(m)] for i in range(n)], fraccional=fraccional)
+    else:
+        for i in range(n):
+            for j in range(n):
+                if (i + m, j + m) not in x:
+                    continue
+                for d in range(m):
+                    mdl.add_constraint(v[i, d] + x[i + m, j + m] <= v[j, d] + 1)
+
+    # 4. Capacidades de los depósitos
+    for d in range(m):
+        mdl.add_constraint(
+            mdl.sum(customer_demands[i] * v[i, d] for i in range(n)) <= depot_capacities[d]
+        )
+
+    # 5. Capacidad del vehículo
+    for i, j in [(i, j) for i, j in x if i != j]:
+        mdl.add_constraint(x[i, j] <= vehicle_capacity)
+
+    return mdl
+
+
+if __name__ == "__main__":
+    from cliente import main
+
+    main(["Instances/Benchmark_1/coord20-5-1.dat", "--formulacion", "CDA", "--solver", "gurobi"])
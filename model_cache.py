@@ -0,0 +1,145 @@
+"""
+Caché de modelos construidos: guarda cada modelo como MPS comprimido (.mps.gz) y lo relee en las
+corridas siguientes en vez de reconstruirlo en Python.
+
+La entrada se identifica por (formulación, constructor, k vecinos, versión del constructor, hash
+de la instancia). La versión del constructor es el hash del código fuente de los módulos que
+arman el modelo, así que cualquier cambio en una formulación invalida sus entradas. Los modelos de
+representacion.py son idénticos para ambos solvers y comparten la misma entrada; los de los
+constructores originales se guardan por solver.
+
+Los nombres de las variables se conservan en el MPS, así que los MIP starts por nombre (mip_start)
+funcionan igual sobre un modelo releído.
+"""
+import glob
+import gzip
+import hashlib
+import inspect
+import os
+import tempfile
+
+import arcos
+from instance_cache import file_hash
+
+# Directorio por defecto del caché de modelos
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".model_cache")
+
+# Versión del formato de las entradas (cambiarla invalida todo el caché)
+_FORMATO = 1
+
+
+def builder_version(constructor):
+    """
+    Hash corto del código fuente del módulo donde está definido el constructor y de arcos.py.
+    """
+    digest = hashlib.sha256(str(_FORMATO).encode())
+    for modulo in (inspect.getmodule(constructor), arcos):
+        with open(inspect.getsourcefile(modulo), 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:12]
+
+
+def model_path(file_path, formulacion, constructor, version, digest, k_vecinos=None, cache_dir=CACHE_DIR):
+    """
+    Ruta del archivo de caché de un modelo.
+
+    Parámetros:
+        file_path (str): Ruta al archivo .dat de la instancia.
+        formulacion (str): "SCF" o "CDA".
+        constructor (str): "ir" para los modelos de representacion.py, o el solver cuyo
+            constructor original generó el modelo.
+        version (str): Versión del constructor (ver builder_version).
+        digest (str): Hash del contenido de la instancia (ver instance_cache.file_hash).
+        k_vecinos (int): Vecinos de la poda de arcos, o None si se usan todos los arcos.
+        cache_dir (str): Directorio del caché.
+    """
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    arcos_modelo = f"k{k_vecinos}" if k_vecinos else "todos"
+    return os.path.join(cache_dir, f"{name}-{formulacion}-{constructor}-{arcos_modelo}-{version}-{digest[:16]}.mps.gz")
+
+
+def write_model(model_instance, solver, path):
+    """
+    Escribe un modelo como MPS comprimido de forma atómica.
+
+    El solver escribe en un archivo temporal del mismo directorio (con extensión .mps.gz, para que
+    lo comprima) que luego se renombra, así que nunca se lee un archivo a medio escribir.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp.mps.gz")
+    os.close(fd)
+    try:
+        if solver == 'gurobi':
+            model_instance.update()
+            model_instance.write(tmp_path)
+        else:
+            cpx = model_instance.get_cplex()
+            cpx.set_problem_name(model_instance.name)
+            cpx.write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _nombre_mps(path):
+    """
+    Nombre del modelo guardado en la sección NAME del MPS.
+    """
+    with gzip.open(path, 'rt', encoding="latin-1") as file:
+        for line in file:
+            if line.startswith("NAME"):
+                return line[4:].strip()
+            if line.startswith("ROWS"):
+                break
+    return ""
+
+
+def read_model(path, solver):
+    """
+    Lee un modelo MPS comprimido en el solver indicado.
+    """
+    if solver == 'gurobi':
+        import gurobipy as gp
+
+        return gp.read(path)
+    from docplex.mp.model_reader import ModelReader
+
+    return ModelReader.read(path, model_name=_nombre_mps(path))
+
+
+def load_model(file_path, formulacion, solver, constructor, build, ir=False, k_vecinos=None,
+               cache_dir=CACHE_DIR):
+    """
+    Carga un modelo desde el caché, construyéndolo y guardándolo si no está.
+
+    Parámetros:
+        file_path (str): Ruta al archivo .dat de la instancia.
+        formulacion (str): "SCF" o "CDA".
+        solver (str): "gurobi" o "cplex".
+        constructor (callable): Constructor del modelo; su módulo define la versión (ver
+            builder_version).
+        build (callable): Función sin argumentos que construye el modelo.
+        ir (bool): Si el modelo viene de representacion.py (entrada compartida por ambos solvers).
+        k_vecinos (int): Vecinos de la poda de arcos, o None si se usan todos los arcos.
+        cache_dir (str): Directorio del caché.
+
+    Retorna:
+        tuple: (modelo sin resolver, True si se leyó del caché)
+    """
+    path = model_path(file_path, formulacion, "ir" if ir else solver, builder_version(constructor),
+                      file_hash(file_path), k_vecinos, cache_dir)
+    if os.path.exists(path):
+        return read_model(path, solver), True
+
+    model_instance = build()
+    write_model(model_instance, solver, path)
+    return model_instance, False
+
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """
+    Elimina todos los modelos del caché.
+    """
+    for path in glob.glob(os.path.join(cache_dir, "*.mps.gz")):
+        os.remove(path)
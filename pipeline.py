@@ -0,0 +1,161 @@
+"""
+Pipeline de construcción–resolución–descarte.
+
+En vez de construir todos los modelos antes de resolver (como el diccionario `modelos` del
+notebook), cada modelo se construye sólo cuando le toca, se resuelve, se extraen sus métricas y su
+solución, y luego se liberan el modelo y el entorno del solver. Así la memoria queda acotada por el
+modelo más grande y no por la suma de todos.
+
+Cada etapa se mide con instrumentacion (tiempo de pared, CPU y pico de RSS, con presolve y solve
+por separado) y, con --registros, los registros con la trayectoria de incumbente y cota se agregan
+a un archivo JSON Lines.
+
+Uso (desde la raíz del repositorio):
+    python pipeline.py --benchmarks B1 --instancias "coord20-*.dat" --time-limit 60 --registros registros.jsonl
+"""
+import argparse
+import gc
+
+import gurobipy as gp
+
+from instrumentacion import (escribir_registro, gap, medir, memoria_mib, nuevo_registro,
+                             resolver_instrumentado)
+from model_cache import CACHE_DIR as CACHE_MODELOS
+from runner import (COLUMNAS, GET_METRICS, INSTANCIAS, MODELOS, abrir_csv, construir_modelo,
+                    expandir_trabajos)
+from testParser import parse_file
+from verificador import verificar_modelo
+
+ETAPAS = ["parse", "build", "presolve", "solve", "extract", "free"]
+
+
+def extraer_solucion(model_instance, solver, tol=1e-9):
+    """
+    Valores no nulos de la solución del modelo, por nombre de variable.
+
+    Retorna:
+        dict: Nombre de variable -> valor; vacío si el modelo no tiene solución.
+    """
+    if solver == 'gurobi':
+        if model_instance.SolCount == 0:
+            return {}
+        variables = model_instance.getVars()
+        nombres = model_instance.getAttr("VarName", variables)
+        valores = model_instance.getAttr("X", variables)
+        return {nombre: valor for nombre, valor in zip(nombres, valores) if abs(valor) > tol}
+    solucion = model_instance.solution
+    if solucion is None:
+        return {}
+    return {var.name: valor for var, valor in solucion.iter_var_values() if abs(valor) > tol}
+
+
+def liberar_modelo(model_instance, solver):
+    """
+    Libera el modelo y el entorno del solver.
+    """
+    if solver == 'gurobi':
+        model_instance.dispose()
+        gp.disposeDefaultEnv()
+    else:
+        model_instance.end()
+
+
+def pipeline(trabajos):
+    """
+    Ejecuta los trabajos uno a uno: construye, resuelve, extrae y descarta cada modelo.
+
+    Parámetros:
+        trabajos (iterable): Trabajos de runner.expandir_trabajos (puede ser un generador).
+
+    Retorna:
+        generator: Tuplas (métricas, solución, registro) por trabajo. El registro es el de
+            instrumentacion.nuevo_registro: tiempo de pared, tiempo de CPU, pico de RSS y RSS al
+            terminar cada etapa (parse, build, presolve, solve, extract y free), la trayectoria
+            de incumbente y cota, el resultado final y la verificación de la solución (llave
+            "verificacion": factibilidad, costo recalculado y violaciones; ver verificador).
+    """
+    for trabajo in trabajos:
+        registro = nuevo_registro(trabajo)
+        etapas = registro["etapas"]
+        solver = trabajo["solver"]
+
+        def resolver(model_instance, callback):
+            extra = {"callback": callback} if solver == 'gurobi' else {}
+            return GET_METRICS[solver](model_instance, trabajo["benchmark"], trabajo["instancia"],
+                                       threads=trabajo["threads"], time_limit=trabajo["time_limit"], **extra)
+
+        with medir(etapas, "parse"):
+            parsed_data = parse_file(trabajo["ruta"])
+        with medir(etapas, "build"):
+            model_instance = construir_modelo(trabajo, parsed_data)
+        metrics, registro["trayectoria"] = resolver_instrumentado(model_instance, solver, etapas, resolver)
+        with medir(etapas, "extract"):
+            solucion = extraer_solucion(model_instance, solver)
+            verificacion = verificar_modelo(model_instance, parsed_data, trabajo["formulacion"], solver,
+                                            'gurobi' if trabajo.get("ir") else None)
+        with medir(etapas, "free"):
+            liberar_modelo(model_instance, solver)
+            del model_instance, parsed_data
+            gc.collect()
+
+        objetivo = metrics["Valor Función Objetivo"]
+        registro.update(objetivo=objetivo if isinstance(objetivo, float) else None, cota=metrics.get("cota"),
+                        estado=metrics.get("estado"))
+        registro["gap"] = gap(registro["objetivo"], registro["cota"])
+        registro["verificacion"] = None if verificacion is None else {
+            k: verificacion[k] for k in ("factible", "costo", "violaciones")}
+        yield metrics, solucion, registro
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS))
+    parser.add_argument("--solvers", nargs="+", default=["cplex", "gurobi"])
+    parser.add_argument("--benchmarks", nargs="+", default=list(INSTANCIAS))
+    parser.add_argument("--instancias", nargs="+", default=None)
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--mip-start", choices=["savings", "sweep"], default=None)
+    parser.add_argument("--k-vecinos", type=int, default=None)
+    parser.add_argument("--ir", action="store_true")
+    parser.add_argument("--cache-modelos", nargs="?", const=CACHE_MODELOS, default=None, metavar="DIR")
+    parser.add_argument("--base", default="Instances")
+    parser.add_argument("--salida", default="results.csv")
+    parser.add_argument("--registros", default=None,
+                        help="archivo JSON Lines donde agregar los registros de instrumentación")
+    args = parser.parse_args(argv)
+
+    instancias = {B: args.instancias or INSTANCIAS.get(B, ["*.dat"]) for B in args.benchmarks}
+    trabajos = expandir_trabajos(args.formulaciones, args.solvers, instancias,
+                                 threads=args.threads, time_limit=args.time_limit, base=args.base,
+                                 mip_start=args.mip_start, k_vecinos=args.k_vecinos, ir=args.ir,
+                                 cache_modelos=args.cache_modelos)
+
+    file, writer = abrir_csv(args.salida)
+    picos = {etapa: 0.0 for etapa in ETAPAS}
+    try:
+        for metrics, _, registro in pipeline(trabajos):
+            writer.writerow({**metrics, "Solver": registro["solver"]})
+            file.flush()
+            if args.registros:
+                escribir_registro(args.registros, registro)
+            etapas = registro["etapas"]
+            print(", ".join(str(metrics[c]) for c in COLUMNAS))
+            verificacion = registro["verificacion"]
+            if verificacion is not None and not verificacion["factible"]:
+                print(f"    Solución no factible (costo recalculado {verificacion['costo']:.2f}): "
+                      + "; ".join(verificacion["violaciones"]))
+            print("    " + "  ".join(f"{e}: {etapas[e]['wall']:.2f}s ({etapas[e]['cpu']:.2f}s CPU) / "
+                                     f"{etapas[e]['pico_rss_mib']:.1f} MiB" for e in ETAPAS))
+            for etapa in ETAPAS:
+                picos[etapa] = max(picos[etapa], etapas[etapa]["pico_rss_mib"])
+    finally:
+        file.close()
+
+    print(f"RSS al terminar: {memoria_mib('VmRSS')} MiB")
+    print("Pico de RSS por etapa (máximo entre trabajos): " +
+          ", ".join(f"{e}: {picos[e]:.1f} MiB" for e in ETAPAS))
+
+
+if __name__ == "__main__":
+    main()
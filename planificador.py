@@ -0,0 +1,284 @@
+"""
+Planificador de campañas de benchmarks con un presupuesto total de tiempo.
+
+En vez de un time_limit fijo por trabajo, la campaña recibe un presupuesto de reloj (segundos) y
+reparte límites a medida que lanza los trabajos:
+    - Cada trabajo tiene un peso estimado según el tamaño de su instancia (ESTIMADORES: número
+      aproximado de variables y restricciones de la formulación).
+    - Al lanzar un trabajo, el tiempo disponible (workers × tiempo restante de la campaña, menos
+      lo ya reservado por los trabajos en curso) se reparte entre los pendientes en proporción a
+      su peso; lo que no usan los trabajos que terminan antes vuelve al fondo común.
+    - Los trabajos se lanzan de menor a mayor peso, así que las instancias fáciles no esperan
+      detrás de las difíciles.
+    - Un trabajo que termina por límite de tiempo con incumbente vuelve a la cola como
+      continuación: se relanza con su incumbente como MIP start y el tiempo que quede disponible.
+    - Cada trabajo recibe al menos MIN_LIMITE segundos; si ya no quedan y no hay trabajos en
+      curso que puedan devolver tiempo, se omite.
+
+Cada trabajo queda registrado en la base de resultados con un estado: óptimo, con límite de tiempo
+(y su gap), infactible (o no acotado), error u omitido (estado "OMITIDO", que se repite al reanudar
+la campaña). La llave de los
+resultados usa time_limit = None, así que una campaña interrumpida se reanuda omitiendo los
+trabajos ya terminados.
+
+Uso (desde la raíz del repositorio):
+    python planificador.py --presupuesto 28800 --workers 4 --threads 2 --db results.db --salida results.csv
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+
+from resultados import COLUMNAS, conectar, exportar_csv, guardar, pendientes
+from runner import (COLGEN, INSTANCIAS, MODELOS, expandir_trabajos, metricas_fallidas, proceso_trabajo,
+                    resumen_colgen, resumen_fijacion)
+from testParser import parse_file
+
+# Tamaño aproximado (variables más restricciones) de cada formulación según clientes n, depósitos
+# m y arcos a
+ESTIMADORES = {'SCF': lambda n, m, a: 3 * a + 2 * (n + m),
+               'CDA': lambda n, m, a: m * a + 3 * m * n,
+               COLGEN: lambda n, m, a: n * n}
+
+# Límite mínimo (s) con el que vale la pena lanzar un trabajo
+MIN_LIMITE = 5.0
+
+# Estados de la campaña
+OPTIMO, LIMITE, INFACTIBLE, OMITIDO, ERROR = "óptimo", "límite de tiempo", "infactible", "omitido", "error"
+
+
+def estimar(trabajo, parsed_data=None):
+    """
+    Peso de un trabajo: tamaño aproximado de su modelo según la instancia (ver ESTIMADORES).
+    """
+    parsed_data = parsed_data or parse_file(trabajo["ruta"])
+    n, m = parsed_data["num_customers"], parsed_data["num_depots"]
+    k = trabajo.get("k_vecinos")
+    arcos = (n + m) * min(k, n + m) if k and trabajo["formulacion"] != COLGEN else (n + m) ** 2
+    return float(ESTIMADORES[trabajo["formulacion"]](n, m, arcos))
+
+
+def clasificar(metrics):
+    """
+    Estado de la campaña de un trabajo terminado: OPTIMO, LIMITE (con o sin solución), INFACTIBLE
+    (infactible o no acotado: INFEASIBLE, INF_OR_UNBD, UNBOUNDED de Gurobi o "integer infeasible" y
+    similares de CPLEX), OMITIDO o ERROR (incluye los estados NUMERIC de Gurobi y los resueltos sin
+    detalles de docplex).
+    """
+    estado = str(metrics.get("estado"))
+    if estado == "OMITIDO":
+        return OMITIDO
+    if estado in ("ERROR", "NUMERIC", "None"):
+        return ERROR
+    minusculas = estado.lower()
+    if "infeasible" in minusculas or "unbounded" in minusculas or "inf_or_unbd" in minusculas:
+        return INFACTIBLE
+    if "optimal" in minusculas:
+        return OPTIMO
+    return LIMITE
+
+
+def asignar_limite(peso, pesos_pendientes, fin, reservado, workers, ahora=None, min_limite=MIN_LIMITE):
+    """
+    Límite de tiempo para un trabajo que se lanza ahora: su parte proporcional del tiempo
+    disponible, al menos min_limite si el presupuesto lo permite.
+
+    Parámetros:
+        peso (float): Peso del trabajo.
+        pesos_pendientes (float): Suma de los pesos de los trabajos sin lanzar (incluido éste).
+        fin (float): Instante (time.time) en que termina la campaña.
+        reservado (float): Segundos de trabajo ya asignados y aún no usados por los trabajos en
+            curso.
+        workers (int): Procesos simultáneos.
+        min_limite (float): Límite mínimo.
+
+    Retorna:
+        float: Segundos (menos que min_limite sólo si ya no queda presupuesto).
+    """
+    ahora = time.time() if ahora is None else ahora
+    restante = max(0.0, fin - ahora)
+    disponible = max(0.0, workers * restante - reservado)
+    return min(restante, disponible, max(min_limite, disponible * peso / pesos_pendientes))
+
+
+def _combinar(anterior, metrics):
+    """
+    Métricas de una continuación acumulando el tiempo de las corridas anteriores del trabajo.
+    """
+    if anterior is None:
+        return metrics
+    metrics["Tiempo de Cómputo (s)"] += anterior["Tiempo de Cómputo (s)"]
+    metrics["continuaciones"] = anterior.get("continuaciones", 0) + 1
+    if metrics.get("gap") is None and anterior.get("gap") is not None:
+        metrics["gap"] = anterior["gap"]
+    return metrics
+
+
+def planificar(trabajos, presupuesto, workers, gracia=60.0, continuar=True, min_limite=MIN_LIMITE):
+    """
+    Ejecuta una campaña con un presupuesto total de reloj y entrega cada trabajo al terminar.
+
+    Parámetros:
+        trabajos (list): Trabajos de runner.expandir_trabajos (su time_limit se ignora).
+        presupuesto (float): Segundos de reloj para toda la campaña.
+        workers (int): Procesos simultáneos.
+        gracia (float): Segundos extra sobre el límite antes de terminar un proceso.
+        continuar (bool): Relanzar con más tiempo, desde su incumbente, los trabajos que terminan
+            por límite de tiempo.
+        min_limite (float): Límite mínimo para lanzar un trabajo.
+
+    Retorna:
+        generator: Tuplas (trabajo, métricas, estado de la campaña) con las métricas de
+            runner.ejecutar_trabajo más "limite" (segundos asignados en la última corrida) y
+            "continuaciones".
+    """
+    inicio_campania = time.time()
+    fin = inicio_campania + presupuesto
+    ctx = multiprocessing.get_context("spawn")
+    cache = {}
+    pesos = []
+    for trabajo in trabajos:
+        if trabajo["ruta"] not in cache:
+            cache[trabajo["ruta"]] = parse_file(trabajo["ruta"])
+        pesos.append(estimar(trabajo, cache[trabajo["ruta"]]))
+    # Cola de (peso, índice del trabajo, métricas previas, incumbente), de menor a mayor peso
+    cola = sorted(((peso, k, None, None) for k, peso in enumerate(pesos)), key=lambda e: e[0])
+    activos = {}
+
+    while cola or activos:
+        while cola and len(activos) < workers:
+            peso, k, anterior, incumbente = cola[0]
+            ahora = time.time()
+            reservado = sum(max(0.0, lanzado + limite - ahora) for _, _, _, lanzado, limite, _ in activos.values())
+            limite = asignar_limite(peso, sum(e[0] for e in cola), fin, reservado, workers, ahora, min_limite)
+            if limite < min_limite:
+                if activos:
+                    break  # Esperar a que los trabajos en curso devuelvan tiempo
+                cola.pop(0)
+                if anterior is not None:
+                    yield trabajos[k], anterior, clasificar(anterior)
+                else:
+                    metrics = metricas_fallidas(trabajos[k], "OMITIDO", 0.0)
+                    yield trabajos[k], metrics, OMITIDO
+                continue
+            cola.pop(0)
+            trabajo = {**trabajos[k], "time_limit": limite, "continuable": continuar, "incumbente": incumbente}
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            proceso = ctx.Process(target=proceso_trabajo, args=(trabajo, send_conn), daemon=True)
+            proceso.start()
+            send_conn.close()
+            activos[recv_conn] = (k, anterior, proceso, ahora, limite, peso)
+
+        for conn in wait(list(activos), timeout=1.0):
+            k, anterior, proceso, lanzado, limite, peso = activos.pop(conn)
+            try:
+                estado, resultado = conn.recv()
+            except EOFError:
+                estado, resultado = "error", f"proceso terminado con código {proceso.exitcode}"
+            conn.close()
+            proceso.join()
+            if estado != "ok":
+                print(f"Error en {trabajos[k]['formulacion']}/{trabajos[k]['solver']}/"
+                      f"{trabajos[k]['instancia']}: {resultado}")
+                resultado = metricas_fallidas(trabajos[k], "ERROR", time.time() - lanzado)
+            incumbente = resultado.pop("incumbente", None)
+            resultado["limite"] = limite
+            metrics = _combinar(anterior, resultado)
+            categoria = clasificar(metrics)
+            if categoria == LIMITE and continuar and incumbente:
+                # Vuelve a la cola detrás de los trabajos sin lanzar
+                cola.append((peso, k, metrics, incumbente))
+            else:
+                yield trabajos[k], metrics, categoria
+
+        ahora = time.time()
+        for conn, (k, anterior, proceso, lanzado, limite, peso) in list(activos.items()):
+            if ahora - lanzado > limite + gracia:
+                proceso.kill()
+                proceso.join()
+                conn.close()
+                del activos[conn]
+                metrics = _combinar(anterior, metricas_fallidas(trabajos[k], "TIMEOUT", ahora - lanzado))
+                metrics["limite"] = limite
+                yield trabajos[k], metrics, LIMITE
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--presupuesto", type=float, required=True, help="segundos de reloj para toda la campaña")
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS),
+                        help=f"formulaciones de MODELOS o {COLGEN} (generación de columnas)")
+    parser.add_argument("--solvers", nargs="+", default=["cplex", "gurobi"])
+    parser.add_argument("--benchmarks", nargs="+", default=list(INSTANCIAS))
+    parser.add_argument("--instancias", nargs="+", default=None,
+                        help="archivos o patrones glob dentro de cada benchmark (por defecto los del notebook)")
+    parser.add_argument("--workers", type=int, default=None, help="procesos simultáneos")
+    parser.add_argument("--threads", type=int, default=None, help="hilos del solver por trabajo")
+    parser.add_argument("--gracia", type=float, default=60.0,
+                        help="segundos extra sobre el límite antes de terminar el proceso")
+    parser.add_argument("--min-limite", type=float, default=MIN_LIMITE,
+                        help="límite mínimo (s) para lanzar un trabajo; con menos se omite")
+    parser.add_argument("--sin-continuar", action="store_true",
+                        help="no relanzar desde su incumbente los trabajos que terminan por límite de tiempo")
+    parser.add_argument("--mip-start", choices=["savings", "sweep"], default=None,
+                        help="cargar la solución de la heurística constructiva como MIP start")
+    parser.add_argument("--k-vecinos", type=int, default=None,
+                        help="construir los modelos sólo con los arcos de los k vecinos más cercanos")
+    parser.add_argument("--ir", action="store_true",
+                        help="construir los modelos desde la representación intermedia común a ambos solvers")
+    parser.add_argument("--fijacion", action="store_true",
+                        help="fijar variables por costo reducido con la cota de la heurística antes de resolver")
+    parser.add_argument("--base", default="Instances", help="directorio raíz de los benchmarks")
+    parser.add_argument("--db", default="results.db", help="base SQLite de resultados")
+    parser.add_argument("--repetir", action="store_true",
+                        help="ejecutar también los trabajos que ya tienen resultado en la base")
+    parser.add_argument("--salida", default=None, help="exportar la base a este CSV al terminar")
+    args = parser.parse_args(argv)
+
+    cpus = os.cpu_count() or 1
+    if args.workers is None and args.threads is None:
+        args.threads = 1
+    if args.workers is None:
+        args.workers = max(1, cpus // args.threads)
+    if args.threads is None:
+        args.threads = max(1, cpus // args.workers)
+
+    instancias = {B: args.instancias or INSTANCIAS.get(B, ["*.dat"]) for B in args.benchmarks}
+    trabajos = expandir_trabajos(args.formulaciones, args.solvers, instancias, threads=args.threads, base=args.base,
+                                 mip_start=args.mip_start, k_vecinos=args.k_vecinos, ir=args.ir,
+                                 fijacion=args.fijacion)
+
+    con = conectar(args.db)
+    try:
+        if not args.repetir:
+            total = len(trabajos)
+            trabajos = pendientes(con, trabajos)
+            if total > len(trabajos):
+                print(f"Se omiten {total - len(trabajos)} trabajos ya terminados en {args.db}")
+        print(f"{len(trabajos)} trabajos, {args.workers} procesos × {args.threads} hilos, "
+              f"presupuesto {args.presupuesto:g} s")
+
+        conteo = {}
+        for trabajo, metrics, categoria in planificar(trabajos, args.presupuesto, args.workers, gracia=args.gracia,
+                                                      continuar=not args.sin_continuar, min_limite=args.min_limite):
+            gap = f", gap {100 * metrics['gap']:.2f} %" if categoria == LIMITE and metrics.get("gap") is not None else ""
+            extra = f", {metrics['continuaciones']} continuaciones" if metrics.get("continuaciones") else ""
+            limite = f", límite {metrics['limite']:.1f} s" if "limite" in metrics else ""
+            print(", ".join(str(metrics[c]) for c in COLUMNAS) + f" [{categoria}{gap}{limite}{extra}]")
+            if "fijacion" in metrics:
+                print(f"  Fijación: {resumen_fijacion(metrics['fijacion'])}")
+            if "colgen" in metrics:
+                print(f"  Generación de columnas: {resumen_colgen(metrics['colgen'])}")
+            guardar(con, trabajo, metrics)
+            conteo[categoria] = conteo.get(categoria, 0) + 1
+        print("Campaña: " + ", ".join(f"{total} {categoria}" for categoria, total in conteo.items()))
+
+        if args.salida:
+            print(f"{exportar_csv(con, args.salida)} filas exportadas a {args.salida}")
+    finally:
+        con.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+"""
+Pulidor de incumbentes por búsqueda local dentro del callback del solver.
+
+Cada vez que Gurobi (MIPSOL) o CPLEX (callback de incumbente) encuentra una nueva solución entera,
+se decodifica en rutas (verificador.decodificar), se mejora con búsqueda local de primera mejora
+sobre listas de vecinos y, si el resultado mejora el objetivo del modelo, se inyecta de vuelta
+(cbSetSolution en Gurobi; en CPLEX el callback heurístico la entrega en el nodo siguiente).
+
+Movimientos, evaluados en O(1) con distance_matrix y cargas acumuladas de cada ruta, para cada
+cliente a y cada uno de sus k vecinos más cercanos b:
+    - relocate: mover a después de b;
+    - swap: intercambiar a y b;
+    - 2-opt: invertir el tramo entre a y b si están en la misma ruta;
+    - 2-opt*: si están en rutas distintas, unir el inicio de la ruta de a (hasta a) con el final
+      de la de b (desde b) y viceversa.
+Los movimientos respetan vehicle_capacity y depot_capacities, y nunca crean rutas nuevas, así que
+en SCF se mantiene una ruta por depósito. Las rutas que quedan vacías se eliminan y los depósitos
+sin rutas se cierran. El tiempo de cada llamada está acotado por tiempo_max.
+
+Sólo se instala en las formulaciones cuyos incumbentes tienen rutas (FORMULACIONES_PULIBLES); en
+las demás se informa el motivo y el modelo se resuelve sin callback.
+"""
+import time
+
+import numpy as np
+from gurobipy import GRB
+from cplex.callbacks import HeuristicCallback, IncumbentCallback
+
+from fijacion import datos_modelo
+from mip_start import VALORES_INICIO
+from verificador import TOL, decodificar, verificar
+
+# Mejora mínima para aceptar un movimiento o inyectar una solución
+EPS = 1e-6
+
+# Nombres de los movimientos en las estadísticas
+MOVIMIENTOS = ("relocate", "swap", "2opt", "2opt*")
+
+# Formulaciones cuyos incumbentes se decodifican en rutas; los de CDA no tienen arcos x (el óptimo
+# de CDA sólo abre depósitos y asigna clientes), así que no hay nada que pulir
+FORMULACIONES_PULIBLES = ("SCF",)
+
+
+def nuevas_estadisticas():
+    """
+    Diccionario de estadísticas del pulidor compartido por los backends ("omitido" guarda el motivo
+    si el pulidor no se instaló).
+    """
+    return {"omitido": None, "llamadas": 0, "mejoras": 0, "ahorro": 0.0, "tiempo_pulido": 0.0, **{k: 0 for k in MOVIMIENTOS}}
+
+
+def preparar(parsed_data, k_vecinos=10):
+    """
+    Datos de la búsqueda local: distancias, demandas por nodo (0 en los depósitos), capacidades y
+    los k clientes más cercanos de cada cliente (nodos de la matriz de distancias).
+    """
+    m, n = parsed_data["num_depots"], parsed_data["num_customers"]
+    C = np.asarray(parsed_data["distance_matrix"], dtype=np.float64)
+    k = min(k_vecinos, n - 1)
+    vecinos = np.full((m + n, k), -1, dtype=np.int64)
+    if k > 0:
+        cercanos = np.argsort(C[m:, m:] + np.diag(np.full(n, np.inf)), axis=1, kind='stable')[:, :k]
+        vecinos[m:] = cercanos + m
+    return {
+        "m": m,
+        "C": C,
+        "q": np.concatenate((np.zeros(m), np.asarray(parsed_data["customer_demands"], dtype=np.float64))),
+        "Q": float(parsed_data["vehicle_capacity"]),
+        "capacidades": np.asarray(parsed_data["depot_capacities"], dtype=np.float64),
+        "apertura": np.asarray(parsed_data["depot_opening_costs"], dtype=np.float64),
+        "costo_ruta": float(parsed_data["route_opening_cost"]),
+        "vecinos": vecinos.tolist(),
+    }
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Estado de la búsqueda +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def _estado(datos, solucion):
+    m = datos["m"]
+    rutas = [(d, [m + i for i in ruta]) for d, ruta in solucion["rutas"] if len(ruta)]
+    e = {"rutas": [ruta for _, ruta in rutas], "dep": [d for d, _ in rutas],
+         "ruta_de": np.full(datos["C"].shape[0], -1, dtype=np.int64),
+         "pos": np.zeros(datos["C"].shape[0], dtype=np.int64), "prefijo": np.zeros(datos["C"].shape[0]),
+         "carga": [0.0] * len(rutas), "carga_dep": np.zeros(m), "rutas_dep": np.zeros(m, dtype=np.int64)}
+    for r in range(len(rutas)):
+        _reindexar(datos, e, r)
+        e["carga_dep"][e["dep"][r]] += e["carga"][r]
+        e["rutas_dep"][e["dep"][r]] += 1
+    return e
+
+
+def _reindexar(datos, e, r):
+    ruta = e["rutas"][r]
+    e["ruta_de"][ruta] = r
+    e["pos"][ruta] = np.arange(len(ruta))
+    e["prefijo"][ruta] = np.cumsum(datos["q"][ruta])
+    e["carga"][r] = float(e["prefijo"][ruta[-1]]) if ruta else 0.0
+
+
+def _eliminar_vacias(datos, e):
+    for r in reversed(range(len(e["rutas"]))):
+        if not e["rutas"][r]:
+            e["rutas_dep"][e["dep"][r]] -= 1
+            del e["rutas"][r], e["dep"][r], e["carga"][r]
+    for r in range(len(e["rutas"])):
+        _reindexar(datos, e, r)
+
+
+def _ant(e, r, p):
+    return e["rutas"][r][p - 1] if p > 0 else e["dep"][r]
+
+
+def _sig(e, r, p):
+    ruta = e["rutas"][r]
+    return ruta[p + 1] if p + 1 < len(ruta) else e["dep"][r]
+
+
+def _ahorro_vaciar(datos, e, r):
+    """
+    Costo fijo que se ahorra si la ruta r queda vacía (su apertura y, si es la única del
+    depósito, la apertura del depósito).
+    """
+    d = e["dep"][r]
+    return datos["costo_ruta"] + (datos["apertura"][d] if e["rutas_dep"][d] == 1 else 0.0)
+
+
+def _cabe(datos, e, r, nueva_carga, d, nueva_carga_dep):
+    return (nueva_carga <= datos["Q"] + TOL
+            and (nueva_carga_dep is None or nueva_carga_dep <= datos["capacidades"][d] + TOL))
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Movimientos +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def _relocate(datos, e, a, b):
+    C, q = datos["C"], datos["q"]
+    ra, pa, rb, pb = e["ruta_de"][a], e["pos"][a], e["ruta_de"][b], e["pos"][b]
+    if ra == rb and pb == pa - 1:
+        return False
+    da, db = e["dep"][ra], e["dep"][rb]
+    if ra != rb and not _cabe(datos, e, rb, e["carga"][rb] + q[a], db,
+                              e["carga_dep"][db] + q[a] if da != db else None):
+        return False
+    pr, nx, nb = _ant(e, ra, pa), _sig(e, ra, pa), _sig(e, rb, pb)
+    delta = C[pr, nx] - C[pr, a] - C[a, nx] + C[b, a] + C[a, nb] - C[b, nb]
+    if ra != rb and len(e["rutas"][ra]) == 1:
+        delta -= _ahorro_vaciar(datos, e, ra)
+    if delta >= -EPS:
+        return False
+    e["rutas"][ra].pop(pa)
+    if ra == rb and pa < pb:
+        pb -= 1
+    e["rutas"][rb].insert(pb + 1, a)
+    e["carga_dep"][da] -= q[a]
+    e["carga_dep"][db] += q[a]
+    _reindexar(datos, e, ra)
+    _reindexar(datos, e, rb)
+    if not e["rutas"][ra]:
+        _eliminar_vacias(datos, e)
+    return True
+
+
+def _swap(datos, e, a, b):
+    C, q = datos["C"], datos["q"]
+    ra, pa, rb, pb = e["ruta_de"][a], e["pos"][a], e["ruta_de"][b], e["pos"][b]
+    if ra == rb and abs(pa - pb) == 1:
+        return False
+    da, db = e["dep"][ra], e["dep"][rb]
+    if ra != rb:
+        otra_dep = da != db
+        if not (_cabe(datos, e, ra, e["carga"][ra] - q[a] + q[b], da,
+                      e["carga_dep"][da] - q[a] + q[b] if otra_dep else None)
+                and _cabe(datos, e, rb, e["carga"][rb] - q[b] + q[a], db,
+                          e["carga_dep"][db] - q[b] + q[a] if otra_dep else None)):
+            return False
+    pra, nxa, prb, nxb = _ant(e, ra, pa), _sig(e, ra, pa), _ant(e, rb, pb), _sig(e, rb, pb)
+    delta = (C[pra, b] + C[b, nxa] - C[pra, a] - C[a, nxa]
+             + C[prb, a] + C[a, nxb] - C[prb, b] - C[b, nxb])
+    if delta >= -EPS:
+        return False
+    e["rutas"][ra][pa], e["rutas"][rb][pb] = b, a
+    e["carga_dep"][da] += q[b] - q[a]
+    e["carga_dep"][db] += q[a] - q[b]
+    _reindexar(datos, e, ra)
+    _reindexar(datos, e, rb)
+    return True
+
+
+def _dos_opt(datos, e, a, b):
+    C = datos["C"]
+    r = e["ruta_de"][a]
+    if e["ruta_de"][b] != r:
+        return False
+    i, j = sorted((e["pos"][a], e["pos"][b]))
+    if j == i + 1:
+        return False
+    ruta = e["rutas"][r]
+    u, nu, v, nv = ruta[i], ruta[i + 1], ruta[j], _sig(e, r, j)
+    if C[u, v] + C[nu, nv] - C[u, nu] - C[v, nv] >= -EPS:
+        return False
+    ruta[i + 1:j + 1] = ruta[i + 1:j + 1][::-1]
+    _reindexar(datos, e, r)
+    return True
+
+
+def _dos_opt_estrella(datos, e, a, b):
+    C, q = datos["C"], datos["q"]
+    ra, pa, rb, pb = e["ruta_de"][a], e["pos"][a], e["ruta_de"][b], e["pos"][b]
+    if ra == rb:
+        return False
+    A, B = e["rutas"][ra], e["rutas"][rb]
+    da, db = e["dep"][ra], e["dep"][rb]
+    # Nuevas rutas: A[:pa+1] + B[pb:] (desde da) y B[:pb] + A[pa+1:] (desde db)
+    carga_a = e["prefijo"][a] + e["carga"][rb] - e["prefijo"][b] + q[b]
+    carga_b = e["carga"][ra] - e["prefijo"][a] + e["prefijo"][b] - q[b]
+    otra_dep = da != db
+    if not (_cabe(datos, e, ra, carga_a, da, e["carga_dep"][da] - e["carga"][ra] + carga_a if otra_dep else None)
+            and _cabe(datos, e, rb, carga_b, db, e["carga_dep"][db] - e["carga"][rb] + carga_b if otra_dep else None)):
+        return False
+    cola_a = pa + 1 < len(A)
+    na, pbv = _sig(e, ra, pa), _ant(e, rb, pb)
+    sa = A[pa + 1] if cola_a else db
+    delta = C[a, b] - C[a, na] + C[pbv, sa] - C[pbv, b] + C[B[-1], da] - C[B[-1], db]
+    if cola_a:
+        delta += C[A[-1], db] - C[A[-1], da]
+    if pb == 0 and not cola_a:
+        delta -= _ahorro_vaciar(datos, e, rb)
+    if delta >= -EPS:
+        return False
+    e["rutas"][ra], e["rutas"][rb] = A[:pa + 1] + B[pb:], B[:pb] + A[pa + 1:]
+    if otra_dep:
+        e["carga_dep"][da] += carga_a - e["carga"][ra]
+        e["carga_dep"][db] += carga_b - e["carga"][rb]
+    _reindexar(datos, e, ra)
+    _reindexar(datos, e, rb)
+    if not e["rutas"][rb]:
+        _eliminar_vacias(datos, e)
+    return True
+
+
+OPERADORES = (("relocate", _relocate), ("swap", _swap), ("2opt", _dos_opt), ("2opt*", _dos_opt_estrella))
+
+
+def busqueda_local(datos, solucion, tiempo_max=None, stats=None):
+    """
+    Mejora una solución con relocate, swap, 2-opt y 2-opt* restringidos a los vecinos más
+    cercanos (primera mejora), hasta un óptimo local o hasta agotar el tiempo.
+
+    Parámetros:
+        datos (dict): Datos de preparar.
+        solucion (dict): Solución con el formato de heuristica.construir_solucion.
+        tiempo_max (float): Segundos disponibles; None para no limitar.
+        stats (dict): Si se entrega, se suma el número de movimientos aplicados por tipo.
+
+    Retorna:
+        dict: Solución mejorada (depositos, asignacion y rutas; sin costo).
+    """
+    e = _estado(datos, solucion)
+    fin = time.perf_counter() + tiempo_max if tiempo_max is not None else np.inf
+    m, N = datos["m"], datos["C"].shape[0]
+    mejora = True
+    while mejora and time.perf_counter() < fin:
+        mejora = False
+        for a in range(m, N):
+            if time.perf_counter() >= fin:
+                break
+            for b in datos["vecinos"][a]:
+                for nombre, mover in OPERADORES:
+                    if mover(datos, e, a, b):
+                        mejora = True
+                        if stats is not None:
+                            stats[nombre] += 1
+                        break
+
+    asignacion = np.full(N - m, -1, dtype=np.int64)
+    rutas = []
+    for d, ruta in zip(e["dep"], e["rutas"]):
+        locales = [c - m for c in ruta]
+        asignacion[locales] = d
+        rutas.append((d, locales))
+    return {"depositos": sorted(set(e["dep"])), "asignacion": asignacion, "rutas": rutas}
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Integración con los solvers +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def _configurar(model_instance, solver, parsed_data, formulacion, nombres, tiempo_max, k_vecinos):
+    stats = nuevas_estadisticas()
+    if formulacion not in FORMULACIONES_PULIBLES:
+        stats["omitido"] = f"los incumbentes de {formulacion} no tienen rutas que pulir"
+        print(f"Pulidor omitido: {stats['omitido']}")
+        return {"formulacion": formulacion, "stats": stats}
+    modelo = datos_modelo(model_instance, solver)
+    return {
+        "parsed_data": parsed_data,
+        "formulacion": formulacion,
+        "formato": nombres or solver,
+        "nombres": modelo["nombres"],
+        "c": modelo["c"],
+        "busqueda": preparar(parsed_data, k_vecinos),
+        "tiempo_max": tiempo_max,
+        "ultimo": None,
+        "pendiente": None,
+        "stats": stats,
+    }
+
+
+def pulir_incumbente(estado, valores, objetivo):
+    """
+    Decodifica un incumbente, lo mejora con busqueda_local y lo traduce a valores del modelo.
+
+    Parámetros:
+        estado (dict): Estado del pulidor (model._pulidor).
+        valores (sequence): Valores de todas las variables del incumbente, en el orden del modelo.
+        objetivo (float): Objetivo del incumbente.
+
+    Retorna:
+        ndarray: Valores de la solución mejorada, o None si no mejora el objetivo del modelo.
+    """
+    stats = estado["stats"]
+    if estado["ultimo"] is not None and abs(objetivo - estado["ultimo"]) <= EPS:
+        return None  # Es la solución que acabamos de inyectar
+    start_time = time.perf_counter()
+    stats["llamadas"] += 1
+    try:
+        parsed_data = estado["parsed_data"]
+        solucion, _ = decodificar(parsed_data, estado["formulacion"], estado["nombres"], valores, estado["formato"])
+        if not verificar(parsed_data, solucion)["factible"]:
+            return None
+        mejorada = busqueda_local(estado["busqueda"], solucion, estado["tiempo_max"], stats)
+        nuevos = VALORES_INICIO[estado["formulacion"]](parsed_data, mejorada, estado["formato"])
+        vector = np.array([nuevos.get(nombre, 0.0) for nombre in estado["nombres"]])
+        nuevo_objetivo = float(estado["c"] @ vector)
+        if nuevo_objetivo >= objetivo - EPS:
+            return None
+        stats["mejoras"] += 1
+        stats["ahorro"] += objetivo - nuevo_objetivo
+        estado["ultimo"] = nuevo_objetivo
+        return vector
+    finally:
+        stats["tiempo_pulido"] += time.perf_counter() - start_time
+
+
+# Gurobi
+
+def configurar_pulidor_gurobi(model, parsed_data, formulacion, nombres=None, tiempo_max=0.5, k_vecinos=10):
+    """
+    Prepara un modelo Gurobi para pulir cada incumbente (resolver con resolver_pulido_gurobi o
+    pasar callback_pulidor_gurobi a optimize). Fuera de FORMULACIONES_PULIBLES el pulidor queda
+    omitido (motivo en model._pulidor["stats"]["omitido"]) y el callback no hace nada.
+
+    Parámetros:
+        model (Model): Modelo SCF o CDA.
+        parsed_data (dict): Diccionario con los datos parseados.
+        formulacion (str): "SCF" o "CDA".
+        nombres (str): Formato de los nombres de las variables ("gurobi" o "cplex"); por defecto
+            el del solver.
+        tiempo_max (float): Segundos de búsqueda local por incumbente.
+        k_vecinos (int): Vecinos más cercanos considerados por cliente.
+    """
+    model._pulidor = _configurar(model, 'gurobi', parsed_data, formulacion, nombres, tiempo_max, k_vecinos)
+    if model._pulidor["stats"]["omitido"] is None:
+        model._pulidor["variables"] = model.getVars()
+
+
+def callback_pulidor_gurobi(model, where):
+    """
+    Callback de Gurobi que pule cada nueva solución entera y entrega la mejorada con cbSetSolution.
+    """
+    estado = model._pulidor
+    if where != GRB.Callback.MIPSOL or estado["stats"]["omitido"] is not None:
+        return
+    vector = pulir_incumbente(estado, model.cbGetSolution(estado["variables"]),
+                              model.cbGet(GRB.Callback.MIPSOL_OBJ))
+    if vector is not None:
+        model.cbSetSolution(estado["variables"], vector.tolist())
+
+
+def resolver_pulido_gurobi(model):
+    """
+    Resuelve un modelo preparado con configurar_pulidor_gurobi.
+
+    Retorna:
+        dict: Estadísticas del pulidor (incumbentes pulidos, soluciones mejoradas, ahorro total en
+            el objetivo, tiempo de búsqueda local y movimientos aplicados por tipo).
+    """
+    if model._pulidor["stats"]["omitido"] is not None:
+        model.optimize()
+    else:
+        model.optimize(callback_pulidor_gurobi)
+    return model._pulidor["stats"]
+
+
+# CPLEX
+
+class PulidorIncumbentCallback(IncumbentCallback):
+    """
+    Callback de incumbente de CPLEX: pule cada nueva solución y deja la mejorada pendiente.
+    """
+
+    def __call__(self):
+        vector = pulir_incumbente(self.estado, self.get_values(), self.get_objective_value())
+        if vector is not None:
+            self.estado["pendiente"] = vector
+
+
+class PulidorHeuristicCallback(HeuristicCallback):
+    """
+    Callback heurístico de CPLEX: entrega la solución pulida pendiente en el nodo siguiente.
+    """
+
+    def __call__(self):
+        vector, self.estado["pendiente"] = self.estado["pendiente"], None
+        if vector is not None:
+            self.set_solution([list(range(vector.size)), vector.tolist()])
+
+
+def configurar_pulidor_cplex(mdl, parsed_data, formulacion, nombres=None, tiempo_max=0.5, k_vecinos=10):
+    """
+    Registra en un modelo docplex los callbacks que pulen cada incumbente (mismos parámetros que
+    configurar_pulidor_gurobi). Las estadísticas quedan en mdl._pulidor["stats"]; fuera de
+    FORMULACIONES_PULIBLES no se registra ningún callback.
+    """
+    mdl._pulidor = _configurar(mdl, 'cplex', parsed_data, formulacion, nombres, tiempo_max, k_vecinos)
+    if mdl._pulidor["stats"]["omitido"] is not None:
+        return
+    for clase in (PulidorIncumbentCallback, PulidorHeuristicCallback):
+        mdl.register_callback(clase).estado = mdl._pulidor
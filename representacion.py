@@ -0,0 +1,404 @@
+"""
+Representación intermedia (IR) de las formulaciones, independiente del solver.
+
+Cada formulación se describe una sola vez como un problema lineal disperso: vector de costos,
+cotas, tipos y nombres de las variables, y matriz de restricciones CSR con sentidos y lado
+derecho. La IR se arma con aritmética de índices de NumPy a partir de la instancia parseada, y
+los cargadores la vuelcan en bloque a Gurobi (addMVar/addMConstr) o a CPLEX (docplex), de modo
+que ambos solvers resuelven exactamente el mismo modelo.
+
+La IR es un diccionario con las llaves:
+    nombre (str): Nombre del modelo.
+    c, lb, ub (ndarray): Costos y cotas de las variables.
+    tipos (ndarray): Tipo de cada variable ('B' binaria, 'C' continua).
+    nombres (list): Nombre de cada variable.
+    variables (dict): Bloque de variables -> (inicio, fin) de sus columnas.
+    A (csr_matrix): Matriz de restricciones.
+    sentidos (ndarray): Sentido de cada fila ('<', '=', '>').
+    rhs (ndarray): Lado derecho.
+    restricciones (list): Bloques de restricciones como (nombre, inicio, fin) de sus filas.
+
+Las formulaciones son las de los constructores de Gurobi (SCF.modelo_scf_gurobi y
+model.modelo_cda_gurobi), con su misma numeración de nodos y nombres de variables.
+"""
+import operator
+
+import numpy as np
+import scipy.sparse as sp
+
+from arcos import clientes_primero
+
+# Sentidos de las filas (coinciden con GRB.LESS_EQUAL, GRB.EQUAL y GRB.GREATER_EQUAL)
+MENOR_IGUAL, IGUAL, MAYOR_IGUAL = "<", "=", ">"
+
+# Operador de comparación de docplex para cada sentido de la IR
+SENTIDOS_CPLEX = {MENOR_IGUAL: operator.le, IGUAL: operator.eq, MAYOR_IGUAL: operator.ge}
+
+
+def ensamblar(bloques, num_vars):
+    """
+    Une bloques de restricciones dispersas en una sola matriz A, vector de sentidos y lado derecho.
+
+    Parámetros:
+        bloques (list): Lista de tuplas (filas, columnas, valores, num_filas, sentido, rhs), donde las
+            filas son índices locales al bloque y rhs es un escalar o un arreglo de largo num_filas.
+        num_vars (int): Número total de columnas (variables) del modelo.
+
+    Retorna:
+        tuple: (A en formato CSR, arreglo de sentidos, arreglo con el lado derecho)
+    """
+    rows, cols, vals, senses, rhs = [], [], [], [], []
+    offset = 0
+    for filas, columnas, valores, num_filas, sentido, b in bloques:
+        rows.append(np.asarray(filas, dtype=np.int64) + offset)
+        cols.append(np.asarray(columnas, dtype=np.int64))
+        vals.append(np.broadcast_to(np.asarray(valores, dtype=np.float64), np.shape(filas)))
+        senses.append(np.full(num_filas, sentido))
+        rhs.append(np.broadcast_to(np.asarray(b, dtype=np.float64), (num_filas,)))
+        offset += num_filas
+
+    A = sp.csr_matrix(
+        (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))), shape=(offset, num_vars)
+    )
+    return A, np.concatenate(senses), np.concatenate(rhs)
+
+
+def nueva_representacion(nombre, variables, restricciones):
+    """
+    Arma la IR a partir de sus bloques de variables y de restricciones.
+
+    Parámetros:
+        nombre (str): Nombre del modelo.
+        variables (list): Bloques (nombre, tipo, costo, nombres) en orden de columnas; tipo es 'B'
+            (binaria, cotas [0, 1]) o 'C' (continua, cotas [0, inf)) y costo es un arreglo del
+            largo del bloque.
+        restricciones (list): Bloques (nombre, filas, columnas, valores, num_filas, sentido, rhs)
+            con el formato de ensamblar.
+
+    Retorna:
+        dict: Representación intermedia del modelo.
+    """
+    c, tipos, nombres, rangos = [], [], [], {}
+    inicio = 0
+    for bloque, tipo, costo, nombres_bloque in variables:
+        costo = np.asarray(costo, dtype=np.float64)
+        c.append(costo)
+        tipos.append(np.full(costo.size, tipo))
+        nombres.extend(nombres_bloque)
+        rangos[bloque] = (inicio, inicio + costo.size)
+        inicio += costo.size
+    c, tipos = np.concatenate(c), np.concatenate(tipos)
+
+    A, sentidos, rhs = ensamblar([r[1:] for r in restricciones], c.size)
+    filas, inicio = [], 0
+    for bloque, *_, num_filas, _, _ in restricciones:
+        filas.append((bloque, inicio, inicio + num_filas))
+        inicio += num_filas
+
+    return {
+        "nombre": nombre,
+        "c": c,
+        "lb": np.zeros(c.size),
+        "ub": np.where(tipos == 'B', 1.0, np.inf),
+        "tipos": tipos,
+        "nombres": nombres,
+        "variables": rangos,
+        "A": A,
+        "sentidos": sentidos,
+        "rhs": rhs,
+        "restricciones": filas,
+    }
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Formulaciones +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def representacion_scf(parsed_data, arcos=None):
+    """
+    IR del modelo SCF (Single Commodity Flow) de SCF.modelo_scf_gurobi.
+
+    Nodos: depósitos 0..m-1 y clientes m..m+n-1. Variables x[i,j] y f[i,j] sobre los arcos e y[d].
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        arcos (ndarray): Conjunto de arcos de arcos.arcos_knn; si es None se usan todos los pares
+            de nodos (incluida la diagonal, igual que el original).
+
+    Retorna:
+        dict: Representación intermedia del modelo.
+    """
+    n = parsed_data["num_customers"]
+    m = parsed_data["num_depots"]
+    vehicle_capacity = parsed_data["vehicle_capacity"]
+    depot_capacities = np.asarray(parsed_data["depot_capacities"], dtype=np.float64)
+    customer_demands = np.asarray(parsed_data["customer_demands"], dtype=np.float64)
+    opening_costs_depots = np.asarray(parsed_data["depot_opening_costs"], dtype=np.float64)
+    opening_cost_route = parsed_data["route_opening_cost"]
+    costs = np.array(parsed_data["distance_matrix"], dtype=np.float64)
+
+    N = m + n
+
+    # Arcos del modelo en orden de filas y posición de cada arco (i, j) en x y f (-1 si no existe)
+    ai, aj = np.nonzero(np.ones((N, N), dtype=bool) if arcos is None else arcos & ~np.eye(N, dtype=bool))
+    K = ai.size
+    pos = np.full((N, N), -1, dtype=np.int64)
+    pos[ai, aj] = np.arange(K)
+
+    # Índices de columna de cada bloque de variables
+    def col_x(i, j):
+        return pos[i, j]
+
+    def col_f(i, j):
+        return K + pos[i, j]
+
+    def col_y(d):
+        return 2 * K + d
+
+    clientes = np.arange(m, N)
+    deps = np.arange(m)
+
+    # Pares (cliente i, nodo j) con j != i, en el orden de los generadores originales; sale/entra
+    # indican si existen los arcos i -> j y j -> i
+    ci, cj = np.meshgrid(clientes, np.arange(N), indexing='ij')
+    mask = ci != cj
+    ci, cj = ci[mask], cj[mask]
+    sale, entra = pos[ci, cj] >= 0, pos[cj, ci] >= 0
+    si, sj, ei, ej = ci[sale], cj[sale], ci[entra], cj[entra]
+
+    # Pares (depósito d, cliente j)
+    dd, dj = np.meshgrid(deps, clientes, indexing='ij')
+    dd, dj = dd.ravel(), dj.ravel()
+    sale, entra = pos[dd, dj] >= 0, pos[dj, dd] >= 0
+    sdd, sdj, edd, edj = dd[sale], dj[sale], dd[entra], dj[entra]
+
+    # Arcos i != j en orden de filas
+    fuera = ai != aj
+    bi, bj = ai[fuera], aj[fuera]
+    num_arcos = bi.size
+
+    np.fill_diagonal(costs, 0.0)
+    nombres = [f"{i},{j}]" for i, j in zip(ai.tolist(), aj.tolist())]
+    variables = [
+        ("x", 'B', costs[ai, aj], ["x[" + a for a in nombres]),  # Ruta entre nodos
+        ("f", 'C', np.zeros(K), ["f[" + a for a in nombres]),  # Flujo de producto
+        ("y", 'B', opening_costs_depots + opening_cost_route, [f"y[{d}]" for d in range(m)]),  # Uso de depósitos
+    ]
+
+    restricciones = [
+        # 1. Cada cliente es atendido exactamente una vez (salen, entran intercalados por cliente)
+        ("atencion_cliente", np.concatenate([2 * (si - m), 2 * (ei - m) + 1]),
+         np.concatenate([col_x(si, sj), col_x(ej, ei)]), 1.0, 2 * n, IGUAL, 1.0),
+        # 2. Las rutas deben comenzar y terminar en depósitos abiertos
+        ("deposito_abierto", np.concatenate([2 * sdd, 2 * edd + 1, 2 * deps, 2 * deps + 1]),
+         np.concatenate([col_x(sdd, sdj), col_x(edj, edd), col_y(deps), col_y(deps)]),
+         np.concatenate([np.ones(sdd.size + edd.size), -np.ones(2 * m)]), 2 * m, MENOR_IGUAL, 0.0),
+        # 3. Restricciones de flujo para garantizar balance
+        ("balance_flujo", np.concatenate([si - m, ei - m]),
+         np.concatenate([col_f(si, sj), col_f(ej, ei)]),
+         np.concatenate([np.ones(si.size), -np.ones(ei.size)]), n, IGUAL, customer_demands),
+        # Flujo limitado por capacidad del vehículo
+        ("capacidad_vehiculo", np.concatenate([np.arange(num_arcos), np.arange(num_arcos)]),
+         np.concatenate([col_f(bi, bj), col_x(bi, bj)]),
+         np.concatenate([np.ones(num_arcos), np.full(num_arcos, -vehicle_capacity)]),
+         num_arcos, MENOR_IGUAL, 0.0),
+        # 4. Capacidad máxima de los depósitos
+        ("capacidad_deposito", sdd, col_f(sdd, sdj), 1.0, m, MENOR_IGUAL, depot_capacities),
+    ]
+
+    ir = nueva_representacion("SCF", variables, restricciones)
+    ir["arcos"] = np.stack([ai, aj], axis=1)
+    return ir
+
+
+def representacion_cda(parsed_data, arcos=None, path_elimination=True):
+    """
+    IR del modelo CDA (Capacitated Depot Allocation) de model.modelo_cda_gurobi.
+
+    Mantiene la indexación del modelo original (clientes 0..n-1, depósitos n..n+m-1) y el mismo
+    orden de variables y restricciones. El bloque path_elimination, de m·n·(n-1) filas, se genera
+    con aritmética de índices en vez de un generador de Python.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        arcos (ndarray): Conjunto de arcos de arcos.arcos_knn (numeración de parse_file); si es None
+            se usan todos los arcos.
+        path_elimination (bool): Si es False, el bloque path_elimination se omite (para separarlo
+            bajo demanda, ver lazy_cda).
+
+    Retorna:
+        dict: Representación intermedia del modelo; la llave "existe" guarda la matriz booleana de
+            arcos con la numeración del modelo.
+    """
+    n = parsed_data["num_customers"]
+    m = parsed_data["num_depots"]
+    vehicle_capacity = parsed_data["vehicle_capacity"]
+    depot_capacities = np.asarray(parsed_data["depot_capacities"], dtype=np.float64)
+    customer_demands = np.asarray(parsed_data["customer_demands"], dtype=np.float64)
+    opening_costs_depots = np.asarray(parsed_data["depot_opening_costs"], dtype=np.float64)
+    route_opening_cost = parsed_data["route_opening_cost"]
+    costs = np.asarray(parsed_data["distance_matrix"], dtype=np.float64)
+
+    N = m + n
+
+    # Arcos i != j en el orden de arc_indices y posición de cada arco en x (-1 si no existe)
+    existe = ~np.eye(N, dtype=bool)
+    if arcos is not None:
+        existe &= clientes_primero(arcos, m, n)
+    ai, aj = np.nonzero(existe)
+    X = ai.size
+    pos = np.full((N, N), -1, dtype=np.int64)
+    pos[ai, aj] = np.arange(X)
+    # distance_matrix usa la numeración de parse_file (depósitos primero)
+    pi, pj = np.where(ai >= n, ai - n, ai + m), np.where(aj >= n, aj - n, aj + m)
+    costo_arco = costs[pi, pj] + route_opening_cost * ((ai >= n) & (aj < n))
+
+    def col_x(i, j):
+        return pos[i, j]
+
+    def col_v(i, d):
+        return X + i * m + (d - n)
+
+    def col_y(d):
+        return X + n * m + (d - n)
+
+    customers = np.arange(n)
+    depots = np.arange(n, N)
+
+    # Mismos nombres que modelo_cda_gurobi (x[i,j], v[i,d], y[d] con depósitos n..n+m-1)
+    variables = [
+        ("x", 'B', costo_arco, [f"x[{i},{j}]" for i, j in zip(ai.tolist(), aj.tolist())]),
+        ("v", 'C', np.zeros(n * m), [f"v[{i},{d}]" for i in range(n) for d in range(n, N)]),
+        ("y", 'B', opening_costs_depots, [f"y[{d}]" for d in range(n, N)]),
+    ]
+
+    # Pares (d, i) en el orden de "for d in depots for i in customers"
+    pd_, pi_ = np.meshgrid(depots, customers, indexing='ij')
+    pd_, pi_ = pd_.ravel(), pi_.ravel()
+    uno = np.ones(m * n)
+    filas_di = np.arange(m * n)
+
+    # Arcos entre clientes para vehicle_capacity
+    ki, kj = np.nonzero(existe[:n, :n])
+    filas_vc = np.repeat(np.arange(m), ki.size)
+
+    restricciones = [
+        ("client_assignment", np.repeat(customers, m), col_v(np.repeat(customers, m), np.tile(depots, n)),
+         1.0, n, IGUAL, 1.0),
+        ("client_inclusion_outgoing", np.concatenate([filas_di, filas_di]),
+         np.concatenate([col_x(pd_, pi_), col_v(pi_, pd_)]), np.concatenate([uno, -uno]), m * n, MENOR_IGUAL, 0.0),
+        ("client_inclusion_incoming", np.concatenate([filas_di, filas_di]),
+         np.concatenate([col_x(pi_, pd_), col_v(pi_, pd_)]), np.concatenate([uno, -uno]), m * n, MENOR_IGUAL, 0.0),
+        ("depot_capacity", np.concatenate([pd_ - n, depots - n]), np.concatenate([col_v(pi_, pd_), col_y(depots)]),
+         np.concatenate([customer_demands[pi_], -depot_capacities]), m, MENOR_IGUAL, 0.0),
+        ("vehicle_capacity", filas_vc, np.tile(col_x(ki, kj), m), np.tile(customer_demands[ki], m), m,
+         MENOR_IGUAL, vehicle_capacity),
+        ("depot_open", np.concatenate([filas_di, filas_di]), np.concatenate([col_v(pi_, pd_), col_y(pd_)]),
+         np.concatenate([uno, -uno]), m * n, MENOR_IGUAL, 0.0),
+    ]
+
+    # path_elimination (tripletas (d, i, j) con i != j y arco i -> j)
+    if path_elimination:
+        td, ti, tj = np.meshgrid(depots, customers, customers, indexing='ij')
+        mask = existe[ti, tj]
+        td, ti, tj = td[mask], ti[mask], tj[mask]
+        num_pe = td.size
+        filas_pe = np.arange(num_pe)
+        restricciones.insert(3, ("path_elimination", np.concatenate([filas_pe, filas_pe, filas_pe]),
+                                 np.concatenate([col_v(ti, td), col_x(ti, tj), col_v(tj, td)]),
+                                 np.concatenate([np.ones(num_pe), np.ones(num_pe), -np.ones(num_pe)]),
+                                 num_pe, MENOR_IGUAL, 1.0))
+
+    ir = nueva_representacion("F-MDRP_CDA", variables, restricciones)
+    ir["existe"] = existe
+    return ir
+
+
+# -+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+ Cargadores +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-
+
+def cargar_gurobi(ir):
+    """
+    Carga una IR en un modelo de Gurobi con una llamada a addMVar y una a addMConstr por bloque.
+
+    Cada bloque de variables queda además como atributo del modelo (mdl._x, mdl._f, ...), como
+    MVar sobre sus columnas.
+
+    Retorna:
+        Model: Modelo de Gurobi sin resolver.
+    """
+    import gurobipy as gp
+    from gurobipy import GRB
+
+    mdl = gp.Model(ir["nombre"])
+    todas = mdl.addMVar(ir["c"].size, lb=ir["lb"], ub=ir["ub"], obj=ir["c"], vtype=ir["tipos"],
+                        name=np.array(ir["nombres"]))
+    mdl.ModelSense = GRB.MINIMIZE
+    A, sentidos, rhs = ir["A"], ir["sentidos"], ir["rhs"]
+    for nombre, inicio, fin in ir["restricciones"]:
+        mdl.addMConstr(A[inicio:fin], todas, sentidos[inicio:fin], rhs[inicio:fin], name=nombre)
+    for nombre, (inicio, fin) in ir["variables"].items():
+        setattr(mdl, "_" + nombre, todas[inicio:fin])
+    return mdl
+
+
+def cargar_cplex(ir):
+    """
+    Carga una IR en un modelo docplex.
+
+    Las variables se crean con una llamada a var_list por bloque, cada fila se arma directamente
+    desde la fila CSR con scal_prod_vars_all_different y todas las restricciones se agregan en un
+    solo bloque con add_constraints. Cada bloque de variables queda como atributo del modelo
+    (mdl._x, mdl._f, ...), como lista de variables.
+
+    Retorna:
+        Model: Modelo docplex sin resolver.
+    """
+    from docplex.mp.model import Model as Model_cpx
+
+    mdl = Model_cpx(name=ir["nombre"], checker="off")
+    infinito = mdl.infinity
+    todas = []
+    for nombre, (inicio, fin) in ir["variables"].items():
+        tipo = mdl.binary_vartype if ir["tipos"][inicio] == 'B' else mdl.continuous_vartype
+        ub = np.minimum(ir["ub"][inicio:fin], infinito).tolist()
+        bloque = mdl.var_list(fin - inicio, tipo, lb=ir["lb"][inicio:fin].tolist(), ub=ub,
+                              name=ir["nombres"][inicio:fin])
+        setattr(mdl, "_" + nombre, bloque)
+        todas.extend(bloque)
+
+    c = ir["c"]
+    con_costo = np.flatnonzero(c)
+    mdl.minimize(mdl.scal_prod_vars_all_different([todas[j] for j in con_costo.tolist()], c[con_costo].tolist()))
+
+    A = ir["A"]
+    indptr, indices, data = A.indptr.tolist(), A.indices.tolist(), A.data.tolist()
+    sentidos = [SENTIDOS_CPLEX[s] for s in ir["sentidos"].tolist()]
+    rhs = ir["rhs"].tolist()
+    restricciones, nombres = [], []
+    for nombre, inicio, fin in ir["restricciones"]:
+        for fila in range(inicio, fin):
+            a, b = indptr[fila], indptr[fila + 1]
+            expr = mdl.scal_prod_vars_all_different([todas[j] for j in indices[a:b]], data[a:b])
+            restricciones.append(sentidos[fila](expr, rhs[fila]))
+            nombres.append(f"{nombre}[{fila - inicio}]")
+    mdl.add_constraints(restricciones, nombres)
+    return mdl
+
+
+# Constructores de la IR por formulación y cargadores por solver
+REPRESENTACIONES = {"SCF": representacion_scf, "CDA": representacion_cda}
+CARGADORES = {"gurobi": cargar_gurobi, "cplex": cargar_cplex}
+
+
+def construir_modelo_ir(formulacion, solver, parsed_data, **kwargs):
+    """
+    Construye la IR de una formulación y la carga en el solver pedido.
+
+    Parámetros:
+        formulacion (str): "SCF" o "CDA".
+        solver (str): "gurobi" o "cplex".
+        parsed_data (dict): Diccionario con los datos parseados.
+        **kwargs: Opciones del constructor de la IR (por ejemplo arcos).
+
+    Retorna:
+        Modelo de Gurobi o docplex sin resolver.
+    """
+    return CARGADORES[solver](REPRESENTACIONES[formulacion](parsed_data, **kwargs))
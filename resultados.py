@@ -0,0 +1,232 @@
+"""
+Almacén de resultados en SQLite que reemplaza el results.csv de sólo-agregar.
+
+Cada trabajo se identifica por (formulación, solver, benchmark, instancia, parámetros), de modo que
+una corrida interrumpida puede reanudarse omitiendo los trabajos ya terminados. Las métricas se
+guardan como campos tipados (tiempos por etapa, gap, cota, nodos, estado, costo verificado y pico
+de memoria) y el CSV con las columnas de results.csv se genera a pedido. Las bases creadas antes de
+que existiera un campo lo reciben (vacío) al conectarse.
+
+La base usa journal WAL y transacciones BEGIN IMMEDIATE con espera, así que varios procesos pueden
+escribir a la vez sin corromperla ni perder filas.
+
+Uso (desde la raíz del repositorio):
+    python resultados.py exportar results.db results.csv
+    python resultados.py resumen results.db
+"""
+import argparse
+import csv
+import json
+import sqlite3
+from datetime import datetime
+
+# Columnas de results.csv
+COLUMNAS = ["Modelo", "Benchmark", "Instancia", "Número de Variables", "Número de Restricciones",
+            "Valor Función Objetivo", "Tiempo de Cómputo (s)"]
+
+# Columnas de los CSV escritos por el repositorio: las de results.csv más el solver, que distingue
+# las filas de ambos solvers con el mismo Modelo
+COLUMNAS_CSV = COLUMNAS[:1] + ["Solver"] + COLUMNAS[1:]
+
+# Codificación de results.csv (el archivo original fue escrito en cp1252)
+CSV_ENCODING = "cp1252"
+
+# Parámetros del trabajo que forman parte de la llave
+PARAMETROS = ("threads", "time_limit", "mip_start", "k_vecinos")
+
+# Parámetros que sólo forman parte de la llave cuando están activos, para que las llaves de los
+# resultados guardados antes de que existieran sigan siendo válidas
+PARAMETROS_OPCIONALES = ("ir", "barrido", "fijacion")
+
+# Campos de la tabla y su tipo
+CAMPOS = [
+    ("formulacion", "TEXT NOT NULL"),
+    ("solver", "TEXT NOT NULL"),
+    ("benchmark", "TEXT NOT NULL"),
+    ("instancia", "TEXT NOT NULL"),
+    ("parametros", "TEXT NOT NULL"),
+    ("modelo", "TEXT"),
+    ("num_variables", "INTEGER"),
+    ("num_restricciones", "INTEGER"),
+    ("objetivo", "REAL"),
+    ("costo_verificado", "REAL"),
+    ("cota", "REAL"),
+    ("gap", "REAL"),
+    ("nodos", "INTEGER"),
+    ("estado", "TEXT"),
+    ("tiempo_parse", "REAL"),
+    ("tiempo_build", "REAL"),
+    ("tiempo_solve", "REAL"),
+    ("pico_rss_mib", "REAL"),
+    ("fecha", "TEXT"),
+]
+LLAVE = ("formulacion", "solver", "benchmark", "instancia", "parametros")
+
+# Estados de trabajos que no terminaron y deben repetirse al reanudar (OMITIDO: sin presupuesto
+# en una campaña de planificador.py)
+ESTADOS_FALLIDOS = ("ERROR", "OMITIDO")
+
+
+def conectar(ruta="results.db", timeout=60.0):
+    """
+    Abre (y crea si no existe) la base de resultados.
+
+    Parámetros:
+        ruta (str): Archivo SQLite.
+        timeout (float): Segundos de espera cuando otro proceso tiene la base bloqueada.
+
+    Retorna:
+        Connection: Conexión en modo autocommit; las escrituras usan transacciones explícitas.
+    """
+    con = sqlite3.connect(ruta, timeout=timeout, isolation_level=None)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS resultados ("
+        + ", ".join(f"{nombre} {tipo}" for nombre, tipo in CAMPOS)
+        + f", PRIMARY KEY ({', '.join(LLAVE)}))"
+    )
+    existentes = {columna[1] for columna in con.execute("PRAGMA table_info(resultados)")}
+    for nombre, tipo in CAMPOS:
+        if nombre not in existentes:
+            con.execute(f"ALTER TABLE resultados ADD COLUMN {nombre} {tipo}")
+    return con
+
+
+def parametros(trabajo):
+    """
+    Parámetros de un trabajo como JSON canónico (llaves ordenadas), para usarlos en la llave.
+    """
+    valores = {k: trabajo.get(k) for k in PARAMETROS}
+    valores.update({k: trabajo[k] for k in PARAMETROS_OPCIONALES if trabajo.get(k)})
+    return json.dumps(valores, sort_keys=True)
+
+
+def llave(trabajo):
+    """
+    Llave (formulación, solver, benchmark, instancia, parámetros) de un trabajo de runner.
+    """
+    return (trabajo["formulacion"], trabajo["solver"], trabajo["benchmark"], trabajo["instancia"],
+            parametros(trabajo))
+
+
+def _numero(valor, tipo=float):
+    try:
+        return tipo(valor)
+    except (TypeError, ValueError):
+        return None
+
+
+def fila(trabajo, metrics):
+    """
+    Convierte las métricas de runner (columnas de results.csv más los campos extendidos "estado",
+    "gap", "cota", "nodos", "tiempo_parse", "tiempo_build" y "pico_rss_mib") en una fila tipada.
+    El costo verificado (ver verificador.verificar) sólo se guarda si la solución es factible.
+    """
+    return {
+        **dict(zip(LLAVE, llave(trabajo))),
+        "modelo": metrics.get("Modelo"),
+        "num_variables": _numero(metrics.get("Número de Variables"), int),
+        "num_restricciones": _numero(metrics.get("Número de Restricciones"), int),
+        "objetivo": _numero(metrics.get("Valor Función Objetivo")),
+        "costo_verificado": _numero(metrics.get("costo_verificado")) if metrics.get("factible") else None,
+        "cota": _numero(metrics.get("cota")),
+        "gap": _numero(metrics.get("gap")),
+        "nodos": _numero(metrics.get("nodos"), int),
+        "estado": metrics.get("estado"),
+        "tiempo_parse": _numero(metrics.get("tiempo_parse")),
+        "tiempo_build": _numero(metrics.get("tiempo_build")),
+        "tiempo_solve": _numero(metrics.get("Tiempo de Cómputo (s)")),
+        "pico_rss_mib": _numero(metrics.get("pico_rss_mib")),
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def guardar(con, trabajo, metrics):
+    """
+    Guarda (o reemplaza) el resultado de un trabajo en una transacción propia.
+    """
+    registro = fila(trabajo, metrics)
+    nombres = [nombre for nombre, _ in CAMPOS]
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        con.execute(f"INSERT OR REPLACE INTO resultados ({', '.join(nombres)}) "
+                    f"VALUES ({', '.join('?' for _ in nombres)})", [registro[n] for n in nombres])
+    except BaseException:
+        con.execute("ROLLBACK")
+        raise
+    con.execute("COMMIT")
+
+
+def terminados(con):
+    """
+    Llaves de los trabajos ya terminados (todos salvo los de ESTADOS_FALLIDOS).
+    """
+    cursor = con.execute(
+        f"SELECT {', '.join(LLAVE)} FROM resultados WHERE estado IS NULL OR estado NOT IN "
+        f"({', '.join('?' for _ in ESTADOS_FALLIDOS)})", ESTADOS_FALLIDOS)
+    return set(cursor.fetchall())
+
+
+def pendientes(con, trabajos):
+    """
+    Filtra los trabajos de runner.expandir_trabajos que todavía no tienen resultado.
+    """
+    hechos = terminados(con)
+    return [trabajo for trabajo in trabajos if llave(trabajo) not in hechos]
+
+
+def _valor_csv(valor, defecto="N/A"):
+    return defecto if valor is None else valor
+
+
+def exportar_csv(con, ruta_csv):
+    """
+    Escribe todos los resultados en un CSV con las columnas de COLUMNAS_CSV y la codificación de
+    results.csv.
+
+    Retorna:
+        int: Número de filas escritas.
+    """
+    cursor = con.execute(
+        "SELECT modelo, solver, benchmark, instancia, num_variables, num_restricciones, objetivo, estado, "
+        "tiempo_solve FROM resultados ORDER BY fecha, formulacion, solver, benchmark, instancia")
+    total = 0
+    with open(ruta_csv, 'w', newline='', encoding=CSV_ENCODING) as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNAS_CSV)
+        for modelo, solver, benchmark, instancia, variables, restricciones, objetivo, estado, tiempo in cursor:
+            # Los trabajos fallidos llevan su estado en la columna del objetivo, como en runner
+            if objetivo is None and estado in ("ERROR", "TIMEOUT", "OMITIDO"):
+                objetivo = estado
+            writer.writerow([modelo, solver, benchmark, instancia, _valor_csv(variables), _valor_csv(restricciones),
+                             _valor_csv(objetivo), _valor_csv(tiempo)])
+            total += 1
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="comando", required=True)
+    exportar = sub.add_parser("exportar", help="exportar la base a un CSV con el formato de results.csv")
+    exportar.add_argument("db")
+    exportar.add_argument("csv")
+    resumen = sub.add_parser("resumen", help="número de resultados por formulación, solver y estado")
+    resumen.add_argument("db")
+    args = parser.parse_args(argv)
+
+    con = conectar(args.db)
+    try:
+        if args.comando == "exportar":
+            print(f"{exportar_csv(con, args.csv)} filas escritas en {args.csv}")
+        else:
+            for formulacion, solver, estado, total in con.execute(
+                    "SELECT formulacion, solver, estado, COUNT(*) FROM resultados "
+                    "GROUP BY formulacion, solver, estado ORDER BY formulacion, solver, estado"):
+                print(f"{formulacion} | {solver} | {estado} | {total}")
+    finally:
+        con.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,436 @@
+"""
+Ejecutor paralelo de benchmarks.
+
+Expande la grilla (formulación × solver × benchmark × instancia) en trabajos y los ejecuta en
+procesos separados, con un límite de hilos y de tiempo por trabajo. Cada trabajo corre en su propio
+proceso, así que una caída del solver sólo afecta a ese trabajo. Los resultados se guardan en la
+base SQLite de resultados.py a medida que terminan; al reanudar una corrida se omiten los trabajos
+que ya tienen resultado. Con --salida se exporta además el CSV con las columnas de results.csv.
+
+Uso (desde la raíz del repositorio):
+    python runner.py --workers 4 --threads 2 --time-limit 600 --db results.db --salida results.csv
+"""
+import argparse
+import csv
+import fnmatch
+import glob
+import multiprocessing
+import os
+import resource
+import time
+from multiprocessing.connection import wait
+
+from gurobipy import GRB
+
+from arcos import arcos_knn
+from colgen import get_metrics_cg, resumen as resumen_colgen
+from fijacion import fijar, resumen as resumen_fijacion
+from SCF import modelo_scf_cplex, modelo_scf_gurobi
+from mip_start import aplicar_inicio, aplicar_inicio_cplex, aplicar_inicio_gurobi
+from model_cache import CACHE_DIR as CACHE_MODELOS, load_model
+from model import modelo_cda_cplex, modelo_cda_gurobi
+from representacion import construir_modelo_ir
+from resultados import COLUMNAS, COLUMNAS_CSV, CSV_ENCODING, conectar, exportar_csv, guardar, pendientes
+from testParser import parse_file
+from verificador import extraer_vectores, verificar, verificar_modelo
+
+# Instancias por benchmark usadas en el notebook
+INSTANCIAS = {'B1': ['coord20-5-1.dat', 'coord100-5-3b.dat', 'coord200-10-3b.dat'],
+              'B2': ['coordP111112.dat', 'coordP123222.dat', 'coordP133222.dat'],
+              'B3': ['coordChrist50.dat', 'coordDas150.dat', 'coordMin134.dat']}
+
+# Constructores de modelos por formulación y solver
+MODELOS = {'SCF': {'cplex': modelo_scf_cplex, 'gurobi': modelo_scf_gurobi},
+           'CDA': {'cplex': modelo_cda_cplex, 'gurobi': modelo_cda_gurobi}}
+
+# Formulación resuelta por generación de columnas (colgen.py) en vez de un modelo compacto
+COLGEN = 'CG'
+
+
+def directorio_benchmark(benchmark, base="Instances"):
+    """
+    Directorio de instancias de un benchmark ('B1' -> Instances/Benchmark_1).
+    """
+    return os.path.join(base, f"Benchmark_{benchmark.lstrip('B')}")
+
+
+# Nombre de cada código de estado de Gurobi
+ESTADOS_GUROBI = {getattr(GRB.Status, nombre): nombre for nombre in dir(GRB.Status) if nombre.isupper()}
+# Estados de Gurobi en los que ObjBound no está disponible
+ESTADOS_SIN_COTA = (GRB.INFEASIBLE, GRB.INF_OR_UNBD, GRB.UNBOUNDED)
+
+
+def get_metrics_cpx(model_instance, benchmark, instance, threads=None, time_limit=None):
+    """
+    Resuelve un modelo docplex y retorna sus métricas con las columnas de results.csv, más el
+    estado, el gap, la mejor cota y los nodos explorados (llaves "estado", "gap", "cota", "nodos").
+    """
+    if threads is not None:
+        model_instance.parameters.threads = threads
+    if time_limit is not None:
+        model_instance.parameters.timelimit = time_limit
+    start_time = time.time()
+    model_instance.solve()
+    end_time = time.time()
+    detalles = model_instance.solve_details
+    con_solucion = model_instance.solution is not None
+    return {
+        "Modelo": model_instance.name,
+        "Benchmark": benchmark,
+        "Instancia": instance,
+        "Número de Variables": model_instance.number_of_variables,
+        "Número de Restricciones": model_instance.number_of_constraints,
+        "Valor Función Objetivo": model_instance.objective_value if con_solucion else "N/A",
+        "Tiempo de Cómputo (s)": end_time - start_time,
+        "estado": detalles.status if detalles is not None else None,
+        "gap": detalles.mip_relative_gap if detalles is not None and con_solucion else None,
+        "cota": detalles.best_bound if detalles is not None and abs(detalles.best_bound) < 1e20 else None,
+        "nodos": detalles.nb_nodes_processed if detalles is not None else None,
+    }
+
+
+def get_metrics_grb(model_instance, benchmark, instance, threads=None, time_limit=None, callback=None):
+    """
+    Resuelve un modelo Gurobi y retorna sus métricas con las columnas de results.csv, más el
+    estado, el gap, la mejor cota y los nodos explorados (llaves "estado", "gap", "cota", "nodos").
+
+    callback, si se entrega, se pasa a optimize (por ejemplo el de instrumentacion).
+    """
+    if threads is not None:
+        model_instance.Params.Threads = threads
+    if time_limit is not None:
+        model_instance.Params.TimeLimit = time_limit
+    start_time = time.time()
+    model_instance.optimize(callback)
+    end_time = time.time()
+    es_mip = model_instance.IsMIP
+    return {
+        "Modelo": model_instance.getAttr("ModelName"),
+        "Benchmark": benchmark,
+        "Instancia": instance,
+        "Número de Variables": len(model_instance.getVars()),
+        "Número de Restricciones": len(model_instance.getConstrs()),
+        "Valor Función Objetivo": model_instance.objVal if model_instance.SolCount > 0 else "N/A",
+        "Tiempo de Cómputo (s)": end_time - start_time,
+        "estado": ESTADOS_GUROBI.get(model_instance.status, str(model_instance.status)),
+        "gap": model_instance.MIPGap if es_mip and model_instance.SolCount > 0 else None,
+        "cota": model_instance.ObjBound if es_mip and model_instance.status not in ESTADOS_SIN_COTA else None,
+        "nodos": int(model_instance.NodeCount) if es_mip else None,
+    }
+
+
+GET_METRICS = {'cplex': get_metrics_cpx, 'gurobi': get_metrics_grb}
+
+
+def expandir_trabajos(formulaciones, solvers, instancias, threads=None, time_limit=None, base="Instances",
+                      mip_start=None, k_vecinos=None, ir=False, cache_modelos=None, fijacion=False):
+    """
+    Expande la grilla de experimentos en una lista de trabajos.
+
+    Parámetros:
+        formulaciones (list): Formulaciones de MODELOS ('SCF', 'CDA') o COLGEN ('CG'); los
+            trabajos CG ignoran mip_start, k_vecinos, ir, cache_modelos y fijacion.
+        solvers (list): Solvers ('cplex', 'gurobi').
+        instancias (dict): Benchmark -> lista de archivos o patrones glob (por ejemplo '*.dat').
+        threads (int): Hilos del solver por trabajo.
+        time_limit (float): Límite de tiempo del solver por trabajo, en segundos.
+        base (str): Directorio raíz de las instancias.
+        mip_start (str): Método de la heurística constructiva ("savings" o "sweep") cuya solución
+            se carga como MIP start; None para resolver sin inicio.
+        k_vecinos (int): Si se entrega, los modelos se construyen sólo sobre los arcos de los
+            k vecinos más cercanos (ver arcos.arcos_knn); None para usar todos los arcos.
+        ir (bool): Si es True, los modelos se construyen desde la representación intermedia de
+            representacion.py, idéntica para ambos solvers.
+        cache_modelos (str): Directorio del caché de modelos (ver model_cache); None para
+            construir siempre los modelos.
+        fijacion (bool): Si es True, antes de resolver se fijan variables por costo reducido con
+            la cota de la heurística constructiva (ver fijacion.fijar).
+
+    Retorna:
+        list: Trabajos como diccionarios; las instancias inexistentes se omiten con un aviso.
+    """
+    archivos = {}
+    for benchmark, nombres in instancias.items():
+        directorio = directorio_benchmark(benchmark, base)
+        disponibles = sorted(os.path.basename(p) for p in glob.glob(os.path.join(directorio, "*.dat")))
+        archivos[benchmark] = []
+        for nombre in nombres:
+            coincidencias = fnmatch.filter(disponibles, nombre)
+            if not coincidencias:
+                print(f"Aviso: no se encontró {os.path.join(directorio, nombre)}, se omite.")
+            archivos[benchmark].extend(c for c in coincidencias if c not in archivos[benchmark])
+
+    return [
+        {"formulacion": formulacion, "solver": solver, "benchmark": benchmark, "instancia": nombre,
+         "ruta": os.path.join(directorio_benchmark(benchmark, base), nombre),
+         "threads": threads, "time_limit": time_limit, "mip_start": mip_start, "k_vecinos": k_vecinos,
+         "ir": ir, "cache_modelos": cache_modelos, "fijacion": fijacion}
+        for formulacion in formulaciones
+        for solver in solvers
+        for benchmark in archivos
+        for nombre in archivos[benchmark]
+    ]
+
+
+def construir_modelo(trabajo, parsed_data):
+    """
+    Construye el modelo de un trabajo y, si el trabajo lo pide, le carga el MIP start heurístico.
+
+    Con k_vecinos el modelo se restringe a los arcos de arcos.arcos_knn y su nombre lleva el sufijo
+    "-k<k>"; con ir se construye desde representacion.py y lleva el sufijo "_<solver>-ir" (la IR
+    da el mismo nombre en ambos solvers y su entrada del caché es compartida), para distinguir las
+    filas en results.csv. Con cache_modelos el modelo se lee del caché de model_cache si ya
+    fue construido (y se guarda en él si no). Con fijacion se fijan variables por costo reducido
+    antes de cargar el MIP start (ver fijacion.fijar; sufijo "-fix"); las estadísticas quedan en
+    model_instance._fijacion. Si el trabajo trae "incumbente" (valores por nombre de variable de
+    una corrida anterior, ver ejecutar_trabajo) se carga como MIP start en lugar de la heurística.
+    """
+    formulacion, solver = trabajo["formulacion"], trabajo["solver"]
+    if trabajo.get("ir"):
+        constructor = construir_modelo_ir
+        construir = lambda **kwargs: construir_modelo_ir(formulacion, solver, parsed_data, **kwargs)
+        sufijo = f"_{solver}-ir"
+    else:
+        constructor = MODELOS[formulacion][solver]
+        construir = lambda **kwargs: constructor(parsed_data, **kwargs)
+        sufijo = ""
+    if trabajo.get("k_vecinos"):
+        build = lambda: construir(arcos=arcos_knn(parsed_data, trabajo["k_vecinos"]))
+        sufijo += f"-k{trabajo['k_vecinos']}"
+    else:
+        build = construir
+    if trabajo.get("fijacion"):
+        sufijo += "-fix"
+    if trabajo.get("cache_modelos"):
+        model_instance, _ = load_model(trabajo["ruta"], formulacion, solver, constructor, build,
+                                       ir=bool(trabajo.get("ir")), k_vecinos=trabajo.get("k_vecinos"),
+                                       cache_dir=trabajo["cache_modelos"])
+    else:
+        model_instance = build()
+    if sufijo:
+        if solver == 'gurobi':
+            model_instance.ModelName += sufijo
+        else:
+            model_instance.name += sufijo
+    if trabajo.get("fijacion"):
+        fijar(model_instance, formulacion, solver, parsed_data, nombres='gurobi' if trabajo.get("ir") else None)
+    if trabajo.get("incumbente"):
+        if solver == 'gurobi':
+            aplicar_inicio_gurobi(model_instance, trabajo["incumbente"])
+        else:
+            aplicar_inicio_cplex(model_instance, trabajo["incumbente"])
+    elif trabajo.get("mip_start"):
+        aplicar_inicio(model_instance, formulacion, solver, parsed_data, metodo=trabajo["mip_start"],
+                       nombres='gurobi' if trabajo.get("ir") else None)
+    return model_instance
+
+
+def ejecutar_trabajo(trabajo):
+    """
+    Parsea la instancia, construye el modelo, lo resuelve y retorna las métricas del trabajo.
+
+    Además de las métricas del solver agrega el tiempo de parseo y de construcción y el pico de
+    RSS del proceso (llaves "tiempo_parse", "tiempo_build" y "pico_rss_mib"); como cada trabajo
+    corre en un proceso nuevo, el pico corresponde a ese trabajo. La solución se verifica con
+    verificador.verificar_modelo (llaves "factible", "costo_verificado" y "violaciones"). Los
+    trabajos COLGEN se resuelven con colgen.get_metrics_cg (sus estadísticas quedan en "colgen"
+    y la construcción del maestro se cuenta en el tiempo de resolución). Si el trabajo trae
+    "continuable", se agrega "incumbente" con los valores no nulos de la solución por nombre de
+    variable, para retomarla con más tiempo (ver planificador.py).
+    """
+    start_time = time.time()
+    parsed_data = parse_file(trabajo["ruta"])
+    tiempo_parse = time.time() - start_time
+    start_time = time.time()
+    if trabajo["formulacion"] == COLGEN:
+        tiempo_build = 0.0
+        metrics = get_metrics_cg(parsed_data, trabajo["solver"], trabajo["benchmark"], trabajo["instancia"],
+                                 threads=trabajo["threads"], time_limit=trabajo["time_limit"])
+        solucion = metrics.pop("solucion")
+        verificacion = verificar(parsed_data, solucion) if solucion is not None else None
+    else:
+        model_instance = construir_modelo(trabajo, parsed_data)
+        tiempo_build = time.time() - start_time
+        metrics = GET_METRICS[trabajo["solver"]](model_instance, trabajo["benchmark"], trabajo["instancia"],
+                                                 threads=trabajo["threads"], time_limit=trabajo["time_limit"])
+        verificacion = verificar_modelo(model_instance, parsed_data, trabajo["formulacion"], trabajo["solver"],
+                                        'gurobi' if trabajo.get("ir") else None)
+        if trabajo.get("continuable"):
+            nombres, valores = extraer_vectores(model_instance, trabajo["solver"])
+            metrics["incumbente"] = {nombre: float(v) for nombre, v in zip(nombres, valores) if abs(v) > 1e-9}
+    if verificacion is not None:
+        metrics["factible"] = verificacion["factible"]
+        metrics["costo_verificado"] = verificacion["costo"]
+        metrics["violaciones"] = verificacion["violaciones"]
+    if trabajo.get("fijacion") and trabajo["formulacion"] != COLGEN:
+        metrics["fijacion"] = model_instance._fijacion
+    metrics["tiempo_parse"] = tiempo_parse
+    metrics["tiempo_build"] = tiempo_build
+    metrics["pico_rss_mib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return metrics
+
+
+def metricas_fallidas(trabajo, estado, tiempo):
+    """
+    Fila de resultados para un trabajo que terminó sin métricas (error, caída o tiempo agotado).
+    """
+    return {
+        "Modelo": f"{trabajo['formulacion']}_{trabajo['solver']}",
+        "Benchmark": trabajo["benchmark"],
+        "Instancia": trabajo["instancia"],
+        "Número de Variables": "N/A",
+        "Número de Restricciones": "N/A",
+        "Valor Función Objetivo": estado,
+        "Tiempo de Cómputo (s)": tiempo,
+        "estado": estado,
+    }
+
+
+def proceso_trabajo(trabajo, conn):
+    try:
+        conn.send(("ok", ejecutar_trabajo(trabajo)))
+    except Exception as error:
+        conn.send(("error", f"{type(error).__name__}: {error}"))
+    finally:
+        conn.close()
+
+
+def ejecutar_en_paralelo(trabajos, workers, gracia=120.0):
+    """
+    Ejecuta los trabajos en hasta `workers` procesos simultáneos y entrega sus métricas a medida
+    que terminan.
+
+    Cada trabajo corre en un proceso propio. Si el proceso muere sin reportar (por ejemplo, el
+    solver se cae) se registra "ERROR"; si supera su time_limit más `gracia` segundos se termina
+    y se registra "TIMEOUT".
+
+    Retorna:
+        generator: Tuplas (trabajo, métricas) con las columnas de results.csv y los campos
+            extendidos de ejecutar_trabajo.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    pendientes = list(reversed(trabajos))
+    activos = {}
+
+    while pendientes or activos:
+        while pendientes and len(activos) < workers:
+            trabajo = pendientes.pop()
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            proceso = ctx.Process(target=proceso_trabajo, args=(trabajo, send_conn), daemon=True)
+            proceso.start()
+            send_conn.close()
+            activos[recv_conn] = (trabajo, proceso, time.time())
+
+        listos = wait(list(activos), timeout=1.0)
+        for conn in listos:
+            trabajo, proceso, inicio = activos.pop(conn)
+            try:
+                estado, resultado = conn.recv()
+            except EOFError:
+                estado, resultado = "error", f"proceso terminado con código {proceso.exitcode}"
+            conn.close()
+            proceso.join()
+            if estado == "ok":
+                yield trabajo, resultado
+            else:
+                print(f"Error en {trabajo['formulacion']}/{trabajo['solver']}/{trabajo['instancia']}: {resultado}")
+                yield trabajo, metricas_fallidas(trabajo, "ERROR", time.time() - inicio)
+
+        ahora = time.time()
+        for conn, (trabajo, proceso, inicio) in list(activos.items()):
+            if trabajo["time_limit"] is not None and ahora - inicio > trabajo["time_limit"] + gracia:
+                proceso.kill()
+                proceso.join()
+                conn.close()
+                del activos[conn]
+                yield trabajo, metricas_fallidas(trabajo, "TIMEOUT", ahora - inicio)
+
+
+def abrir_csv(ruta):
+    """
+    Abre el CSV de resultados en modo append, escribiendo el encabezado (COLUMNAS_CSV) si el archivo
+    es nuevo. Si ya existe se respetan sus columnas, así que un results.csv anterior, sin la columna
+    "Solver", sigue recibiendo filas consistentes; las columnas que falten se escriben como "N/A".
+    """
+    nuevo = not os.path.exists(ruta) or os.path.getsize(ruta) == 0
+    columnas = COLUMNAS_CSV
+    if not nuevo:
+        with open(ruta, newline='', encoding=CSV_ENCODING) as existente:
+            columnas = next(csv.reader(existente), None) or COLUMNAS_CSV
+    file = open(ruta, 'a', newline='', encoding=CSV_ENCODING)
+    writer = csv.DictWriter(file, fieldnames=columnas, restval="N/A", extrasaction='ignore')
+    if nuevo:
+        writer.writeheader()
+        file.flush()
+    return file, writer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--formulaciones", nargs="+", default=list(MODELOS),
+                        help=f"formulaciones de MODELOS o {COLGEN} (generación de columnas)")
+    parser.add_argument("--solvers", nargs="+", default=["cplex", "gurobi"])
+    parser.add_argument("--benchmarks", nargs="+", default=list(INSTANCIAS))
+    parser.add_argument("--instancias", nargs="+", default=None,
+                        help="archivos o patrones glob dentro de cada benchmark (por defecto los del notebook)")
+    parser.add_argument("--workers", type=int, default=None, help="procesos simultáneos")
+    parser.add_argument("--threads", type=int, default=None, help="hilos del solver por trabajo")
+    parser.add_argument("--time-limit", type=float, default=None, help="límite de tiempo por trabajo (s)")
+    parser.add_argument("--gracia", type=float, default=120.0,
+                        help="segundos extra sobre el límite antes de terminar el proceso")
+    parser.add_argument("--mip-start", choices=["savings", "sweep"], default=None,
+                        help="cargar la solución de la heurística constructiva como MIP start")
+    parser.add_argument("--k-vecinos", type=int, default=None,
+                        help="construir los modelos sólo con los arcos de los k vecinos más cercanos")
+    parser.add_argument("--ir", action="store_true",
+                        help="construir los modelos desde la representación intermedia común a ambos solvers")
+    parser.add_argument("--cache-modelos", nargs="?", const=CACHE_MODELOS, default=None, metavar="DIR",
+                        help="releer los modelos ya construidos desde MPS comprimidos en DIR")
+    parser.add_argument("--fijacion", action="store_true",
+                        help="fijar variables por costo reducido con la cota de la heurística antes de resolver")
+    parser.add_argument("--base", default="Instances", help="directorio raíz de los benchmarks")
+    parser.add_argument("--db", default="results.db", help="base SQLite de resultados")
+    parser.add_argument("--repetir", action="store_true",
+                        help="ejecutar también los trabajos que ya tienen resultado en la base")
+    parser.add_argument("--salida", default=None, help="exportar la base a este CSV al terminar")
+    args = parser.parse_args(argv)
+
+    cpus = os.cpu_count() or 1
+    if args.workers is None and args.threads is None:
+        args.threads = 1
+    if args.workers is None:
+        args.workers = max(1, cpus // args.threads)
+    if args.threads is None:
+        args.threads = max(1, cpus // args.workers)
+
+    instancias = {B: args.instancias or INSTANCIAS.get(B, ["*.dat"]) for B in args.benchmarks}
+    trabajos = expandir_trabajos(args.formulaciones, args.solvers, instancias,
+                                 threads=args.threads, time_limit=args.time_limit, base=args.base,
+                                 mip_start=args.mip_start, k_vecinos=args.k_vecinos, ir=args.ir,
+                                 cache_modelos=args.cache_modelos, fijacion=args.fijacion)
+
+    con = conectar(args.db)
+    try:
+        if not args.repetir:
+            total = len(trabajos)
+            trabajos = pendientes(con, trabajos)
+            if total > len(trabajos):
+                print(f"Se omiten {total - len(trabajos)} trabajos ya terminados en {args.db}")
+        print(f"{len(trabajos)} trabajos, {args.workers} procesos × {args.threads} hilos")
+
+        for trabajo, metrics in ejecutar_en_paralelo(trabajos, args.workers, gracia=args.gracia):
+            print(", ".join(str(metrics[c]) for c in COLUMNAS))
+            if "fijacion" in metrics:
+                print(f"  Fijación: {resumen_fijacion(metrics['fijacion'])}")
+            if "colgen" in metrics:
+                print(f"  Generación de columnas: {resumen_colgen(metrics['colgen'])}")
+            guardar(con, trabajo, metrics)
+
+        if args.salida:
+            print(f"{exportar_csv(con, args.salida)} filas exportadas a {args.salida}")
+    finally:
+        con.close()
+
+
+if __name__ == "__main__":
+    main()
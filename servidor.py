@@ -0,0 +1,226 @@
+"""
+Servidor local de resoluciones con los solvers en caliente.
+
+Cada corrida de un script paga el arranque de Python, la importación de docplex y gurobipy, la
+creación del entorno del solver y la obtención de la licencia antes de parsear la instancia; con
+cientos de trabajos pequeños (20-5, 50-5) ese costo domina. Este servidor se mantiene vivo con:
+    - gurobipy y docplex importados y el entorno por defecto de Gurobi ya creado (la licencia se
+      obtiene una sola vez; los modelos se liberan sin cerrar el entorno),
+    - las instancias ya parseadas en memoria (se releen sólo si el archivo cambia),
+y atiende trabajos por un socket Unix con un servidor asyncio.
+
+Protocolo: una línea JSON por mensaje. Un pedido {"instancia": ruta, "formulacion": "SCF",
+"solver": "gurobi", "parametros": {"time_limit": 60, ...}} recibe {"tipo": "aceptado"}, luego un
+{"tipo": "progreso", "t", "incumbente", "cota"} por cada mejora del incumbente o de la cota y al
+final {"tipo": "resultado", "metricas": {...}} o {"tipo": "error", "mensaje": ...}. Los pedidos
+{"comando": "estado"} y {"comando": "apagar"} consultan y detienen el servidor. Los trabajos se
+resuelven de a uno en el orden de llegada (los solvers ya usan varios hilos).
+
+Uso (desde la raíz del repositorio):
+    python servidor.py [--socket RUTA]
+    python cliente.py Instances/Benchmark_1/coord20-5-1.dat --formulacion CDA --solver gurobi
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from testParser import parse_file
+from verificador import verificar_modelo
+
+# Los solvers (gurobipy, docplex y los módulos que los usan) se importan en calentar y en
+# resolver_pedido, así que cliente.py puede importar este módulo sin pagar su arranque
+
+# Socket por defecto (uno por usuario)
+SOCKET = os.path.join(tempfile.gettempdir(), f"optitarea3-{os.getuid()}.sock")
+
+# Parámetros que acepta un pedido (los de runner.expandir_trabajos)
+PARAMETROS = ("threads", "time_limit", "mip_start", "k_vecinos", "ir", "fijacion")
+
+# Instancias parseadas que se mantienen en memoria
+MAX_INSTANCIAS = 64
+
+_instancias = OrderedDict()  # ruta -> ((mtime, tamaño), parsed_data)
+
+
+def calentar():
+    """
+    Importa y arranca ambos solvers: crea el entorno por defecto de Gurobi (obtiene la licencia) y
+    un modelo vacío de docplex (carga la biblioteca de CPLEX).
+    """
+    import gurobipy as gp
+    from docplex.mp.model import Model as Model_cpx
+
+    gp.Model("calentar").dispose()
+    Model_cpx(name="calentar").end()
+
+
+def instancia(ruta):
+    """
+    Datos parseados de una instancia, desde la memoria del servidor si el archivo no cambió.
+    """
+    ruta = os.path.abspath(ruta)
+    stat = os.stat(ruta)
+    version = (stat.st_mtime_ns, stat.st_size)
+    if ruta in _instancias and _instancias[ruta][0] == version:
+        _instancias.move_to_end(ruta)
+        return _instancias[ruta][1]
+    parsed_data = parse_file(ruta)
+    _instancias[ruta] = (version, parsed_data)
+    if len(_instancias) > MAX_INSTANCIAS:
+        _instancias.popitem(last=False)
+    return parsed_data
+
+
+def resolver_pedido(pedido, al_progreso=None):
+    """
+    Construye y resuelve el modelo de un pedido y retorna sus métricas.
+
+    Parámetros:
+        pedido (dict): Llaves "instancia", "formulacion", "solver" y, opcionalmente,
+            "parametros" (ver PARAMETROS).
+        al_progreso (callable): Se llama con cada punto de la trayectoria de incumbente y cota.
+
+    Retorna:
+        dict: Métricas con las columnas de results.csv, los campos extendidos de runner (estado,
+            gap, cota, nodos), la verificación de la solución y los tiempos por etapa.
+    """
+    from instrumentacion import medir, resolver_instrumentado
+    from runner import GET_METRICS, construir_modelo
+
+    parametros = pedido.get("parametros") or {}
+    desconocidos = set(parametros) - set(PARAMETROS)
+    if desconocidos:
+        raise ValueError(f"Parámetros desconocidos: {', '.join(sorted(desconocidos))}")
+    solver = pedido["solver"]
+    trabajo = {"formulacion": pedido["formulacion"], "solver": solver, "ruta": pedido["instancia"],
+               "benchmark": os.path.basename(os.path.dirname(os.path.abspath(pedido["instancia"]))),
+               "instancia": os.path.basename(pedido["instancia"]), "cache_modelos": None,
+               **{k: parametros.get(k) for k in PARAMETROS}}
+
+    def resolver(model_instance, callback):
+        extra = {"callback": callback} if solver == 'gurobi' else {}
+        return GET_METRICS[solver](model_instance, trabajo["benchmark"], trabajo["instancia"],
+                                   threads=trabajo["threads"], time_limit=trabajo["time_limit"], **extra)
+
+    etapas = {}
+    with medir(etapas, "parse"):
+        parsed_data = instancia(trabajo["ruta"])
+    with medir(etapas, "build"):
+        model_instance = construir_modelo(trabajo, parsed_data)
+    try:
+        if solver == 'gurobi':
+            model_instance.Params.OutputFlag = 0
+        metrics, _ = resolver_instrumentado(model_instance, solver, etapas, resolver, al_progreso=al_progreso)
+        verificacion = verificar_modelo(model_instance, parsed_data, trabajo["formulacion"], solver,
+                                        'gurobi' if trabajo["ir"] else None)
+    finally:
+        # Se libera sólo el modelo (no como pipeline.liberar_modelo): el entorno por defecto de
+        # Gurobi queda abierto para el próximo pedido
+        if solver == 'gurobi':
+            model_instance.dispose()
+        else:
+            model_instance.end()
+    if verificacion is not None:
+        metrics.update(factible=verificacion["factible"], costo_verificado=verificacion["costo"],
+                       violaciones=verificacion["violaciones"])
+    metrics["etapas"] = {etapa: medicion["wall"] for etapa, medicion in etapas.items()}
+    return metrics
+
+
+async def _enviar(writer, mensaje):
+    writer.write((json.dumps(mensaje, ensure_ascii=False, default=str) + "\n").encode())
+    await writer.drain()
+
+
+async def _trabajador(cola, executor):
+    """
+    Resuelve los pedidos de la cola de a uno, en el hilo del solver.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        pedido, salida = await cola.get()
+        emitir = lambda punto: loop.call_soon_threadsafe(salida.put_nowait, {"tipo": "progreso", **punto})
+        try:
+            metrics = await loop.run_in_executor(executor, resolver_pedido, pedido, emitir)
+            salida.put_nowait({"tipo": "resultado", "metricas": metrics})
+        except Exception as error:
+            salida.put_nowait({"tipo": "error", "mensaje": f"{type(error).__name__}: {error}"})
+        finally:
+            cola.task_done()
+
+
+async def servir(ruta_socket=SOCKET):
+    """
+    Atiende pedidos en el socket Unix hasta recibir {"comando": "apagar"}.
+    """
+    cola = asyncio.Queue()
+    detener = asyncio.Event()
+    estado = {"inicio": time.time(), "resueltos": 0}
+
+    async def atender(reader, writer):
+        try:
+            while linea := await reader.readline():
+                try:
+                    pedido = json.loads(linea)
+                except ValueError as error:
+                    await _enviar(writer, {"tipo": "error", "mensaje": f"JSON inválido: {error}"})
+                    continue
+                comando = pedido.get("comando", "resolver")
+                if comando == "estado":
+                    await _enviar(writer, {"tipo": "estado", "pid": os.getpid(), "pendientes": cola.qsize(),
+                                           "resueltos": estado["resueltos"], "instancias": len(_instancias),
+                                           "activo_s": time.time() - estado["inicio"]})
+                elif comando == "apagar":
+                    await _enviar(writer, {"tipo": "apagando"})
+                    detener.set()
+                    break
+                elif comando == "resolver":
+                    salida = asyncio.Queue()
+                    await cola.put((pedido, salida))
+                    await _enviar(writer, {"tipo": "aceptado", "pendientes": cola.qsize()})
+                    while True:
+                        mensaje = await salida.get()
+                        await _enviar(writer, mensaje)
+                        if mensaje["tipo"] != "progreso":
+                            estado["resueltos"] += 1
+                            break
+                else:
+                    await _enviar(writer, {"tipo": "error", "mensaje": f"Comando desconocido: {comando}"})
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            writer.close()
+
+    if os.path.exists(ruta_socket):
+        os.unlink(ruta_socket)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="solver") as executor:
+        tarea = asyncio.create_task(_trabajador(cola, executor))
+        server = await asyncio.start_unix_server(atender, path=ruta_socket)
+        print(f"Servidor escuchando en {ruta_socket} (pid {os.getpid()})")
+        try:
+            async with server:
+                await detener.wait()
+        finally:
+            tarea.cancel()
+            if os.path.exists(ruta_socket):
+                os.unlink(ruta_socket)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", default=SOCKET)
+    args = parser.parse_args(argv)
+
+    start_time = time.time()
+    calentar()
+    print(f"Solvers listos en {time.time() - start_time:.2f} s")
+    asyncio.run(servir(args.socket))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,24 @@
 import math
 
+import numpy as np
+
+
+def parse_file(file_path, as_arrays=False, dtype=np.float64):
+    """
+    Lee un archivo de instancia y retorna un diccionario con los datos.
+
+    Parámetros:
+        file_path (str): Ruta al archivo .dat de la instancia.
+        as_arrays (bool): Si es True, las coordenadas, capacidades, demandas, costos y la matriz de
+            distancias se retornan como arreglos contiguos de NumPy en vez de listas.
+        dtype: Tipo de punto flotante de los arreglos (float64 por defecto, float32 opcional).
+
+    Retorna:
+        dict: Diccionario con los datos parseados.
+    """
+    if as_arrays:
+        return parse_file_arrays(file_path, dtype=dtype)
 
-def parse_file(file_path):
     with open(file_path, 'r') as file:
         lines = [line.strip() for line in file if line.strip()]
 
@@ -35,6 +52,86 @@ def parse_file(file_path):
     }
 
 
+def parse_file_arrays(file_path, dtype=np.float64):
+    """
+    Variante de parse_file que retorna arreglos de NumPy.
+
+    El archivo se tokeniza de una vez y la matriz de distancias se calcula con un solo broadcast
+    sobre las coordenadas de depósitos y clientes (en ese orden, igual que parse_file). Los arreglos
+    soportan el acceso costs[i][j], len() e iteración, por lo que los modelos existentes funcionan
+    sin cambios; to_lists() entrega la vista de listas original si se necesita.
+
+    Parámetros:
+        file_path (str): Ruta al archivo .dat de la instancia.
+        dtype: Tipo de punto flotante de los arreglos (float64 por defecto, float32 opcional).
+
+    Retorna:
+        dict: Diccionario con las mismas llaves que parse_file.
+    """
+    with open(file_path, 'r') as file:
+        tokens = file.read().split()
+
+    num_customers, num_depots = int(tokens[0]), int(tokens[1])
+    n, m = num_customers, num_depots
+    values = np.array(tokens[2:2 + 2 * m + 2 * n + 1 + m + n + m + 1], dtype=np.float64)
+
+    pos = 0
+    points = values[pos:pos + 2 * (m + n)].reshape(m + n, 2)
+    pos += 2 * (m + n)
+    vehicle_capacity = float(values[pos])
+    pos += 1
+    depot_capacities = values[pos:pos + m]
+    pos += m
+    customer_demands = values[pos:pos + n]
+    pos += n
+    depot_opening_costs = values[pos:pos + m]
+    pos += m
+    route_opening_cost = float(values[pos])
+
+    # Matriz de distancias euclidianas en un solo broadcast (depósitos primero, luego clientes)
+    dx = points[:, 0, None] - points[None, :, 0]
+    dy = points[:, 1, None] - points[None, :, 1]
+    np.multiply(dx, dx, out=dx)
+    np.multiply(dy, dy, out=dy)
+    np.add(dx, dy, out=dx)
+    del dy
+    distance_matrix = np.sqrt(dx, out=dx)
+
+    points = np.ascontiguousarray(points, dtype=dtype)
+    return {
+        "num_customers": num_customers,
+        "num_depots": num_depots,
+        "depots": points[:m],
+        "customers": points[m:],
+        "vehicle_capacity": vehicle_capacity,
+        "depot_capacities": np.ascontiguousarray(depot_capacities, dtype=dtype),
+        "customer_demands": np.ascontiguousarray(customer_demands, dtype=dtype),
+        "depot_opening_costs": np.ascontiguousarray(depot_opening_costs, dtype=dtype),
+        "route_opening_cost": route_opening_cost,
+        "distance_matrix": np.ascontiguousarray(distance_matrix, dtype=dtype),
+    }
+
+
+def to_lists(parsed_data):
+    """
+    Vista de compatibilidad: convierte un diccionario de parse_file_arrays al formato de listas.
+
+    Parámetros:
+        parsed_data (dict): Diccionario retornado por parse_file o parse_file_arrays.
+
+    Retorna:
+        dict: Diccionario con listas, tuplas y floats de Python, igual al de parse_file.
+    """
+    data = dict(parsed_data)
+    for key in ("depots", "customers"):
+        if isinstance(data[key], np.ndarray):
+            data[key] = [tuple(p) for p in data[key].tolist()]
+    for key in ("depot_capacities", "customer_demands", "depot_opening_costs", "distance_matrix"):
+        if isinstance(data[key], np.ndarray):
+            data[key] = data[key].tolist()
+    return data
+
+
 if __name__ == "__main__":
     # Ejemplo de uso
     file_path = "Instances/Benchmark_1/coord20-5-1.dat"
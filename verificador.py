@@ -0,0 +1,256 @@
+"""
+Decodificación y verificación de soluciones para todas las formulaciones.
+
+Extrae en bloque los valores de la solución de un modelo de Gurobi o docplex, reconstruye las
+rutas de cada depósito a partir de los arcos x activos y verifica la solución con operaciones
+vectorizadas sobre arreglos de NumPy:
+    - cada cliente se visita exactamente una vez,
+    - la carga de cada ruta no supera vehicle_capacity,
+    - la carga de cada depósito no supera depot_capacities,
+    - las rutas salen de un depósito abierto y vuelven a él (sin subtours ni rutas entre
+      depósitos distintos).
+Además recalcula el costo real desde distance_matrix, independiente del objetivo del modelo (en
+CDA, por ejemplo, la restricción de capacidad del vehículo no acota las rutas individuales, así
+que su objetivo no corresponde necesariamente a rutas factibles).
+
+La verificación trabaja sobre el formato de solución de heuristica.construir_solucion, así que
+sirve igual para soluciones de los modelos, de la heurística constructiva y del ALNS.
+
+Uso (desde la raíz del repositorio):
+    python verificador.py instancia.dat --formulacion SCF --solver gurobi [--time-limit S]
+"""
+import argparse
+
+import numpy as np
+
+# Tolerancia para comparar cargas con capacidades
+TOL = 1e-6
+
+
+def extraer_vectores(model_instance, solver):
+    """
+    Nombres y valores de todas las variables de la solución del modelo, en bloque.
+
+    Retorna:
+        tuple: (lista de nombres, arreglo de valores); ambos vacíos si el modelo no tiene solución.
+    """
+    if solver == 'gurobi':
+        if model_instance.SolCount == 0:
+            return [], np.zeros(0)
+        variables = model_instance.getVars()
+        return (model_instance.getAttr("VarName", variables),
+                np.asarray(model_instance.getAttr("X", variables), dtype=np.float64))
+    solucion = model_instance.solution
+    if solucion is None:
+        return [], np.zeros(0)
+    variables = list(model_instance.iter_variables())
+    return [var.name for var in variables], np.asarray(solucion.get_values(variables), dtype=np.float64)
+
+
+def _activas(nombres, valores, variable, formato):
+    """
+    Índices (arreglo (k, aridad)) de las variables `variable` con valor mayor a 0.5.
+    """
+    prefijo = variable + ("[" if formato == 'gurobi' else "_")
+    activos = np.nonzero(valores > 0.5)[0]
+    if formato == 'gurobi':
+        indices = [nombres[k][len(prefijo):-1].split(",") for k in activos if nombres[k].startswith(prefijo)]
+    else:
+        indices = [nombres[k][len(prefijo):].split("_") for k in activos if nombres[k].startswith(prefijo)]
+    if not indices:
+        return np.zeros((0, 2 if variable == "x" else 1), dtype=np.int64)
+    return np.asarray(indices, dtype=np.int64)
+
+
+def decodificar(parsed_data, formulacion, nombres, valores, formato):
+    """
+    Reconstruye las rutas de cada depósito siguiendo los arcos x activos.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        formulacion (str): "SCF" o "CDA".
+        nombres (list): Nombres de las variables (ver extraer_vectores).
+        valores (ndarray): Valores de las variables.
+        formato (str): Formato de los nombres ("gurobi" o "cplex"); en CDA con nombres de Gurobi
+            los clientes son 0..n-1 y los depósitos n..n+m-1, como en model.py.
+
+    Retorna:
+        tuple: (solución con el formato de heuristica.construir_solucion, lista de violaciones
+            encontradas al decodificar: arcos que no forman rutas, subtours o clientes sin visitar)
+    """
+    n, m = parsed_data["num_customers"], parsed_data["num_depots"]
+    valores = np.asarray(valores, dtype=np.float64)
+    arcos = _activas(nombres, valores, "x", formato)
+    abiertos = _activas(nombres, valores, "y", formato)[:, 0]
+    if formulacion == "CDA" and formato == 'gurobi':
+        # Clientes 0..n-1 y depósitos n..n+m-1 -> numeración de parse_file
+        arcos = np.where(arcos >= n, arcos - n, arcos + m)
+        abiertos = abiertos - n
+    arcos = arcos[arcos[:, 0] != arcos[:, 1]]
+    violaciones = []
+
+    salida = np.bincount(arcos[:, 0], minlength=n + m)
+    entrada = np.bincount(arcos[:, 1], minlength=n + m)
+    for nombre, grado in (("salida", salida), ("entrada", entrada)):
+        malos = np.nonzero(grado[m:] > 1)[0]
+        if malos.size:
+            violaciones.append(f"{malos.size} clientes con grado de {nombre} mayor a 1 (p. ej. {int(malos[0])})")
+
+    sucesor = np.full(n + m, -1, dtype=np.int64)
+    desde_cliente = arcos[:, 0] >= m
+    sucesor[arcos[desde_cliente, 0]] = arcos[desde_cliente, 1]
+    asignacion = np.full(n, -1, dtype=np.int64)
+    rutas = []
+    for d, siguiente in arcos[~desde_cliente].tolist():
+        ruta = []
+        while siguiente >= m and asignacion[siguiente - m] == -1:
+            asignacion[siguiente - m] = d
+            ruta.append(siguiente - m)
+            siguiente = sucesor[siguiente]
+        if siguiente >= m:
+            violaciones.append(f"la ruta del depósito {d} vuelve a visitar al cliente {siguiente - m}")
+        elif siguiente == -1:
+            violaciones.append(f"la ruta del depósito {d} termina en el cliente {ruta[-1]} sin volver")
+        elif siguiente != d:
+            violaciones.append(f"la ruta del depósito {d} termina en el depósito {siguiente}")
+        if ruta:
+            rutas.append((d, ruta))
+
+    sin_ruta = asignacion == -1
+    en_subtour = sin_ruta & (salida[m:] > 0)
+    if en_subtour.any():
+        violaciones.append(f"{int(en_subtour.sum())} clientes en subtours desconectados de los depósitos")
+    if (sin_ruta & ~en_subtour).any():
+        violaciones.append(f"{int((sin_ruta & ~en_subtour).sum())} clientes sin arcos activos")
+
+    depositos = np.union1d(abiertos, [d for d, _ in rutas]).astype(np.int64)
+    solucion = {"depositos": depositos.tolist(), "asignacion": asignacion, "rutas": rutas}
+    return solucion, violaciones
+
+
+def verificar(parsed_data, solucion, tol=TOL):
+    """
+    Verifica una solución y recalcula su costo real.
+
+    Parámetros:
+        parsed_data (dict): Diccionario con los datos parseados.
+        solucion (dict): Solución con las llaves "depositos" y "rutas" (lista de (d, [clientes])).
+        tol (float): Tolerancia para comparar cargas con capacidades.
+
+    Retorna:
+        dict: Llaves "factible", "violaciones" (lista de mensajes), "costo" (apertura de
+            depósitos, apertura de rutas y distancia recorrida), "carga_rutas" y
+            "carga_depositos".
+    """
+    n, m = parsed_data["num_customers"], parsed_data["num_depots"]
+    costs = np.asarray(parsed_data["distance_matrix"], dtype=np.float64)
+    demandas = np.asarray(parsed_data["customer_demands"], dtype=np.float64)
+    capacidades = np.asarray(parsed_data["depot_capacities"], dtype=np.float64)
+    apertura = np.asarray(parsed_data["depot_opening_costs"], dtype=np.float64)
+    depositos = np.asarray(list(solucion["depositos"]), dtype=np.int64)
+    violaciones = []
+
+    rutas = [(d, ruta) for d, ruta in solucion["rutas"] if len(ruta)]
+    depositos_ruta = np.fromiter((d for d, _ in rutas), dtype=np.int64, count=len(rutas))
+    largos = np.fromiter((len(ruta) for _, ruta in rutas), dtype=np.int64, count=len(rutas))
+    clientes = np.concatenate([np.asarray(ruta, dtype=np.int64) for _, ruta in rutas]) if rutas \
+        else np.zeros(0, dtype=np.int64)
+
+    # Cada cliente exactamente una vez
+    visitas = np.bincount(clientes, minlength=n)
+    if visitas.size > n:
+        violaciones.append(f"clientes fuera de rango: {int(clientes.max())}")
+        visitas = visitas[:n]
+    if (visitas == 0).any():
+        violaciones.append(f"{int((visitas == 0).sum())} clientes sin visitar")
+    if (visitas > 1).any():
+        violaciones.append(f"{int((visitas > 1).sum())} clientes visitados más de una vez")
+
+    # Cargas de rutas y depósitos
+    inicios = np.concatenate(([0], np.cumsum(largos)[:-1])) if rutas else np.zeros(0, dtype=np.int64)
+    carga_rutas = np.add.reduceat(demandas[clientes], inicios) if rutas else np.zeros(0)
+    excedidas = carga_rutas > parsed_data["vehicle_capacity"] + tol
+    if excedidas.any():
+        violaciones.append(f"{int(excedidas.sum())} rutas superan vehicle_capacity "
+                           f"(máximo {carga_rutas.max():g} > {parsed_data['vehicle_capacity']:g})")
+    carga_depositos = np.bincount(depositos_ruta, weights=carga_rutas, minlength=m)
+    excedidos = np.nonzero(carga_depositos > capacidades + tol)[0]
+    if excedidos.size:
+        violaciones.append(f"depósitos sobre su capacidad: {excedidos.tolist()}")
+    cerrados = np.setdiff1d(depositos_ruta, depositos)
+    if cerrados.size:
+        violaciones.append(f"rutas desde depósitos cerrados: {cerrados.tolist()}")
+
+    # Costo: secuencia [d, clientes..., d] de todas las rutas, sin los saltos entre rutas
+    if rutas:
+        posiciones = inicios + 2 * np.arange(len(rutas))
+        secuencia = np.empty(clientes.size + 2 * len(rutas), dtype=np.int64)
+        interior = np.ones(secuencia.size, dtype=bool)
+        interior[posiciones] = False
+        interior[posiciones + largos + 1] = False
+        secuencia[posiciones] = depositos_ruta
+        secuencia[posiciones + largos + 1] = depositos_ruta
+        secuencia[interior] = clientes + m
+        tramos = costs[secuencia[:-1], secuencia[1:]]
+        tramos[posiciones[1:] - 1] = 0.0
+        distancia = float(tramos.sum())
+    else:
+        distancia = 0.0
+    costo = (float(apertura[depositos].sum()) + parsed_data["route_opening_cost"] * len(rutas) + distancia)
+
+    return {"factible": not violaciones, "violaciones": violaciones, "costo": costo,
+            "carga_rutas": carga_rutas, "carga_depositos": carga_depositos}
+
+
+def verificar_modelo(model_instance, parsed_data, formulacion, solver, formato=None):
+    """
+    Extrae, decodifica y verifica la solución de un modelo resuelto.
+
+    Parámetros:
+        formato (str): Formato de los nombres de variables ("gurobi" o "cplex"); por defecto el
+            del solver. Los modelos de representacion usan los de Gurobi en ambos solvers.
+
+    Retorna:
+        dict: Resultado de verificar más la llave "solucion"; None si el modelo no tiene solución.
+    """
+    nombres, valores = extraer_vectores(model_instance, solver)
+    if not len(nombres):
+        return None
+    solucion, violaciones = decodificar(parsed_data, formulacion, nombres, valores, formato or solver)
+    resultado = verificar(parsed_data, solucion)
+    resultado["violaciones"] = violaciones + resultado["violaciones"]
+    resultado["factible"] = not resultado["violaciones"]
+    resultado["solucion"] = solucion
+    return resultado
+
+
+def main(argv=None):
+    from runner import GET_METRICS, MODELOS, construir_modelo
+    from testParser import parse_file
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instancia")
+    parser.add_argument("--formulacion", choices=list(MODELOS), default="SCF")
+    parser.add_argument("--solver", choices=["gurobi", "cplex"], default="gurobi")
+    parser.add_argument("--ir", action="store_true")
+    parser.add_argument("--time-limit", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    parsed_data = parse_file(args.instancia)
+    trabajo = {"formulacion": args.formulacion, "solver": args.solver, "ir": args.ir}
+    model_instance = construir_modelo(trabajo, parsed_data)
+    metrics = GET_METRICS[args.solver](model_instance, "", args.instancia, time_limit=args.time_limit)
+    resultado = verificar_modelo(model_instance, parsed_data, args.formulacion, args.solver,
+                                 'gurobi' if args.ir else None)
+    if resultado is None:
+        print("El modelo no tiene solución")
+        return
+    print(f"Objetivo del modelo: {metrics['Valor Función Objetivo']}")
+    print(f"Costo verificado: {resultado['costo']}")
+    print(f"Factible: {resultado['factible']}")
+    for violacion in resultado["violaciones"]:
+        print(f"  - {violacion}")
+
+
+if __name__ == "__main__":
+    main()